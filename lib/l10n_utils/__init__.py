@@ -3,25 +3,59 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import logging
+import os
+from functools import lru_cache
 from os.path import splitext
 
 from django.conf import settings
-from django.http import HttpResponsePermanentRedirect, HttpResponseRedirect
+from django.http import HttpResponse, HttpResponsePermanentRedirect, HttpResponseRedirect
 from django.shortcuts import render as django_render
-from django.template import TemplateDoesNotExist, loader
+from django.template import TemplateDoesNotExist, engines, loader
 from django.utils.translation.trans_real import parse_accept_lang_header
 from django.views.generic import TemplateView
 
 from product_details import product_details
 
 from springfield.base import metrics
-from springfield.base.i18n import normalize_language, split_path_and_normalize_language
-from springfield.settings.base import language_url_map_with_fallbacks
+from springfield.base.i18n import language_url_map, normalize_language, split_path_and_normalize_language
 
 from .fluent import fluent_l10n, ftl_file_is_active, get_active_locales as ftl_active_locales
 
 log = logging.getLogger(__name__)
 
+# Set this attribute on a request to have render() record the page's translations
+# on it (as `discovered_translations`) instead of rendering any template. Used to
+# build the sitemap without the cost of rendering every page.
+DISCOVER_TRANSLATIONS_ATTR = "discover_translations"
+
+
+def find_locale_templates(template_dirs):
+    """Return the names of the templates in ``template_dirs`` that could be
+    locale-specific variants, i.e. with a second extension like ``home.de.html``."""
+    names = set()
+    for template_dir in template_dirs:
+        for root, _dirs, files in os.walk(template_dir):
+            for filename in files:
+                if splitext(splitext(filename)[0])[1]:
+                    names.add(os.path.relpath(os.path.join(root, filename), template_dir).replace(os.sep, "/"))
+
+    return frozenset(names)
+
+
+@lru_cache(maxsize=1)
+def get_locale_template_index():
+    return find_locale_templates(template_dir for engine in engines.all() for template_dir in engine.template_dirs)
+
+
+def locale_template_exists(template_name):
+    """Return False if there's certainly no template called ``template_name``.
+
+    Outside of DEBUG this is looked up in an index built once, so render() doesn't
+    search every template directory for a locale-specific variant that almost
+    never exists. DEBUG leaves it to the template loaders, which see new files.
+    """
+    return settings.DEBUG or template_name in get_locale_template_index()
+
 
 def render_to_string(template_name, context=None, request=None, using=None, ftl_files=None):
     if request:
@@ -162,7 +196,8 @@ def render(request, template, context=None, ftl_files=None, activation_files=Non
                 translations.update(ftl_active_locales(af))
             translations = sorted(translations)  # `sorted` returns a list.
         elif l10n:
-            translations = l10n.active_locales
+            # copy, as the memoized list is shared between requests
+            translations = list(l10n.active_locales)
 
         # if `add_active_locales` is given then add it to the translations for the template
         if "add_active_locales" in context:
@@ -225,12 +260,21 @@ def render(request, template, context=None, ftl_files=None, activation_files=Non
 
         # Look for locale-specific template in app/templates/
         locale_tmpl = f".{locale}".join(splitext(template))
-        try:
-            return django_render(request, locale_tmpl, context, **kwargs)
-        except TemplateDoesNotExist:
-            pass
+        if locale_template_exists(locale_tmpl):
+            try:
+                return _render_or_discover(request, locale_tmpl, context, **kwargs)
+            except TemplateDoesNotExist:
+                pass
 
     # Render originally requested/default template.
+    return _render_or_discover(request, template, context, **kwargs)
+
+
+def _render_or_discover(request, template, context, **kwargs):
+    if getattr(request, DISCOVER_TRANSLATIONS_ATTR, False):
+        request.discovered_translations = list(context["translations"])
+        return HttpResponse()
+
     return django_render(request, template, context, **kwargs)
 
 
@@ -263,7 +307,7 @@ def get_best_translation(translations, accept_languages, strict=False):
     If none found, it returns the first language code for the first available translation.
 
     """
-    lang_map = language_url_map_with_fallbacks()
+    lang_map = language_url_map()
     # translations contains mixed-case items e.g. "en-US" and the keys
     # of `lang_map` are (now) also mixed case.
     valid_lang_map = {k: v for k, v in lang_map.items() if v in translations}
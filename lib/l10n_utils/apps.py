@@ -0,0 +1,18 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class L10nUtilsConfig(AppConfig):
+    name = "lib.l10n_utils"
+
+    def ready(self):
+        # Find the locale-specific templates up front so render() never has to
+        # search for them during a request. DEBUG uses the template loaders instead.
+        if not settings.DEBUG:
+            from lib.l10n_utils import get_locale_template_index
+
+            get_locale_template_index()
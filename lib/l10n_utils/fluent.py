@@ -4,6 +4,7 @@
 
 import json
 import re
+import time
 from functools import wraps
 from hashlib import md5
 
@@ -26,6 +27,7 @@ __all__ = [
     "get_metadata_file_path",
     "has_messages",
     "translate",
+    "view_l10n",
 ]
 cache = caches["fluent"]
 REQUIRED_RE = re.compile(r"^required\b", re.MULTILINE | re.IGNORECASE)
@@ -33,6 +35,34 @@ TERM_RE = re.compile(r"\{\s*-[a-z-]+\s*\}")
 
 
 class FluentL10n(FluentLocalization):
+    # set by `freeze()` once every bundle has been built
+    _frozen_bundles = None
+
+    def _bundles(self):
+        if self._frozen_bundles is None:
+            return super()._bundles()
+
+        return iter(self._frozen_bundles)
+
+    def freeze(self):
+        """Build all bundles and message ID sets up front.
+
+        The upstream bundle iterator is a lazy generator that can't be shared
+        between threads, so this must be called before an instance is cached
+        and handed out to concurrent requests.
+        """
+        # Read before the bundles are built, so that if the resources expire in
+        # between this is the earlier time.
+        self.resources_loaded_at = min(
+            load_fluent_resources(root, locale, self.resource_ids).loaded_at for locale in self.locales for root in settings.FLUENT_PATHS
+        )
+        self._frozen_bundles = tuple(super()._bundles())
+        # prime the cached properties
+        self._message_ids
+        self._localized_message_ids
+        self.required_message_ids
+        return self
+
     def _localized_bundles(self):
         for bundle in self._bundles():
             if bundle.locales[0] == self.locales[0]:
@@ -44,7 +74,7 @@ class FluentL10n(FluentLocalization):
         for bundle in self._bundles():
             messages.update(bundle._messages.keys())
 
-        return list(messages)
+        return frozenset(messages)
 
     @cached_property
     def _localized_message_ids(self):
@@ -52,7 +82,7 @@ class FluentL10n(FluentLocalization):
         for bundle in self._localized_bundles():
             messages.update(bundle._messages.keys())
 
-        return list(messages)
+        return frozenset(messages)
 
     @cached_property
     def required_message_ids(self):
@@ -79,9 +109,10 @@ class FluentL10n(FluentLocalization):
     def has_required_messages(self):
         return all(self.has_message(m) for m in self.required_message_ids)
 
-    @cached_property
+    @property
     def active_locales(self):
-        # first resource is the one to check for activation
+        # first resource is the one to check for activation.
+        # not cached on the instance as `get_active_locales` is already memoized.
         return get_active_locales(self.resource_ids[0])
 
     @cached_property
@@ -99,6 +130,14 @@ class FluentL10n(FluentLocalization):
         return message_id in self._localized_message_ids
 
 
+class FluentResources(list):
+    """The resources of one locale in one root, and the time they were loaded."""
+
+    def __init__(self, resources=()):
+        super().__init__(resources)
+        self.loaded_at = time.time()
+
+
 class FluentResourceLoader:
     """A resource loader that will add english brand terms to every bundle"""
 
@@ -131,24 +170,34 @@ def memoize(f):
     return inner
 
 
+def view_l10n(ftl_files=None, locale=None):
+    """Return the shared `FluentL10n` for ``ftl_files`` plus the default files,
+    in ``locale`` (the active language by default) with an "en" fallback.
+
+    Views that look up several strings should get this once and pass it to
+    `translate` rather than calling `ftl` for each one.
+    """
+    ftl_files = ftl_files or []
+    if isinstance(ftl_files, str):
+        ftl_files = [ftl_files]
+    elif isinstance(ftl_files, tuple):
+        ftl_files = list(ftl_files)
+
+    # can not use += here because that mutates the original list
+    ftl_files = ftl_files + settings.FLUENT_DEFAULT_FILES
+    locale = locale or translation.get_language()
+    locales = [locale]
+    if locale != "en":
+        locales.append("en")
+    return fluent_l10n(locales, ftl_files)
+
+
 def l10nize(f):
     """Decorator to create and pass in the l10n object"""
 
     @wraps(f)
     def inner(*args, **kwargs):
-        ftl_files = kwargs.get("ftl_files", [])
-        if isinstance(ftl_files, str):
-            ftl_files = [ftl_files]
-        elif isinstance(ftl_files, tuple):
-            ftl_files = list(ftl_files)
-
-        # can not use += here because that mutates the original list
-        ftl_files = ftl_files + settings.FLUENT_DEFAULT_FILES
-        locale = kwargs.get("locale") or translation.get_language()
-        locales = [locale]
-        if locale != "en":
-            locales.append("en")
-        l10n = fluent_l10n(locales, ftl_files)
+        l10n = view_l10n(kwargs.get("ftl_files"), kwargs.get("locale"))
         return f(l10n, *args, **kwargs)
 
     return inner
@@ -156,7 +205,7 @@ def l10nize(f):
 
 @memoize
 def load_fluent_resources(root, locale, resource_ids):
-    resources = []
+    resources = FluentResources()
     for resource_id in resource_ids:
         path = root.joinpath(locale, resource_id)
         if not path.is_file():
@@ -234,12 +283,32 @@ def ftl_file_is_active(ftl_file, locale=None):
 
 
 def fluent_l10n(locales, files):
+    """Return a fully built `FluentL10n` for the given locales and files.
+
+    Instances are shared between requests, and threads, via the `fluent` cache.
+    They expire when the cached resources they were built from do, so they never
+    serve strings older than a newly built instance would. Their locales and files
+    are stored as tuples and their bundles are built up front, so nothing on them
+    changes once cached. Treat them as read-only.
+    """
     if isinstance(locales, str):
         locales = [locales]
 
     # file IDs may not have file extension
-    files = [f"{f}.ftl" if not f.endswith(".ftl") else f for f in files]
-    return FluentL10n(locales, files, FluentResourceLoader)
+    files = tuple(f"{f}.ftl" if not f.endswith(".ftl") else f for f in files)
+    locales = tuple(locales)
+    # FLUENT_PATHS is part of the key so that bundles built from different
+    # roots (e.g. in tests) are never mixed up.
+    key = _cache_key("fluent_l10n", locales, files, tuple(settings.FLUENT_PATHS))
+    l10n = cache.get(key)
+    if l10n is None:
+        l10n = FluentL10n(locales, files, FluentResourceLoader).freeze()
+        timeout = cache.default_timeout
+        if timeout is not None:
+            timeout = l10n.resources_loaded_at + timeout - time.time()
+        cache.set(key, l10n, timeout)
+
+    return l10n
 
 
 def ftl_has_messages(l10n, *message_ids, require_all=True):
@@ -2,12 +2,14 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+from functools import lru_cache
+
 import jinja2
 from django_jinja import library
 from markupsafe import Markup
 
 from lib.l10n_utils import fluent
-from springfield.base.sanitization import sanitize_html
+from springfield.base.sanitization import register_policy, sanitize
 
 TAGS_ALLOWED_IN_FLUENT_STRINGS = {
     "a",
@@ -36,6 +38,23 @@ ATTRS_ALLOWED_IN_FLUENT_STRINGS = {
         "href",
     ],
 }
+SANITIZATION_POLICY = "fluent-strings"
+register_policy(SANITIZATION_POLICY, TAGS_ALLOWED_IN_FLUENT_STRINGS, ATTRS_ALLOWED_IN_FLUENT_STRINGS)
+
+# Distinct formatted strings kept by sanitize_fluent_string(). Pages use a few
+# hundred each, so this covers the busy pages in every locale.
+SANITIZED_STRING_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=SANITIZED_STRING_CACHE_SIZE)
+def sanitize_fluent_string(localised_string):
+    """Return ``localised_string`` with any disallowed HTML sanitised.
+
+    The result depends only on the formatted string, so it is cached by that:
+    the locale, the loaded resources and the message arguments are all part of
+    it already, and an updated translation is simply a new entry.
+    """
+    return sanitize(localised_string, SANITIZATION_POLICY)
 
 
 @library.global_function
@@ -61,13 +80,7 @@ def ftl(ctx, message_id, fallback=None, locale=None, **kwargs):
         l10n = ctx["fluent_l10n"]
         localised_string = fluent.translate(l10n, message_id, fallback, **kwargs)
 
-    sanitized_string = sanitize_html(
-        localised_string,
-        allowed_tags=TAGS_ALLOWED_IN_FLUENT_STRINGS,
-        allowed_attributes=ATTRS_ALLOWED_IN_FLUENT_STRINGS,
-    )
-
-    return Markup(sanitized_string)
+    return Markup(sanitize_fluent_string(localised_string))
 
 
 @library.global_function
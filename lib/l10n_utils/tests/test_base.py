@@ -386,7 +386,7 @@ def test_render_does_not_redirect_when_content_locale_differs_from_url_locale(re
 )
 @patch.object(
     l10n_utils,
-    "language_url_map_with_fallbacks",
+    "language_url_map",
     Mock(return_value={"an": "an", "de": "de", "en": "en-US", "en-us": "en-US", "fr": "fr"}),
 )
 def test_get_best_translation(translations, accept_languages, expected):
@@ -417,7 +417,7 @@ def test_get_best_translation(translations, accept_languages, expected):
 )
 @patch.object(
     l10n_utils,
-    "language_url_map_with_fallbacks",
+    "language_url_map",
     Mock(return_value={"an": "an", "de": "de", "en": "en-US", "en-us": "en-US", "fr": "fr"}),
 )
 def test_get_best_translation__strict(translations, accept_languages, expected):
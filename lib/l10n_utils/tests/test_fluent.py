@@ -2,6 +2,7 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
@@ -57,6 +58,58 @@ class TestFluentL10n(TestCase):
         l10n = get_l10n(["fr", "en"])
         assert not l10n.has_required_messages
 
+    def test_instances_are_shared(self):
+        l10n = get_l10n()
+        assert get_l10n() is l10n
+        assert get_l10n(["fr", "en"]) is not l10n
+        assert get_l10n(ftl_files=["firefox/fluent"]) is not l10n
+        # bundles are built up front so nothing is left to construct per request
+        assert len(l10n._frozen_bundles) == 2
+        assert "_localized_message_ids" in l10n.__dict__
+
+    def test_locales_are_immutable(self):
+        locales = ["de", "en"]
+        l10n = get_l10n(locales)
+        locales.append("fr")
+        assert l10n.locales == ("de", "en")
+        assert l10n.resource_ids == ("firefox/fluent.ftl", "brands.ftl")
+
+    def test_shared_instance_across_threads(self):
+        l10n = get_l10n()
+        expected = [l10n.format_value("fluent-title"), l10n.format_value("brand-new-string")]
+
+        def format_values(_):
+            # each thread gets the same shared instance
+            assert get_l10n() is l10n
+            return [l10n.format_value("fluent-title"), l10n.format_value("brand-new-string")]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(format_values, range(200)))
+
+        assert expected == ["Title in German", "New string not yet available in all languages"]
+        assert all(result == expected for result in results)
+
+    def test_cache_clear_rebuilds(self):
+        l10n = get_l10n()
+        fluent.cache.clear()
+        assert get_l10n() is not l10n
+
+    def test_expires_with_its_resources(self):
+        fluent.cache.clear()
+        with patch.object(fluent.time, "time", return_value=1000):
+            get_l10n(["de"])
+        # built partly from the German resources, 100 seconds before they expire
+        with patch.object(fluent.time, "time", return_value=1000 + fluent.cache.default_timeout - 100):
+            l10n = get_l10n()
+
+        with patch.object(fluent.time, "time", return_value=1000 + fluent.cache.default_timeout + 1):
+            assert get_l10n() is not l10n
+
+    def test_fluent_paths_in_key(self):
+        l10n = get_l10n()
+        with override_settings(FLUENT_PATHS=[L10N_PATH, settings.FLUENT_LOCAL_PATH]):
+            assert get_l10n() is not l10n
+
 
 @override_settings(FLUENT_PATHS=[L10N_PATH], FLUENT_LOCAL_PATH=L10N_PATH)
 class TestFluentTranslationUtils(TestCase):
@@ -145,6 +198,15 @@ class TestFluentViewTranslationUtils(TestCase):
         ftl_files = ("firefox/fluent",)
         assert fluent.ftl("fluent-title", locale="de", ftl_files=ftl_files) == "Title in German"
 
+    def test_view_l10n(self):
+        translation.activate("fr")
+        l10n = fluent.view_l10n("firefox/fluent")
+        assert l10n.locales == ("fr", "en")
+        # the same shared instance that `ftl` uses
+        assert fluent.view_l10n(["firefox/fluent"], locale="fr") is l10n
+        assert fluent.view_l10n("firefox/fluent", locale="de") is not l10n
+        assert fluent.translate(l10n, "fluent-title") == fluent.ftl("fluent-title", ftl_files="firefox/fluent") == "Title in French"
+
     @override_settings(FLUENT_DEFAULT_FILES=["firefox/fluent"])
     def test_ftl_view_util_default_files(self):
         """Should use default FTL files"""
@@ -3,6 +3,7 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import ANY, patch
 
 from django.template import TemplateDoesNotExist
@@ -10,7 +11,7 @@ from django.test import RequestFactory, override_settings
 
 from django_jinja.backend import Jinja2
 
-from lib.l10n_utils import render, render_to_string
+from lib.l10n_utils import find_locale_templates, render, render_to_string
 from springfield.base.tests import TestCase
 
 ROOT_PATH = Path(__file__).with_name("test_files")
@@ -48,23 +49,25 @@ class TestFtlTemplateHelper(TestCase):
 
 
 @patch.object(jinja_env.loader, "searchpath", TEMPLATE_DIRS)
+@patch("lib.l10n_utils.get_locale_template_index", return_value=frozenset(["firefox/download.en-US.html", "firefox/download.es-ES.html"]))
 @patch("lib.l10n_utils.django_render")
 class TestLocaleTemplates(TestCase):
     def setUp(self):
         self.rf = RequestFactory()
 
-    def test_enUS_render(self, django_render):
+    def test_enUS_render(self, django_render, template_index):
         """
         en-US requests without l10n or locale template should render the
         originally requested template.
         """
-        django_render.side_effect = [TemplateDoesNotExist(""), True]
+        template_index.return_value = frozenset()
+        django_render.side_effect = [True]
         request = self.rf.get("/en-US/")
         request.locale = "en-US"
         render(request, "firefox/download.html", {"active_locales": ["en-US"]})
-        django_render.assert_called_with(request, "firefox/download.html", ANY)
+        django_render.assert_called_once_with(request, "firefox/download.html", ANY)
 
-    def test_springfield_enUS_render(self, django_render):
+    def test_springfield_enUS_render(self, django_render, template_index):
         """
         en-US requests with a locale-specific template should render the
         locale-specific template.
@@ -75,18 +78,32 @@ class TestLocaleTemplates(TestCase):
         render(request, "firefox/download.html", {"active_locales": ["en-US"]})
         django_render.assert_called_with(request, "firefox/download.en-US.html", ANY)
 
-    def test_default_render(self, django_render):
+    def test_default_render(self, django_render, template_index):
         """
         Non en-US requests without l10n or locale template should render the
-        originally requested template.
+        originally requested template, without looking for the locale template.
+        """
+        django_render.side_effect = [True]
+        request = self.rf.get("/de/")
+        request.locale = "de"
+        render(request, "firefox/download.html", {"active_locales": ["de"]})
+        django_render.assert_called_once_with(request, "firefox/download.html", ANY)
+
+    @override_settings(DEBUG=True)
+    def test_debug_render_looks_for_locale_template(self, django_render, template_index):
+        """
+        In DEBUG, the template loaders are asked for the locale template,
+        so new ones are found without a restart.
         """
         django_render.side_effect = [TemplateDoesNotExist(""), True]
         request = self.rf.get("/de/")
         request.locale = "de"
         render(request, "firefox/download.html", {"active_locales": ["de"]})
+        django_render.assert_any_call(request, "firefox/download.de.html", ANY)
         django_render.assert_called_with(request, "firefox/download.html", ANY)
+        template_index.assert_not_called()
 
-    def test_springfield_locale_render(self, django_render):
+    def test_springfield_locale_render(self, django_render, template_index):
         """
         Non en-US requests with a locale-specific template should render the
         locale-specific template.
@@ -96,3 +113,14 @@ class TestLocaleTemplates(TestCase):
         request.locale = "es-ES"
         render(request, "firefox/download.html", {"active_locales": ["es-ES"]})
         django_render.assert_called_with(request, "firefox/download.es-ES.html", ANY)
+
+
+class TestFindLocaleTemplates(TestCase):
+    def test_finds_templates_with_a_locale_extension(self):
+        with TemporaryDirectory() as template_dir:
+            for name in ["home.html", "home.de.html", "firefox/download.html", "firefox/download.es-ES.html", "firefox/README"]:
+                path = Path(template_dir, name)
+                path.parent.mkdir(exist_ok=True)
+                path.touch()
+
+            assert find_locale_templates([ROOT_PATH.joinpath("templates"), template_dir]) == {"home.de.html", "firefox/download.es-ES.html"}
@@ -13,7 +13,9 @@ from lib.l10n_utils.templatetags.fluent import (
     ATTRS_ALLOWED_IN_FLUENT_STRINGS,
     TAGS_ALLOWED_IN_FLUENT_STRINGS,
     ftl,
+    sanitize_fluent_string,
 )
+from springfield.base.sanitization import sanitize
 
 
 @pytest.mark.parametrize(
@@ -58,6 +60,23 @@ def test_ftl_bleaches_string(mock_ftl, mock_translate, mock_return_value, expect
     assert ftl(dummy_ctx, "dummy") == expected
 
 
+@patch("lib.l10n_utils.templatetags.fluent.sanitize", wraps=sanitize)
+@patch("lib.l10n_utils.templatetags.fluent.fluent.translate")
+def test_ftl_sanitizes_each_string_once(mock_translate, mock_sanitize):
+    sanitize_fluent_string.cache_clear()
+    dummy_ctx = {"fluent_l10n": "dummy_fluent_l10n_in_ctx"}
+    mock_translate.return_value = "sneaky <script>alert('pwned');</script>"
+
+    assert ftl(dummy_ctx, "dummy") == "sneaky "
+    assert ftl(dummy_ctx, "dummy") == "sneaky "
+    assert mock_sanitize.call_count == 1
+
+    # different arguments or translations format to a different string
+    mock_translate.return_value = "<em>changed</em> <b onclick='x()'>string</b>"
+    assert ftl(dummy_ctx, "dummy") == "<em>changed</em> <b>string</b>"
+    assert mock_sanitize.call_count == 2
+
+
 def test_ftl_bleach_allowlists_are_comprehensive():
     """This is a canary test to confirm our bleach() settings for
     calls to the ftl() helper are appropriate for the content we expect.
@@ -12,6 +12,9 @@ Usage:
     3. python profiling/hit_popular_pages.py
     3. View results at http://localhost:8000/silk/
 
+For latency percentiles, query counts and allocations per path without a
+runserver, and to compare two commits, see load_test.py.
+
 """
 
 import sys
@@ -0,0 +1,312 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Replay the popular pages from hit_popular_pages.py in-process through the WSGI
+app, and report latency percentiles, database queries and memory allocated per
+path, so that results from two commits can be compared.
+
+Each path is requested with a mix of Accept-Language and User-Agent headers.
+Latency comes from the timed rounds, which run with --concurrency threads.
+Queries and allocations come from one extra request per path made on its own,
+because tracemalloc can't tell concurrent requests apart.
+
+Usage:
+
+    python profiling/load_test.py [--rounds 20] [--concurrency 4] [--output before.json]
+
+    # then, on another commit
+    python profiling/load_test.py --output after.json --compare before.json
+
+    # or compare two saved runs without making any requests
+    python profiling/load_test.py --compare before.json after.json
+
+The process exits with status 1 if --fail-threshold is given and any path's p95
+latency, query count or allocations grew by more than that percentage.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+
+ROOT_PATH = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_PATH))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "springfield.settings")
+
+from hit_popular_pages import paths as popular_paths  # noqa: E402
+
+ACCEPT_LANGUAGES = [
+    "en-US,en;q=0.9",
+    "de-DE,de;q=0.9,en;q=0.5",
+    "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
+    "pt-BR,pt;q=0.9",
+    "es-419,es;q=0.9",
+    "zh-TW,zh;q=0.9",
+    "ja",
+    "",
+]
+
+USER_AGENTS = [
+    # Firefox on Windows, macOS, Linux and Android
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:140.0) Gecko/20100101 Firefox/140.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:140.0) Gecko/20100101 Firefox/140.0",
+    "Mozilla/5.0 (X11; Linux x86_64; rv:140.0) Gecko/20100101 Firefox/140.0",
+    "Mozilla/5.0 (Android 14; Mobile; rv:140.0) Gecko/140.0 Firefox/140.0",
+    # Chrome on Windows and Safari on iOS
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 18_5 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.5 Mobile/15E148 Safari/604.1",
+    # crawlers
+    "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)",
+]
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "queries", "alloc_kib")
+
+
+def make_environ(path, host, accept_language, user_agent):
+    path_info, _, query_string = path.partition("?")
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "SCRIPT_NAME": "",
+        "PATH_INFO": path_info,
+        "QUERY_STRING": query_string,
+        "SERVER_NAME": host,
+        "SERVER_PORT": "443",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": host,
+        "HTTP_USER_AGENT": user_agent,
+        "REMOTE_ADDR": "127.0.0.1",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": "https",
+        "wsgi.input": BytesIO(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    if accept_language:
+        environ["HTTP_ACCEPT_LANGUAGE"] = accept_language
+
+    return environ
+
+
+class Replayer:
+    """Make requests straight to the WSGI application, counting the database
+    queries each one makes in the thread that makes it."""
+
+    def __init__(self, application, host):
+        self.application = application
+        self.host = host
+
+    def request(self, path, accept_language="", user_agent=USER_AGENTS[0]):
+        from django.db import connection
+
+        status = []
+        queries = 0
+
+        def count_queries(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        def start_response(response_status, headers, exc_info=None):
+            status.append(int(response_status.split(" ", 1)[0]))
+
+        environ = make_environ(path, self.host, accept_language, user_agent)
+        start = time.perf_counter()
+        with connection.execute_wrapper(count_queries):
+            response = self.application(environ, start_response)
+            try:
+                for _ in response:
+                    pass
+            finally:
+                if hasattr(response, "close"):
+                    response.close()
+        elapsed = time.perf_counter() - start
+
+        return status[0], elapsed, queries
+
+
+def header_mix(rounds, seed):
+    """Return ``rounds`` (accept_language, user_agent) pairs, the same for every run."""
+    rng = random.Random(seed)
+    return [(rng.choice(ACCEPT_LANGUAGES), rng.choice(USER_AGENTS)) for _ in range(rounds)]
+
+
+def percentiles(timings):
+    if len(timings) < 2:
+        return dict.fromkeys(("p50_ms", "p95_ms", "p99_ms"), timings[0] * 1000)
+
+    cut_points = statistics.quantiles(timings, n=100, method="inclusive")
+    return {
+        "p50_ms": cut_points[49] * 1000,
+        "p95_ms": cut_points[94] * 1000,
+        "p99_ms": cut_points[98] * 1000,
+    }
+
+
+def profile_request(replayer, path):
+    """Return the queries and KiB allocated (tracemalloc peak) for one request to ``path``."""
+    tracemalloc.start()
+    try:
+        _status, _elapsed, queries = replayer.request(path)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return queries, peak / 1024
+
+
+def run(replayer, paths, rounds, concurrency, seed):
+    headers = header_mix(rounds, seed)
+    jobs = [(path, accept_language, user_agent) for path in paths for accept_language, user_agent in headers]
+    random.Random(seed).shuffle(jobs)
+
+    # warm up every path once, so the timings are for a warm worker
+    for path in paths:
+        replayer.request(path)
+
+    timings = defaultdict(list)
+    statuses = defaultdict(set)
+    lock = threading.Lock()
+
+    def replay(job):
+        path, accept_language, user_agent = job
+        status, elapsed, _queries = replayer.request(path, accept_language, user_agent)
+        with lock:
+            timings[path].append(elapsed)
+            statuses[path].add(status)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(replay, jobs))
+    wall_time = time.perf_counter() - start
+
+    results = {}
+    for path in paths:
+        queries, alloc_kib = profile_request(replayer, path)
+        results[path] = {
+            **percentiles(timings[path]),
+            "queries": queries,
+            "alloc_kib": alloc_kib,
+            "statuses": sorted(statuses[path]),
+        }
+
+    return {
+        "commit": git_commit(),
+        "rounds": rounds,
+        "concurrency": concurrency,
+        "requests": len(jobs),
+        "requests_per_second": len(jobs) / wall_time,
+        "paths": results,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=ROOT_PATH, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_results(results):
+    print(f"{results['commit']}: {results['requests']} requests, concurrency {results['concurrency']}, {results['requests_per_second']:.1f} req/s")
+    print(f"{'path':<70} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} {'alloc KiB':>10}  status")
+    for path, row in results["paths"].items():
+        statuses = ",".join(str(status) for status in row["statuses"])
+        latency = f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f}"
+        print(f"{path:<70} {latency} {row['queries']:>8} {row['alloc_kib']:>10.1f}  {statuses}")
+
+
+def percent_change(before, after):
+    if before == after:
+        return 0.0
+    if not before:
+        return float("inf")
+    return (after - before) / before * 100
+
+
+def compare(before, after, threshold=None):
+    """Print the change in each metric for the paths in both runs, and return the
+    (path, metric, percent change) of any that grew by more than ``threshold``."""
+    print(f"{before['commit']} -> {after['commit']}: {before['requests_per_second']:.1f} -> {after['requests_per_second']:.1f} req/s")
+    print(f"{'path':<70} " + " ".join(f"{metric:>18}" for metric in METRICS))
+
+    regressions = []
+    for path, after_row in after["paths"].items():
+        before_row = before["paths"].get(path)
+        if before_row is None:
+            continue
+
+        cells = []
+        for metric in METRICS:
+            change = percent_change(before_row[metric], after_row[metric])
+            # latency is too noisy to judge from p50 and p99 alone, so only p95 fails a run
+            if threshold is not None and metric in ("p95_ms", "queries", "alloc_kib") and change > threshold:
+                regressions.append((path, metric, change))
+            cells.append(f"{after_row[metric]:>9.1f} ({change:+5.0f}%)")
+        print(f"{path:<70} " + " ".join(cells))
+
+    for path, metric, change in regressions:
+        print(f"REGRESSION: {path} {metric} {change:+.0f}%")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20, help="Number of times to request each path.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Number of threads making requests.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the header mix and request order.")
+    parser.add_argument("--host", default="localhost", help="Host header to send. Must be in ALLOWED_HOSTS.")
+    parser.add_argument("--path", action="append", dest="paths", help="Request this path instead of the popular pages. Can be repeated.")
+    parser.add_argument("--output", type=Path, help="Write the results to this JSON file.")
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        nargs="+",
+        metavar="RESULTS",
+        help="Compare with the results in this JSON file, or compare two files without making any requests.",
+    )
+    parser.add_argument("--fail-threshold", type=float, help="Exit with status 1 if a metric grew by more than this percentage.")
+    args = parser.parse_args()
+
+    if args.compare and len(args.compare) > 2:
+        parser.error("--compare takes one or two results files")
+
+    if args.compare and len(args.compare) == 2:
+        before, after = (json.loads(path.read_text()) for path in args.compare)
+    else:
+        import django
+
+        django.setup()
+
+        from wsgi.app import application
+
+        replayer = Replayer(application, args.host)
+        after = run(replayer, args.paths or popular_paths, args.rounds, args.concurrency, args.seed)
+        print_results(after)
+        if args.output:
+            args.output.write_text(json.dumps(after, indent=2))
+
+        if not args.compare:
+            return
+        before = json.loads(args.compare[0].read_text())
+
+    print()
+    if compare(before, after, args.fail_threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
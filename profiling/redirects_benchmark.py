@@ -0,0 +1,83 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Compare the cost of matching paths against the real redirects registry
+using Django's URLResolver (a linear scan of every regex) and the indexed
+RedirectResolver used by RedirectsMiddleware.
+
+Usage:
+
+    python profiling/redirects_benchmark.py [--rounds 200]
+
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "springfield.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.urls import Resolver404, URLResolver  # noqa: E402
+from django.urls.resolvers import RegexPattern  # noqa: E402
+
+from hit_popular_pages import paths as popular_paths  # noqa: E402
+
+from springfield.redirects.util import RedirectResolver, redirectpatterns  # noqa: E402
+
+# paths that do hit a redirect, plus the sort of thing vulnerability scanners ask for
+extra_paths = [
+    "/en-US/channel/",
+    "/de/browsers/desktop/windows/",
+    "/school/",
+    "/firefox/3.6/releasenotes/",
+    "/fr/mobile/faq/",
+    "/wp-login.php",
+    "/.env",
+    "/en-US/wp-admin/setup-config.php",
+    "/cgi-bin/luci/;stok=/locale",
+    "/en-US/firefox/new/../../etc/passwd",
+]
+
+
+def resolve_all(resolver, paths):
+    matches = []
+    for path in paths:
+        try:
+            matches.append(resolver.resolve(path).func)
+        except Resolver404:
+            matches.append(None)
+
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=200, help="Number of times to resolve the full list of paths.")
+    args = parser.parse_args()
+
+    paths = [path.partition("?")[0] for path in popular_paths] + extra_paths
+    linear = URLResolver(RegexPattern(r"^/"), redirectpatterns)
+    indexed = RedirectResolver(redirectpatterns)
+    # the LRU is what makes repeat visits cheap, so also time the index alone
+    uncached = RedirectResolver(redirectpatterns, cache_size=0)
+
+    if resolve_all(linear, paths) != resolve_all(indexed, paths):
+        sys.exit("RedirectResolver results differ from URLResolver!")
+
+    print(f"{len(redirectpatterns)} redirect patterns, {len(paths)} paths, {args.rounds} rounds")
+    for name, resolver in (("URLResolver", linear), ("RedirectResolver (no cache)", uncached), ("RedirectResolver", indexed)):
+        seconds = timeit.timeit(lambda: resolve_all(resolver, paths), number=args.rounds)
+        per_path = seconds / (args.rounds * len(paths)) * 1_000_000
+        print(f"{name:>28}: {seconds:.3f}s total, {per_path:.2f}µs per path")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Compare how fast the release notes JSON files are read and rendered to HTML
+(Markdown, HTML patching and sanitizing) serially and with a process pool, as
+`update_release_notes --force` does before writing to the database.
+
+Usage:
+
+    python profiling/release_notes_benchmark.py [--path RELEASE_NOTES_PATH] [--workers 4] [--rounds 3]
+
+"""
+
+import argparse
+import os
+import sys
+import time
+from glob import glob
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "springfield.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+
+from springfield.releasenotes.models import render_release_files  # noqa: E402
+
+
+def time_rendering(release_files, workers, rounds):
+    """Return the best of ``rounds`` times to render every file, and the result."""
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        rendered = render_release_files(release_files, workers)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best, rendered
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default=settings.RELEASE_NOTES_PATH, help="A checkout of the release notes repo.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of processes in the pool. Defaults to one per CPU.")
+    parser.add_argument("--rounds", type=int, default=3, help="Number of times to render every release. The fastest is reported.")
+    args = parser.parse_args()
+
+    release_files = sorted(glob(os.path.join(args.path, "releases", "*.json")))
+    if not release_files:
+        sys.exit(f"No release files found in {args.path}/releases/")
+
+    serial_seconds, serial = time_rendering(release_files, 1, args.rounds)
+    pool_seconds, pooled = time_rendering(release_files, args.workers, args.rounds)
+    if pooled != serial:
+        sys.exit("Results rendered by the process pool differ from the serial results!")
+
+    print(f"{len(release_files)} release files, best of {args.rounds} rounds")
+    for name, seconds in (("serial", serial_seconds), (f"{args.workers} workers", pool_seconds)):
+        print(f"{name:>12}: {seconds:.3f}s total, {len(release_files) / seconds:.1f} releases/second")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Time the HTML sanitizer as its callers use it: the Fluent `ftl()` helper,
+release notes `process_markdown()` and the `bleach_tags` filter. Each is timed
+building a new policy per call (as sanitize_html() does) and with the policy
+registered once, for plain text and for text with markup.
+
+Usage:
+
+    python profiling/sanitization_benchmark.py [--number 2000] [--rounds 5]
+
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "springfield.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from lib.l10n_utils.templatetags import fluent  # noqa: E402
+from springfield.base.sanitization import sanitize, sanitize_html, strip_all_tags  # noqa: E402
+from springfield.releasenotes import models as releasenotes  # noqa: E402
+
+SAMPLES = {
+    "plain": "Get the browser that protects what’s important",
+    "markup": 'Read our <a href="https://www.mozilla.org/privacy/firefox/" class="privacy-link">Privacy Notice</a> for <strong>details</strong>.',
+}
+RELEASE_NOTE = (
+    '<p>Fixed a crash when <a href="https://bugzilla.mozilla.org/1234">closing tabs</a> '
+    "with <code>about:config</code> open.</p><ul><li>One</li><li>Two</li></ul>"
+)
+
+
+def cases():
+    """Yield (caller, sample, per-call policy, registered policy) callables."""
+    for sample_name, text in SAMPLES.items():
+        yield (
+            "ftl()",
+            sample_name,
+            lambda text=text: sanitize_html(text, fluent.TAGS_ALLOWED_IN_FLUENT_STRINGS, fluent.ATTRS_ALLOWED_IN_FLUENT_STRINGS),
+            lambda text=text: sanitize(text, fluent.SANITIZATION_POLICY),
+        )
+        yield ("bleach_tags", sample_name, None, lambda text=text: strip_all_tags(text))
+
+    yield (
+        "process_markdown()",
+        "markup",
+        lambda: sanitize_html(RELEASE_NOTE, releasenotes.ALLOWED_TAGS, releasenotes.ALLOWED_ATTRS),
+        lambda: sanitize(RELEASE_NOTE, releasenotes.SANITIZATION_POLICY),
+    )
+
+
+def best_per_call(func, number, rounds):
+    """Return the best of ``rounds`` average times per call, in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=rounds)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000, help="Calls per round.")
+    parser.add_argument("--rounds", type=int, default=5, help="Number of rounds. The fastest is reported.")
+    args = parser.parse_args()
+
+    print(f"{'caller':>20} {'sample':>7} {'per-call policy':>16} {'registered':>11}")
+    for caller, sample_name, per_call, registered in cases():
+        registered_us = best_per_call(registered, args.number, args.rounds)
+        per_call_us = f"{best_per_call(per_call, args.number, args.rounds):.1f}µs" if per_call else "-"
+        print(f"{caller:>20} {sample_name:>7} {per_call_us:>16} {registered_us:>10.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,36 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import re
+from functools import lru_cache
 
 import django.urls
 from django.conf import settings
+from django.conf.locale import LANG_INFO
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.text import capfirst
-from django.utils.translation.trans_real import parse_accept_lang_header
+from django.utils.translation.trans_real import (
+    LANGUAGE_CODE_MAX_LENGTH,
+    language_code_prefix_re,
+    language_code_re,
+    parse_accept_lang_header,
+)
 
 from lib.l10n_utils import translation
 
+# settings the cached language tables below are derived from
+LANGUAGE_TABLE_SETTINGS = {
+    "DEV",
+    "DEV_LANGUAGES",
+    "LANGUAGE_CODE",
+    "LANGUAGES",
+    "LANGUAGE_URL_MAP_WITH_FALLBACKS",
+    "PROD_LANGUAGES",
+}
+# both caches are keyed on client-provided values so must be bounded
+NORMALIZE_LANGUAGE_CACHE_SIZE = 2000
+ACCEPT_LANGUAGE_CACHE_SIZE = 1000
+
 
 class LocalePrefixPattern(django.urls.LocalePrefixPattern):
     """
@@ -55,6 +77,38 @@ def springfield_i18n_patterns(*urls, prefix_default_language=True):
     ]
 
 
+@lru_cache(maxsize=1)
+def language_url_map():
+    """
+    Return a snapshot of `settings.LANGUAGE_URL_MAP_WITH_FALLBACKS`.
+
+    The setting is lazy and rebuilds the dict every time it is accessed,
+    so use this wherever it is read per request. Do not mutate the result.
+    """
+    return dict(settings.LANGUAGE_URL_MAP_WITH_FALLBACKS)
+
+
+@lru_cache(maxsize=1)
+def normalized_language_table():
+    """
+    Return a dict of language code -> normalized language code covering every
+    supported code both as-is and lowercased (as Django's translation returns them).
+    """
+    lang_map = language_url_map()
+    table = dict(lang_map)
+    for lang_code in lang_map:
+        lowered = lang_code.lower()
+        if lowered not in table:
+            table[lowered] = _normalize_language(lowered)
+
+    return table
+
+
+@lru_cache(maxsize=1)
+def springfield_language_codes():
+    return frozenset(lang_code for lang_code, _name in settings.LANGUAGES)
+
+
 def normalize_language(language):
     """
     Given a language code, returns the language code supported by Springfield
@@ -70,10 +124,19 @@ def normalize_language(language):
     if not language:
         return None
 
+    try:
+        return normalized_language_table()[language]
+    except KeyError:
+        return _normalize_language(language)
+
+
+@lru_cache(maxsize=NORMALIZE_LANGUAGE_CACHE_SIZE)
+def _normalize_language(language):
+    lang_map = language_url_map()
     lang_code = language
 
-    if lang_code in settings.LANGUAGE_URL_MAP_WITH_FALLBACKS:
-        return settings.LANGUAGE_URL_MAP_WITH_FALLBACKS[lang_code]
+    if lang_code in lang_map:
+        return lang_map[lang_code]
 
     # Reformat the lang code to be mixed-case, as we expect
     # them to be for our lookup
@@ -103,10 +166,10 @@ def normalize_language(language):
         lang_code = lang
 
     try:
-        return settings.LANGUAGE_URL_MAP_WITH_FALLBACKS[lang_code]
+        return lang_map[lang_code]
     except KeyError:
         pre = lang_code.split("-")[0]
-        return settings.LANGUAGE_URL_MAP_WITH_FALLBACKS.get(pre)
+        return lang_map.get(pre)
 
 
 def split_path_and_normalize_language(path_):
@@ -151,6 +214,7 @@ def get_language_from_headers(request):
     return settings.LANGUAGE_CODE
 
 
+@lru_cache(maxsize=ACCEPT_LANGUAGE_CACHE_SIZE)
 def get_best_language(accept_lang):
     """Given an Accept-Language header, return the best-matching language."""
     ranked = parse_accept_lang_header(accept_lang)
@@ -161,7 +225,116 @@ def get_best_language(accept_lang):
 
 
 def check_for_springfield_language(lang_code):
-    return lang_code in [x[0] for x in settings.LANGUAGES]
+    return lang_code in springfield_language_codes()
+
+
+def get_supported_language_variant(lang_code, strict=False):
+    """
+    Springfield's version of Django's `get_supported_language_variant()`.
+
+    Django checks for gettext catalogs via `check_for_language()`, but our
+    translations are Fluent files, so this only checks `settings.LANGUAGES`
+    with `check_for_springfield_language()`. If `strict` is False (the
+    default), a country-specific variant is returned when neither the
+    language code nor its generic variant is supported, e.g. "es" -> "es-AR".
+    Raises `LookupError` if no supported variant is found.
+    """
+    # don't let overly long, client-provided codes into the cache
+    if lang_code and len(lang_code) > LANGUAGE_CODE_MAX_LENGTH:
+        raise LookupError(lang_code)
+
+    return _get_supported_language_variant(lang_code, strict)
+
+
+@lru_cache(maxsize=NORMALIZE_LANGUAGE_CACHE_SIZE)
+def _get_supported_language_variant(lang_code, strict):
+    if lang_code:
+        # If 'zh-hant-tw' is not supported, try special fallback or subsequent
+        # language codes i.e. 'zh-hant' and 'zh'.
+        possible_lang_codes = [lang_code]
+        possible_lang_codes.extend(LANG_INFO.get(lang_code, {}).get("fallback", []))
+        i = None
+        while (i := lang_code.rfind("-", 0, i)) > -1:
+            possible_lang_codes.append(lang_code[:i])
+
+        generic_lang_code = possible_lang_codes[-1]
+
+        for code in possible_lang_codes:
+            if check_for_springfield_language(code):
+                return code
+
+        if not strict:
+            # if fr-FR is not supported, try fr-CA.
+            for supported_code, _name in settings.LANGUAGES:
+                if supported_code.startswith(generic_lang_code + "-"):
+                    return supported_code
+
+    raise LookupError(lang_code)
+
+
+def get_language_from_path(path, strict=False):
+    """Return the supported language code from the prefix of `path`, or None"""
+    regex_match = language_code_prefix_re.match(path)
+    if not regex_match:
+        return None
+
+    try:
+        return get_supported_language_variant(regex_match[1], strict=strict)
+    except LookupError:
+        return None
+
+
+def get_language_from_request(request, check_path=False):
+    """
+    Springfield's version of Django's `get_language_from_request()`, checking
+    the path, language cookie and Accept-Language header in that order.
+    """
+    if check_path:
+        lang_code = get_language_from_path(request.path_info)
+        if lang_code is not None:
+            return lang_code
+
+    lang_code = request.COOKIES.get(settings.LANGUAGE_COOKIE_NAME)
+    try:
+        return get_supported_language_variant(lang_code)
+    except LookupError:
+        pass
+
+    accept = request.headers.get("Accept-Language", "")
+    for accept_lang, _ in parse_accept_lang_header(accept):
+        if accept_lang == "*":
+            break
+
+        if not language_code_re.search(accept_lang):
+            continue
+
+        try:
+            return get_supported_language_variant(accept_lang)
+        except LookupError:
+            continue
+
+    try:
+        return get_supported_language_variant(settings.LANGUAGE_CODE)
+    except LookupError:
+        return settings.LANGUAGE_CODE
+
+
+def clear_language_caches():
+    for cached_func in (
+        language_url_map,
+        normalized_language_table,
+        springfield_language_codes,
+        _normalize_language,
+        get_best_language,
+        _get_supported_language_variant,
+    ):
+        cached_func.cache_clear()
+
+
+@receiver(setting_changed)
+def reset_language_caches(*, setting, **kwargs):
+    if setting in LANGUAGE_TABLE_SETTINGS:
+        clear_language_caches()
 
 
 def remove_lang_prefix(url):
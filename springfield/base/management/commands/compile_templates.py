@@ -0,0 +1,34 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from django_jinja.backend import Jinja2
+from jinja2 import TemplateSyntaxError
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile every Jinja template in the TEMPLATES DIRS into JINJA_BYTECODE_CACHE_PATH, "
+        "so that new workers load them instead of compiling them on their first requests."
+    )
+
+    def handle(self, *args, **options):
+        env = Jinja2.get_default().env
+        if env.bytecode_cache is None:
+            raise CommandError("JINJA_BYTECODE_CACHE_PATH is not set, so there is nowhere to store compiled templates.")
+
+        names = env.list_templates()
+        skipped = 0
+        for name in names:
+            try:
+                env.get_template(name)
+            except (TemplateSyntaxError, UnicodeDecodeError) as e:
+                # The template dirs also hold a few files that aren't Jinja templates,
+                # like Django form widget templates and pattern library docs.
+                skipped += 1
+                self.stderr.write(f"Skipped {name}: {e}")
+
+        self.stdout.write(f"Compiled {len(names) - skipped} of {len(names)} templates into {settings.JINJA_BYTECODE_CACHE_PATH}.")
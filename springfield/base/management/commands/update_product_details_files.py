@@ -2,7 +2,10 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import json
+import os
 from datetime import datetime
+from subprocess import CalledProcessError
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
@@ -43,7 +46,6 @@ class Command(BaseCommand):
         parser.add_argument("-f", "--force", action="store_true", dest="force", default=False, help="Load the data even if nothing new from git.")
 
     def handle(self, *args, **options):
-        # don't really care about deleted files. almost never happens in p-d.
         if not (self.update_file_data() or options["force"]):
             if not options["quiet"]:
                 print("Product Details data was already up to date")
@@ -61,40 +63,84 @@ class Command(BaseCommand):
             # no need to continue if not using DB backend
             return
 
-        self.load_changes(options, self.file_storage.all_json_files())
+        changes = None if options["force"] else self.get_changed_files()
+        if changes is None:
+            self.load_changes(options, self.file_storage.all_json_files())
+        else:
+            self.load_changes(options, *changes)
         self.repo.set_db_latest()
 
         if not options["quiet"]:
             print("Product Details data update is complete")
 
-    def load_changes(self, options, modified_files):
+    def get_changed_files(self):
+        """Return the (modified, removed) JSON file names since the data was last
+        loaded into the database, or None if every file needs loading."""
+        db_latest = self.repo.get_db_latest()
+        if db_latest is None:
+            return None
+
+        try:
+            modified, removed = self.repo.diff(db_latest, self.repo.current_hash)
+        except (OSError, CalledProcessError):
+            # e.g. the last loaded commit isn't in this clone's history
+            return None
+
+        # the diff is relative to the repo, file names are relative to the JSON directory
+        json_dir = os.path.relpath(self.file_storage.json_dir, self.repo.path_str)
+
+        def json_file_names(paths):
+            return [os.path.relpath(path, json_dir) for path in sorted(paths) if path.startswith(f"{json_dir}/") and path.endswith(".json")]
+
+        return json_file_names(modified), json_file_names(removed)
+
+    def load_changes(self, options, modified_files, removed_files=()):
+        """Save the files whose content differs from the database and delete removed files."""
+        # skip the l10n directory for now
+        modified_files = [filename for filename in modified_files if not filename.startswith("l10n/")]
+        removed_files = [filename for filename in removed_files if not filename.startswith("l10n/")]
+        files = self.db_storage.model_class.objects.using(options["database"])
         with transaction.atomic(using=options["database"]):
+            db_content = dict(files.filter(name__in=modified_files).values_list("name", "content"))
+            updated = []
             for filename in modified_files:
-                # skip the l10n directory for now
-                if filename.startswith("l10n/"):
+                content = self.file_storage.content(filename)
+                if content is None or db_content.get(filename) == content:
                     continue
 
-                self.db_storage.update(filename, self.file_storage.content(filename), self.last_modified)
+                self.db_storage.update(filename, content, self.last_modified)
+                updated.append(filename)
                 if not options["quiet"]:
                     print("Updated " + filename)
 
-            self.db_storage.update("/", "", self.last_modified)
-            self.db_storage.update("regions/", "", self.last_modified)
+            removed, _ = files.filter(name__in=removed_files).delete()
+            if not options["quiet"]:
+                for filename in removed_files:
+                    print("Removed " + filename)
+
+            if updated or removed:
+                self.db_storage.update("/", "", self.last_modified)
+                self.db_storage.update("regions/", "", self.last_modified)
+
+        if not options["quiet"]:
+            print(f"{len(updated)} updated, {removed} removed, {len(modified_files) - len(updated)} unchanged")
 
     def update_file_data(self):
         self.repo.update()
         return self.repo.has_changes()
 
-    def count_builds(self, version_key, min_builds=20):
-        version = self.file_storage.data("firefox_versions.json")[version_key]
+    def count_builds(self, versions, primary_builds, version_key, min_builds=20):
+        version = versions[version_key]
         if not version:
             if version_key == "FIREFOX_ESR_NEXT":
                 return
-        builds = len([locale for locale, build in self.file_storage.data("firefox_primary_builds.json").items() if version in build])
+        builds = len([locale for locale, build in primary_builds.items() if version in build])
         if builds < min_builds:
             raise ValueError(f"Too few builds for {version_key}")
 
     def validate_data(self):
-        self.file_storage.clear_cache()
+        # read each file once rather than once per version key
+        versions = json.loads(self.file_storage.content("firefox_versions.json"))
+        primary_builds = json.loads(self.file_storage.content("firefox_primary_builds.json"))
         for key in FIREFOX_VERSION_KEYS:
-            self.count_builds(key)
+            self.count_builds(versions, primary_builds, key)
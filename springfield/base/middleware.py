@@ -10,22 +10,22 @@ the locale codes.
 """
 
 import base64
-import contextlib
 import hmac
 import inspect
 import logging
 import time
 from email.utils import formatdate
-from functools import wraps
 
 from django.conf import settings
+from django.conf.urls.i18n import is_language_prefix_patterns_used
 from django.core.exceptions import DisallowedRedirect, MiddlewareNotUsed
 from django.http import Http404, HttpResponse, HttpResponseRedirect
 from django.middleware.locale import LocaleMiddleware as DjangoLocaleMiddleware
 from django.shortcuts import redirect
+from django.urls import get_script_prefix, is_valid_path
 from django.utils import translation
+from django.utils.cache import patch_vary_headers
 from django.utils.deprecation import MiddlewareMixin
-from django.utils.translation import trans_real
 
 from commonware.middleware import FrameOptionsHeader as OldFrameOptionsHeader
 from csp.contrib.rate_limiting import RateLimitedCSPMiddleware
@@ -33,8 +33,9 @@ from csp.contrib.rate_limiting import RateLimitedCSPMiddleware
 from lib.l10n_utils import is_root_path_with_no_language_clues
 from springfield.base import metrics
 from springfield.base.i18n import (
-    check_for_springfield_language,
     get_language_from_headers,
+    get_language_from_path,
+    get_language_from_request,
     normalize_language,
     path_needs_lang_code,
     split_path_and_normalize_language,
@@ -115,18 +116,22 @@ class SpringfieldLangCodeFixupMiddleware(MiddlewareMixin):
 
 
 class SpringfieldLocaleMiddleware(DjangoLocaleMiddleware):
-    """Middleware that usually* wraps Django's own i18n middleware in order to
-    ensure we normalize language codes - i..e. we ensure they are in
+    """Middleware that usually* does the job of Django's own i18n middleware,
+    but ensures we normalize language codes - i.e. we ensure they are in the
     mixed case we use, rather than Django's internal all-lowercase codes.
 
-    *for one specific situation, though, we skip Django's LocaleMiddleware entirely:
+    `process_request` and `process_response` are copies of the stock
+    LocaleMiddleware's, as of Django 5.2, that resolve the language with
+    Springfield's helpers from `springfield.base.i18n` instead of Django's,
+    which would check for gettext catalogs we don't have. Nothing is patched
+    at runtime, so it is safe to use from threaded workers. Check them against
+    Django's when upgrading: wagtail-localize squarely depends on the stock
+    LocaleMiddleware's behaviour.
+
+    *for one specific situation, though, we skip the locale handling entirely:
     we have a special SEO-helping page that gets returned to robots/spiders that
     don't declare an accept-language header, showing a list of locales to pick.
 
-    It needs to be kept super-light so that it doesn't diverge too far from
-    the stock LocaleMiddleware, lest we wake up dragons when we use
-    wagtail-localize, which squarely depends on django's LocaleMiddleware.
-
     Note: this is not SUMO's LocaleMiddleware, this just a tribute.
     (https://github.com/escattone/kitsune/blob/main/kitsune/sumo/middleware.py#L128)
     """
@@ -138,69 +143,52 @@ class SpringfieldLocaleMiddleware(DjangoLocaleMiddleware):
                 "springfield.localemiddleware.skipdjangolocalemiddleware",
                 tags=[f"path:{request.path}"],
             )
-        else:
-            with normalized_get_language():
-                with simplified_check_for_language():
-                    return super().process_request(request)
+            return
+
+        urlconf = getattr(request, "urlconf", settings.ROOT_URLCONF)
+        i18n_patterns_used, prefixed_default_language = is_language_prefix_patterns_used(urlconf)
+        language = get_language_from_request(request, check_path=i18n_patterns_used)
+        language_from_path = get_language_from_path(request.path_info)
+        if not language_from_path and i18n_patterns_used and not prefixed_default_language:
+            language = settings.LANGUAGE_CODE
+        translation.activate(language)
+        request.LANGUAGE_CODE = normalize_language(translation.get_language())
 
     def process_response(self, request, response):
         if is_root_path_with_no_language_clues(request):
             # Skip using Django's LocaleMiddleware on the response cycle too
             return response
 
-        with normalized_get_language():
-            with simplified_check_for_language():
-                return super().process_response(request, response)
-
-
-@contextlib.contextmanager
-def normalized_get_language():
-    """
-    Ensures that any use of django.utils.translation.get_language()
-    within its context will return a normalized language code. This
-    context manager only works when the "get_language" function is
-    acquired from the "django.utils.translation" module at call time,
-    so for example, if it's called like "translation.get_language()".
-
-    Note that this does not cover every call to translation.get_language()
-    as there are calls to it on Django startup and more, but this gives us an
-    extra layer of (idempotent) fixing up within the request/response cycle.
-    """
-    get_language = translation.get_language
-
-    @wraps(get_language)
-    def get_normalized_language():
-        return normalize_language(get_language())
-
-    translation.get_language = get_normalized_language
-
-    try:
-        yield
-    finally:
-        translation.get_language = get_language
-
-
-@contextlib.contextmanager
-def simplified_check_for_language():
-    """Ensures that calls to trans_real.check_for_language within
-    its context will not check for the existence of files in
-    `appname/LANG_CODE/locale` and therefore avoid a false negative about
-    the langs we support (our lang files are in ./data/l10n-team/LANG_CODE)
-    but check_for_language is opinionated and expects only the Django directory
-    pattern for lang files."""
-
-    check_for_language = trans_real.check_for_language
-
-    @wraps(check_for_language)
-    def simpler_check_for_language(lang_code):
-        return check_for_springfield_language(lang_code)
-
-    trans_real.check_for_language = simpler_check_for_language
+        language = normalize_language(translation.get_language())
+        language_from_path = get_language_from_path(request.path_info)
+        urlconf = getattr(request, "urlconf", settings.ROOT_URLCONF)
+        i18n_patterns_used, prefixed_default_language = is_language_prefix_patterns_used(urlconf)
+
+        if response.status_code == 404 and not language_from_path and i18n_patterns_used and prefixed_default_language:
+            # Maybe the language code is missing in the URL? Try adding the
+            # language prefix and redirecting to that URL.
+            language_path = f"/{language}{request.path_info}"
+            path_valid = is_valid_path(language_path, urlconf)
+            path_needs_slash = not path_valid and (
+                settings.APPEND_SLASH and not language_path.endswith("/") and is_valid_path(f"{language_path}/", urlconf)
+            )
 
-    try:
-        yield
-    finally:
-        trans_real.check_for_language = check_for_language
+            if path_valid or path_needs_slash:
+                script_prefix = get_script_prefix()
+                # Insert language after the script prefix and before the
+                # rest of the URL
+                language_url = request.get_full_path(force_append_slash=path_needs_slash).replace(script_prefix, f"{script_prefix}{language}/", 1)
+                # Redirect to the language-specific URL as detected by
+                # get_language_from_request(). HTTP caches may cache this
+                # redirect, so add the Vary header.
+                redirect = self.response_redirect_class(language_url)
+                patch_vary_headers(redirect, ("Accept-Language", "Cookie"))
+                return redirect
+
+        if not (i18n_patterns_used and language_from_path):
+            patch_vary_headers(response, ("Accept-Language",))
+        response.headers.setdefault("Content-Language", language)
+        return response
 
 
 class SyntheticServerErrorMiddleware:
@@ -7,6 +7,11 @@ HTML sanitization utilities using justhtml.
 
 This module provides functions for sanitizing HTML content, replacing
 the deprecated bleach library.
+
+Callers that always use the same allow-lists should register them once with
+register_policy() when their module is imported and then call sanitize() with
+the policy's name, instead of building a new policy on every sanitize_html()
+call.
 """
 
 import re
@@ -37,6 +42,48 @@ _URL_POLICY = UrlPolicy(
     },
 )
 
+# Plain text without any of these characters comes out of the parser and
+# serializer unchanged, so it can skip them. (">" is escaped, "\r" and
+# form feeds are normalised, and NUL and byte order marks are dropped.)
+_NEEDS_PARSING_RE = re.compile("[<>&\r\x00\x0c\ufeff]")
+
+# Named policies built once by register_policy(), used by sanitize().
+POLICIES = {}
+
+
+def make_policy(allowed_tags, allowed_attributes) -> SanitizationPolicy:
+    """Return the policy that sanitize_html() uses for these allow-lists."""
+    return SanitizationPolicy(
+        allowed_tags=frozenset(allowed_tags),
+        allowed_attributes=allowed_attributes,
+        url_policy=_URL_POLICY,
+        disallowed_tag_handling="escape",
+        drop_content_tags=_DROP_CONTENT_TAGS,
+    )
+
+
+def register_policy(name: str, allowed_tags: set, allowed_attributes: dict) -> SanitizationPolicy:
+    """Build the policy for these allow-lists and store it as ``name`` for sanitize()."""
+    POLICIES[name] = policy = make_policy(allowed_tags, allowed_attributes)
+    return policy
+
+
+_STRIP_ALL_TAGS_POLICY = SanitizationPolicy(
+    allowed_tags=frozenset(),
+    allowed_attributes={},
+    disallowed_tag_handling="unwrap",
+    drop_content_tags=_DROP_CONTENT_TAGS,
+)
+
+
+def _apply_policy(html: str, policy: SanitizationPolicy) -> str:
+    if not _NEEDS_PARSING_RE.search(html):
+        return html
+
+    html = _HTML_COMMENT_RE.sub("", html)
+    doc = JustHTML(html, policy=policy, fragment=True)
+    return doc.to_html(pretty=False)
+
 
 def strip_all_tags(html: str) -> str:
     """Remove all HTML tags, returning only text content.
@@ -49,15 +96,7 @@ def strip_all_tags(html: str) -> str:
     Returns:
         The text content with all HTML tags removed.
     """
-    policy = SanitizationPolicy(
-        allowed_tags=frozenset(),
-        allowed_attributes={},
-        disallowed_tag_handling="unwrap",
-        drop_content_tags=_DROP_CONTENT_TAGS,
-    )
-    html = _HTML_COMMENT_RE.sub("", html)
-    doc = JustHTML(html, policy=policy, fragment=True)
-    return doc.to_html(pretty=False)
+    return _apply_policy(html, _STRIP_ALL_TAGS_POLICY)
 
 
 def sanitize_html(html: str, allowed_tags: set, allowed_attributes: dict) -> str:
@@ -76,13 +115,17 @@ def sanitize_html(html: str, allowed_tags: set, allowed_attributes: dict) -> str
     Returns:
         The sanitized HTML string.
     """
-    policy = SanitizationPolicy(
-        allowed_tags=frozenset(allowed_tags),
-        allowed_attributes=allowed_attributes,
-        url_policy=_URL_POLICY,
-        disallowed_tag_handling="escape",
-        drop_content_tags=_DROP_CONTENT_TAGS,
-    )
-    html = _HTML_COMMENT_RE.sub("", html)
-    doc = JustHTML(html, policy=policy, fragment=True)
-    return doc.to_html(pretty=False)
+    return _apply_policy(html, make_policy(allowed_tags, allowed_attributes))
+
+
+def sanitize(html: str, policy_name: str) -> str:
+    """Sanitize HTML like sanitize_html(), with a policy from register_policy().
+
+    Args:
+        html: The HTML string to sanitize.
+        policy_name: The name the policy was registered with.
+
+    Returns:
+        The sanitized HTML string.
+    """
+    return _apply_policy(html, POLICIES[policy_name])
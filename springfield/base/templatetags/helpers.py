@@ -5,10 +5,12 @@
 import datetime
 import logging
 import urllib.parse
+from functools import lru_cache
 
 from django.conf import settings
 from django.contrib.staticfiles.storage import staticfiles_storage
-from django.urls import NoReverseMatch
+from django.urls import NoReverseMatch, get_resolver, get_script_prefix, get_urlconf
+from django.utils import translation
 from django.utils.encoding import smart_str
 
 import jinja2
@@ -30,6 +32,12 @@ CSS_TEMPLATE_IE_10_11 = (
 JS_TEMPLATE = '<script src="%s"></script>'
 log = logging.getLogger(__name__)
 
+# URLs which only exist in the CMS are solely defined in this URLconf. They
+# aren't listed in the main URLConf because they aren't served by the Django
+# views in Springfield, but they will/must have matching routes set up in the CMS.
+CMS_ONLY_URLCONF = "springfield.cms.cms_only_urls"
+URL_CACHE_SIZE = 4096
+
 
 @library.global_function
 @jinja2.pass_context
@@ -54,25 +62,64 @@ def thisyear():
     return Markup(datetime.date.today().year)
 
 
-@library.global_function
-def url(viewname, *args, **kwargs):
-    """Helper for Django's ``reverse`` in templates."""
+@lru_cache(maxsize=4)
+def _cms_only_url_names(cms_resolver):
+    """Return the view names that the CMS-only URLconf can reverse."""
+    return frozenset(name for name in cms_resolver.reverse_dict if isinstance(name, str))
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _reverse_url(resolver, cms_resolver, script_prefix, language, viewname, args, kwargs):
+    """Reverse ``viewname`` as `_uncached_url` does, skipping the CMS-only
+    URLconf for the plain view names it doesn't have.
+
+    The resolvers, script prefix and language are only part of the cache key:
+    `reverse` reads the current ones itself. Reloading the URLconfs creates new
+    resolvers, so URLs reversed from the old ones are never returned again.
+    """
+    kwargs = dict(kwargs)
+    if ":" in viewname or viewname in _cms_only_url_names(cms_resolver):
+        try:
+            return reverse(viewname, urlconf=CMS_ONLY_URLCONF, args=args, kwargs=kwargs)
+        except NoReverseMatch:
+            pass
+
+    return reverse(viewname, urlconf=resolver.urlconf_name, args=args, kwargs=kwargs)
+
 
+def _uncached_url(viewname, args, kwargs):
     try:
-        # First, look for URLs which only exist in the CMS - these are solely defined
-        # in springfield/cms/cms_only_urls.py. These URLs are not listed in
-        # the main URLConf because they aren't served by the Django views in
-        # Springfield, but they will/must have matching routes set up in the CMS.
-        return reverse(
-            viewname,
-            urlconf="springfield.cms.cms_only_urls",
-            args=args,
-            kwargs=kwargs,
-        )
+        # First, look for URLs which only exist in the CMS
+        return reverse(viewname, urlconf=CMS_ONLY_URLCONF, args=args, kwargs=kwargs)
     except NoReverseMatch:
         return reverse(viewname, args=args, kwargs=kwargs)
 
 
+@library.global_function
+def url(viewname, *args, **kwargs):
+    """Helper for Django's ``reverse`` in templates.
+
+    URLs in the CMS-only URLconf take precedence over the main one. Results are
+    cached per URLconf, locale, view name and arguments, as templates reverse the
+    same navigation links on every page.
+    """
+    kwargs_key = tuple(sorted(kwargs.items()))
+    try:
+        hash((viewname, args, kwargs_key))
+    except TypeError:
+        return _uncached_url(viewname, args, kwargs)
+
+    return _reverse_url(
+        get_resolver(get_urlconf()),
+        get_resolver(CMS_ONLY_URLCONF),
+        get_script_prefix(),
+        translation.get_language(),
+        viewname,
+        args,
+        kwargs_key,
+    )
+
+
 @library.filter
 def urlparams(url_, hash=None, **query):
     """Add a fragment and/or query paramaters to a URL.
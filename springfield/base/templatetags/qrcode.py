@@ -3,9 +3,12 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import base64
+import logging
 import os
 from hashlib import sha1
 from io import BytesIO
+from pathlib import Path
+from tempfile import NamedTemporaryFile
 
 from django.conf import settings
 from django.core.cache import caches
@@ -20,6 +23,7 @@ from qrcode.image.styles.moduledrawers.pil import CircleModuleDrawer, StyledPilQ
 from qrcode.image.svg import SvgPathFillImage
 
 cache = caches["qrcode"]
+log = logging.getLogger(__name__)
 
 FIREFOX_LOGO_PNG = os.path.join(settings.ROOT_PATH, "media/img/logos/firefox/firefox-logo-white-bg.png")
 
@@ -69,42 +73,104 @@ class RoundedEyeDrawer(StyledPilQRModuleDrawer):
         self.imgDraw.rounded_rectangle([cx0, cy0, cx0 + dot_px - 1, cy0 + dot_px - 1], radius=self.dot_radius, fill=dark)
 
 
+# Bump this when a change to the code above or below changes the images, so that
+# the QR codes already stored on disk aren't used.
+QRCODE_STYLE_VERSION = 1
+
+
+def _store_path(key, ext):
+    return Path(settings.QRCODE_CACHE_PATH, key[:2], f"{key}.{ext}")
+
+
+def read_stored_qrcode(key, ext):
+    """Return the bytes of a QR code rendered by any worker, or None."""
+    try:
+        return _store_path(key, ext).read_bytes()
+    except OSError:
+        return None
+
+
+def store_qrcode(key, ext, content):
+    """Write a rendered QR code to disk for every worker to use.
+
+    The file is written under a temporary name and renamed, so a reader never
+    sees a partial file. Failing to write only means it is rendered again.
+    """
+    path = _store_path(key, ext)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(dir=path.parent, prefix=f".{key}.", delete=False) as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_file.name, path)
+    except OSError:
+        log.warning("Could not store QR code %s", path, exc_info=True)
+
+
+def render_qrcode_svg(data, box_size):
+    img = qr.make(data, image_factory=SvgPathFillImage, box_size=box_size)
+    svg = BytesIO()
+    img.save(svg)
+    return svg.getvalue()
+
+
+def render_qrcode_rounded_png(data, box_size):
+    qr_obj = qr.QRCode(
+        error_correction=qr.constants.ERROR_CORRECT_H,
+        box_size=box_size,
+        border=4,
+    )
+    qr_obj.add_data(data)
+    qr_obj.make(fit=True)
+    qr_img = qr_obj.make_image(
+        image_factory=StyledPilImage,
+        module_drawer=CircleModuleDrawer(),
+        eye_drawer=RoundedEyeDrawer(),
+        color_mask=SolidFillColorMask(front_color=(51, 51, 51)),
+        embedded_image_path=FIREFOX_LOGO_PNG,
+        embedded_image_ratio=0.23,
+    )
+    buf = BytesIO()
+    qr_img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _get_or_render(key, ext, render, data, box_size, persist):
+    """Return the QR code's bytes from disk, or render it (and store it if ``persist``)."""
+    content = read_stored_qrcode(key, ext) if persist else None
+    if content is None:
+        content = render(data, box_size)
+        if persist:
+            store_qrcode(key, ext, content)
+
+    return content
+
+
 @library.global_function
-def qrcode(data, box_size=20):
+def qrcode(data, box_size=20, persist=True):
+    """Return an SVG QR code for ``data``.
+
+    QR codes are kept in memory and, unless ``persist`` is False, on disk under
+    QRCODE_CACHE_PATH, named for a hash of the data and style so that every worker
+    can use them. Pass ``persist=False`` for data that is unique to a visitor.
+    """
     key = sha1(f"{data}-{box_size}".encode()).hexdigest()
     svg = cache.get(key)
     if not svg:
-        img = qr.make(data, image_factory=SvgPathFillImage, box_size=box_size)
-        svg = BytesIO()
-        img.save(svg)
-        svg = svg.getvalue().decode("utf-8")
+        store_key = sha1(f"svg-{QRCODE_STYLE_VERSION}-{data}-{box_size}".encode()).hexdigest()
+        svg = _get_or_render(store_key, "svg", render_qrcode_svg, data, box_size, persist).decode("utf-8")
         cache.set(key, svg)
 
     return Markup(svg)
 
 
 @library.global_function
-def qrcode_rounded(data, box_size=20):
+def qrcode_rounded(data, box_size=20, persist=True):
+    """Return an <img> of a QR code for ``data`` with rounded modules and the
+    Firefox logo. It is stored the same way as `qrcode`."""
     key = sha1(f"rounded-{data}-{box_size}".encode()).hexdigest()
     b64 = cache.get(key)
     if not b64:
-        qr_obj = qr.QRCode(
-            error_correction=qr.constants.ERROR_CORRECT_H,
-            box_size=box_size,
-            border=4,
-        )
-        qr_obj.add_data(data)
-        qr_obj.make(fit=True)
-        qr_img = qr_obj.make_image(
-            image_factory=StyledPilImage,
-            module_drawer=CircleModuleDrawer(),
-            eye_drawer=RoundedEyeDrawer(),
-            color_mask=SolidFillColorMask(front_color=(51, 51, 51)),
-            embedded_image_path=FIREFOX_LOGO_PNG,
-            embedded_image_ratio=0.23,
-        )
-        buf = BytesIO()
-        qr_img.save(buf, format="PNG")
-        b64 = base64.b64encode(buf.getvalue()).decode()
+        store_key = sha1(f"rounded-{QRCODE_STYLE_VERSION}-{data}-{box_size}".encode()).hexdigest()
+        b64 = base64.b64encode(_get_or_render(store_key, "png", render_qrcode_rounded_png, data, box_size, persist)).decode()
         cache.set(key, b64)
     return Markup(f'<img src="data:image/png;base64,{b64}" alt="" aria-hidden="true">')
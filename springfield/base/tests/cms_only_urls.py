@@ -0,0 +1,13 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from django.urls import include, path
+
+from springfield.cms.cms_only_urls import dummy_view
+
+urlpatterns = [
+    # also in the main URLconf, where it takes a product_slug
+    path("cms/download/all/", dummy_view, name="firefox.all.platforms"),
+    path("cms/", include(([path("page/", dummy_view, name="page")], "cms-test"))),
+]
@@ -1,15 +1,23 @@
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
+from io import StringIO
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import DEFAULT, patch
 
+from django.conf import settings
 from django.core import mail
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
 from django.test import TestCase as DjangoTestCase, override_settings
 
+from django_jinja.backend import Jinja2
+from jinja2 import FileSystemBytecodeCache
+from product_details.models import ProductDetailsFile
+
 from springfield.base.management.commands import update_product_details_files
 from springfield.base.tests import TestCase
+from springfield.jinja2 import get_bytecode_cache
 
 
 class CheckEmailDeliverabilityTestCase(DjangoTestCase):
@@ -70,6 +78,7 @@ class TestUpdateProductDetailsFiles(TestCase):
         with patch.multiple(self.command, update_file_data=DEFAULT, validate_data=DEFAULT, file_storage=DEFAULT, load_changes=DEFAULT, repo=DEFAULT):
             options = dict(quiet=False, database="default", force=False)
             self.command.update_file_data.return_value = True
+            self.command.repo.get_db_latest.return_value = None
             self.command.handle(**options)
             assert self.command.file_storage.all_json_files.called
             self.command.load_changes.assert_called_with(options, self.command.file_storage.all_json_files())
@@ -79,6 +88,7 @@ class TestUpdateProductDetailsFiles(TestCase):
         with patch.multiple(self.command, update_file_data=DEFAULT, validate_data=DEFAULT, file_storage=DEFAULT, load_changes=DEFAULT, repo=DEFAULT):
             options = dict(quiet=False, database="default", force=False)
             self.command.update_file_data.return_value = True
+            self.command.repo.get_db_latest.return_value = None
             self.command.load_changes.side_effect = Exception("broke yo")
             with self.assertRaises(Exception):
                 self.command.handle(**options)
@@ -93,3 +103,82 @@ class TestUpdateProductDetailsFiles(TestCase):
             self.command.handle(**options)
             assert not self.command.file_storage.all_json_files.called
             assert not self.command.repo.set_db_latest.called
+
+    def test_handle_diff_loads_changed_files(self):
+        with patch.multiple(self.command, update_file_data=DEFAULT, validate_data=DEFAULT, file_storage=DEFAULT, load_changes=DEFAULT, repo=DEFAULT):
+            options = dict(quiet=False, database="default", force=False)
+            self.command.update_file_data.return_value = True
+            self.command.repo.path_str = "/pd"
+            self.command.file_storage.json_dir = "/pd/public/1.0"
+            self.command.repo.diff.return_value = (
+                {"public/1.0/firefox_versions.json", "public/1.0/regions/fr.json", "README.md"},
+                {"public/1.0/old.json"},
+            )
+            self.command.handle(**options)
+            self.command.repo.diff.assert_called_with(self.command.repo.get_db_latest(), self.command.repo.current_hash)
+            assert not self.command.file_storage.all_json_files.called
+            self.command.load_changes.assert_called_with(options, ["firefox_versions.json", "regions/fr.json"], ["old.json"])
+            assert self.command.repo.set_db_latest.called
+
+    def test_load_changes_skips_unchanged_files(self):
+        ProductDetailsFile.objects.create(name="same.json", content='{"same": 1}', last_modified="then")
+        ProductDetailsFile.objects.create(name="changed.json", content='{"changed": 1}', last_modified="then")
+        ProductDetailsFile.objects.create(name="removed.json", content="{}", last_modified="then")
+        contents = {"same.json": '{"same": 1}', "changed.json": '{"changed": 2}', "new.json": "{}"}
+        options = dict(quiet=True, database="default", force=False)
+        with patch.object(self.command.file_storage, "content", side_effect=contents.get):
+            self.command.load_changes(options, ["same.json", "changed.json", "new.json", "l10n/de.json"], ["removed.json"])
+
+        files = {fo.name: fo for fo in ProductDetailsFile.objects.all()}
+        assert files["same.json"].last_modified == "then"
+        assert files["changed.json"].content == '{"changed": 2}'
+        assert files["changed.json"].last_modified == self.command.last_modified
+        assert files["new.json"].content == "{}"
+        assert "removed.json" not in files
+        assert "l10n/de.json" not in files
+
+
+class TestJinjaBytecodeCache(TestCase):
+    def test_environment_uses_the_configured_directory(self):
+        assert Jinja2.get_default().env.bytecode_cache.directory == settings.JINJA_BYTECODE_CACHE_PATH
+
+    def test_directory_cannot_be_created(self):
+        with TemporaryDirectory() as tmp_dir:
+            not_a_dir = Path(tmp_dir, "file")
+            not_a_dir.touch()
+            assert get_bytecode_cache(str(not_a_dir.joinpath("cache"))) is None
+
+
+class TestCompileTemplates(TestCase):
+    def setUp(self):
+        self.env = Jinja2.get_default().env
+        self.template_dir = TemporaryDirectory()
+        self.cache_dir = TemporaryDirectory()
+        Path(self.template_dir.name, "good.html").write_text("<p>{{ greeting }}</p>")
+        Path(self.template_dir.name, "bad.html").write_text("{% comment %}not jinja{% endcomment %}")
+        # an empty template cache, so the templates are compiled and not reused from memory
+        for patcher in (
+            patch.object(self.env.loader, "searchpath", [self.template_dir.name]),
+            patch.object(self.env, "cache", {}),
+            patch.object(self.env, "bytecode_cache", FileSystemBytecodeCache(self.cache_dir.name)),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.template_dir.cleanup()
+        self.cache_dir.cleanup()
+
+    def test_compiles_templates_into_the_bytecode_cache(self):
+        stdout, stderr = StringIO(), StringIO()
+        call_command("compile_templates", stdout=stdout, stderr=stderr)
+
+        assert "Compiled 1 of 2 templates" in stdout.getvalue()
+        assert "Skipped bad.html" in stderr.getvalue()
+        bucket = self.env.bytecode_cache.get_bucket(self.env, "good.html", str(Path(self.template_dir.name, "good.html")), "<p>{{ greeting }}</p>")
+        assert bucket.code is not None
+
+    def test_no_bytecode_cache(self):
+        self.env.bytecode_cache = None
+        with self.assertRaises(CommandError):
+            call_command("compile_templates", stdout=StringIO())
@@ -2,17 +2,35 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import tempfile
+from pathlib import Path
 from unittest.mock import patch
 
+from django.test import override_settings
+
 from qrcode.image.svg import SvgPathFillImage
 
+from springfield.base.templatetags import qrcode as qrcode_helpers
 from springfield.base.templatetags.qrcode import qrcode, qrcode_rounded
 from springfield.base.tests import TestCase
 
 
+class QRCodeStoreMixin:
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.store_path = Path(tmp_dir.name)
+        settings_override = override_settings(QRCODE_CACHE_PATH=tmp_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def stored_files(self):
+        return sorted(self.store_path.glob("*/*.*"))
+
+
 @patch("springfield.base.templatetags.qrcode.cache")
 @patch("springfield.base.templatetags.qrcode.qr")
-class TestQRCode(TestCase):
+class TestQRCode(QRCodeStoreMixin, TestCase):
     def test_qrcode_cache_cold(self, qr_mock, cache_mock):
         cache_mock.get.return_value = None
         data = "https://dude.abide"
@@ -27,7 +45,7 @@ class TestQRCode(TestCase):
 
 
 @patch("springfield.base.templatetags.qrcode.cache")
-class TestQRCodeRounded(TestCase):
+class TestQRCodeRounded(QRCodeStoreMixin, TestCase):
     def test_qrcode_rounded_cache_warm(self, cache_mock):
         cache_mock.get.return_value = "abc123base64=="
         result = str(qrcode_rounded("https://dude.abide"))
@@ -45,3 +63,44 @@ class TestQRCodeRounded(TestCase):
         result = str(qrcode_rounded("https://dude.abide"))
         assert result.startswith("<img ")
         assert 'aria-hidden="true"' in result
+
+
+@patch("springfield.base.templatetags.qrcode.cache")
+class TestQRCodeStore(QRCodeStoreMixin, TestCase):
+    def test_rendered_once_for_every_worker(self, cache_mock):
+        cache_mock.get.return_value = None
+        svg = qrcode("https://dude.abide", 12)
+        png = qrcode_rounded("https://dude.abide", 12)
+        assert [path.suffix for path in self.stored_files()] == sorted([".png", ".svg"])
+
+        # another worker, with nothing in its memory cache, reads them from disk
+        with (
+            patch.object(qrcode_helpers, "render_qrcode_svg") as svg_mock,
+            patch.object(qrcode_helpers, "render_qrcode_rounded_png") as png_mock,
+        ):
+            assert qrcode("https://dude.abide", 12) == svg
+            assert qrcode_rounded("https://dude.abide", 12) == png
+        svg_mock.assert_not_called()
+        png_mock.assert_not_called()
+
+    def test_keyed_by_data_and_size(self, cache_mock):
+        cache_mock.get.return_value = None
+        qrcode("https://dude.abide", 12)
+        qrcode("https://dude.abide", 8)
+        qrcode("https://walter.sobchak", 12)
+        assert len(self.stored_files()) == 3
+
+    def test_not_persisted(self, cache_mock):
+        cache_mock.get.return_value = None
+        assert "<svg" in qrcode("https://dude.abide/?invitation=123", 8, persist=False)
+        assert self.stored_files() == []
+
+    def test_unwritable_store(self, cache_mock):
+        cache_mock.get.return_value = None
+        with (
+            patch.object(qrcode_helpers, "NamedTemporaryFile", side_effect=PermissionError),
+            patch.object(qrcode_helpers.log, "warning") as warning_mock,
+        ):
+            assert "<svg" in qrcode("https://dude.abide", 12)
+        warning_mock.assert_called_once()
+        assert self.stored_files() == []
@@ -4,6 +4,8 @@
 from unittest.mock import patch
 
 from django.test import TestCase, override_settings
+from django.urls import NoReverseMatch
+from django.utils import translation
 
 import pytest
 from django_jinja.backend import Jinja2
@@ -46,6 +48,57 @@ class HelpersTests(TestCase):
         assert render(template, context) == '<a href="?var=%C3%A4">'
 
 
+class UrlHelperTests(TestCase):
+    def setUp(self):
+        helpers._reverse_url.cache_clear()
+        translation.activate("en-US")
+
+    def tearDown(self):
+        translation.deactivate()
+
+    def test_url(self):
+        assert render("{{ url('firefox.all') }}") == "/en-US/download/all/"
+        assert render("{{ url('firefox.all.platforms', product_slug='desktop-release') }}") == "/en-US/download/all/desktop-release/"
+        with translation.override("de"):
+            assert render("{{ url('firefox.all') }}") == "/de/download/all/"
+
+    def test_url_is_cached(self):
+        with patch.object(helpers, "reverse", wraps=helpers.reverse) as reverse_mock:
+            for _ in range(3):
+                assert helpers.url("firefox.all") == "/en-US/download/all/"
+            with translation.override("de"):
+                assert helpers.url("firefox.all") == "/de/download/all/"
+        # once per locale, and never a failed lookup in the CMS-only URLconf
+        assert reverse_mock.call_count == 2
+
+    def test_url_unhashable_args(self):
+        # reversed without the cache, rather than failing to make a cache key
+        with self.assertRaises(NoReverseMatch):
+            helpers.url("firefox.all.platforms", product_slug=["desktop-release"])
+        assert helpers._reverse_url.cache_info().currsize == 0
+
+    @patch.object(helpers, "CMS_ONLY_URLCONF", "springfield.base.tests.urls")
+    def test_cms_only_urls_take_precedence(self):
+        assert helpers.url("index") == "/"
+        assert helpers.url("firefox.all") == "/en-US/download/all/"
+
+    @patch.object(helpers, "CMS_ONLY_URLCONF", "springfield.base.tests.cms_only_urls")
+    def test_url_in_both_urlconfs(self):
+        assert helpers.url("firefox.all.platforms") == "/cms/download/all/"
+        # only the main URLconf's pattern takes these arguments
+        assert helpers.url("firefox.all.platforms", product_slug="desktop-release") == "/en-US/download/all/desktop-release/"
+
+    @patch.object(helpers, "CMS_ONLY_URLCONF", "springfield.base.tests.cms_only_urls")
+    def test_namespaced_cms_only_url(self):
+        assert helpers.url("cms-test:page") == "/cms/page/"
+
+    def test_urlconf_reload(self):
+        with override_settings(ROOT_URLCONF="springfield.base.tests.urls"):
+            assert helpers.url("index") == "/"
+        with self.assertRaises(NoReverseMatch):
+            helpers.url("index")
+
+
 @pytest.mark.parametrize(
     ("bundle_helper", "expected_path"),
     (
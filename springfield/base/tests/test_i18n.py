@@ -2,6 +2,7 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+from django.conf import settings
 from django.test import override_settings
 from django.urls import URLResolver
 
@@ -13,7 +14,10 @@ from springfield.base.i18n import (
     check_for_springfield_language,
     get_best_language,
     get_language_from_headers,
+    get_language_from_request,
+    get_supported_language_variant,
     normalize_language,
+    normalized_language_table,
     path_needs_lang_code,
     split_path_and_normalize_language,
     springfield_i18n_patterns,
@@ -201,6 +205,55 @@ def test_get_language_from_headers(rf, headers, expected):
     assert get_language_from_headers(request) == expected
 
 
+@pytest.mark.parametrize(
+    "path, cookie, header, expected",
+    (
+        ("/fr/firefox/", None, "de", "fr"),
+        ("/xx/firefox/", None, "de", "de"),
+        ("/xx/firefox/", "es-ES", "de", "es-ES"),
+        ("/xx/firefox/", "xx", "fr,de;q=0.8", "fr"),
+        ("/xx/firefox/", None, "de-AT,fr;q=0.8", "de"),
+        ("/xx/firefox/", None, "*,fr;q=0.8", "en-US"),
+        ("/xx/firefox/", None, "", "en-US"),
+    ),
+)
+def test_get_language_from_request(rf, path, cookie, header, expected):
+    request = rf.get(path, HTTP_ACCEPT_LANGUAGE=header)
+    if cookie:
+        request.COOKIES[settings.LANGUAGE_COOKIE_NAME] = cookie
+    assert get_language_from_request(request, check_path=True) == expected
+
+
+@override_settings(DEV=False)
+@pytest.mark.parametrize(
+    "path, cookie, header, expected",
+    (
+        ("/xx/firefox/", None, "es", "es-AR"),
+        ("/xx/firefox/", None, "es-419", "es-AR"),
+        ("/xx/firefox/", None, "pt", "pt-BR"),
+        ("/xx/firefox/", None, "zh", "zh-CN"),
+        ("/xx/firefox/", "es", "de", "es-AR"),
+        ("/es/firefox/", None, "de", "es-AR"),
+        ("/pt/firefox/", None, "de", "pt-BR"),
+        ("/zh/firefox/", None, "de", "zh-CN"),
+    ),
+)
+def test_get_language_from_request_country_variant(rf, path, cookie, header, expected):
+    """A region-less code falls back to the first supported regional variant."""
+    request = rf.get(path, HTTP_ACCEPT_LANGUAGE=header)
+    if cookie:
+        request.COOKIES[settings.LANGUAGE_COOKIE_NAME] = cookie
+    assert get_language_from_request(request, check_path=True) == expected
+
+
+@override_settings(DEV=False)
+def test_get_supported_language_variant_strict():
+    assert get_supported_language_variant("es") == "es-AR"
+    assert get_supported_language_variant("es-ES", strict=True) == "es-ES"
+    with pytest.raises(LookupError):
+        get_supported_language_variant("es", strict=True)
+
+
 @override_settings(DEV=False)
 @pytest.mark.parametrize(
     "header, expected",
@@ -215,3 +268,24 @@ def test_get_language_from_headers(rf, headers, expected):
 )
 def test_get_best_language(header, expected):
     assert get_best_language(header) == expected
+
+
+def test_normalized_language_table():
+    table = normalized_language_table()
+    assert table["en-US"] == "en-US"
+    assert table["en-us"] == "en-US"
+    assert table["zh-hant-tw"] == "zh-TW"
+    assert table["ja-jp-mac"] == "ja"
+    assert "dude" not in table
+
+
+@override_settings(LANGUAGE_URL_MAP_WITH_FALLBACKS={"en-US": "en-US", "en": "en-US"})
+def test_language_tables_follow_settings_changes():
+    assert normalize_language("de") is None
+    assert get_best_language("de,en-US;q=0.8") == "en-US"
+    with override_settings(LANGUAGE_URL_MAP_WITH_FALLBACKS={"en-US": "en-US", "de": "de"}):
+        assert normalize_language("de") == "de"
+        assert get_best_language("de,en-US;q=0.8") == "de"
+
+    assert normalize_language("de") is None
+    assert get_best_language("de,en-US;q=0.8") == "en-US"
@@ -3,6 +3,7 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from importlib import reload
 from unittest import mock
@@ -13,6 +14,8 @@ from django.http import HttpRequest, HttpResponse
 from django.test import Client, RequestFactory, TestCase as DjangoTestCase
 from django.test.utils import override_settings
 from django.urls import reverse
+from django.utils import translation
+from django.utils.translation import trans_real
 
 import csp.constants
 import pytest
@@ -21,6 +24,7 @@ from jinja2.exceptions import UndefinedError
 from markus.testing import MetricsMock
 from pytest_django.asserts import assertTemplateUsed
 
+from springfield.base import i18n
 from springfield.base.middleware import (
     CacheMiddleware,
     CatchDisallowedRedirect,
@@ -306,6 +310,63 @@ def test_SpringfieldLocaleMiddleware_skips_super_call_if_path_is_for_root_and_ha
     assert not mock_django_localemiddleware_process_response.called
 
 
+def test_SpringfieldLocaleMiddleware_activates_normalized_language(rf):
+    request = rf.get("/en-GB/firefox/")
+    middleware = SpringfieldLocaleMiddleware(lambda req: HttpResponse())
+    response = middleware(request)
+    translation.deactivate()
+    assert request.LANGUAGE_CODE == "en-GB"
+    assert response["Content-Language"] == "en-GB"
+
+
+def test_SpringfieldLocaleMiddleware_threads_do_not_leak(rf):
+    """Concurrent requests each get their own language and no module globals are swapped out"""
+    get_language = translation.get_language
+    check_for_language = trans_real.check_for_language
+    locales = ["en-US", "de", "fr", "es-ES", "ja", "pt-BR", "en-GB", "zh-TW"]
+
+    def get_response(request):
+        return HttpResponse(translation.get_language())
+
+    middleware = SpringfieldLocaleMiddleware(get_response)
+
+    def make_request(locale):
+        request = rf.get(f"/{locale}/firefox/")
+        response = middleware(request)
+        translation.deactivate()
+        return locale, request.LANGUAGE_CODE, response.content.decode(), response["Content-Language"]
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(make_request, locales * 50))
+
+    for locale, request_language, active_language, content_language in results:
+        assert request_language == locale
+        assert active_language == locale.lower()
+        assert content_language == locale
+
+    assert translation.get_language is get_language
+    assert trans_real.check_for_language is check_for_language
+
+
+def test_SpringfieldLocaleMiddleware_repeat_requests_use_cached_lookups(rf):
+    """Once a language has been resolved, later requests for it don't check the supported languages again"""
+    middleware = SpringfieldLocaleMiddleware(lambda request: HttpResponse())
+
+    def make_request():
+        request = rf.get("/de/firefox/", HTTP_ACCEPT_LANGUAGE="fr")
+        response = middleware(request)
+        translation.deactivate()
+        return request, response
+
+    make_request()
+    with mock.patch("springfield.base.i18n.check_for_springfield_language", wraps=i18n.check_for_springfield_language) as check_mock:
+        request, response = make_request()
+
+    assert request.LANGUAGE_CODE == "de"
+    assert response["Content-Language"] == "de"
+    check_mock.assert_not_called()
+
+
 @pytest.fixture
 def csp_middleware():
     return CSPMiddlewareByPathPrefix(lambda req: HttpResponse())
@@ -2,9 +2,11 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+from unittest.mock import patch
+
 import pytest
 
-from springfield.base.sanitization import sanitize_html, strip_all_tags
+from springfield.base.sanitization import POLICIES, register_policy, sanitize, sanitize_html, strip_all_tags
 
 
 class TestStripAllTags:
@@ -171,3 +173,63 @@ class TestUrlSchemeValidation:
         allowed_tags = {"a", "img"}
         allowed_attributes = {"a": ["href"], "img": ["src"]}
         assert sanitize_html(html, allowed_tags, allowed_attributes) == expected
+
+
+class TestRegisteredPolicies:
+    """Tests for register_policy() and sanitize()."""
+
+    @pytest.fixture
+    def policy_name(self):
+        register_policy("test-policy", {"a"}, {"a": ["href"]})
+        yield "test-policy"
+        del POLICIES["test-policy"]
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            '<a href="https://example.com" onclick="bad()">link</a>',
+            '<a href="javascript:alert(1)">click</a>',
+            "<div>escaped</div><!-- dropped --><script>dropped</script>",
+            "plain text",
+        ],
+    )
+    def test_same_as_sanitize_html(self, policy_name, html):
+        assert sanitize(html, policy_name) == sanitize_html(html, {"a"}, {"a": ["href"]})
+
+    def test_unknown_policy(self):
+        with pytest.raises(KeyError):
+            sanitize("<b>bold</b>", "no-such-policy")
+
+
+class TestPlainTextFastPath:
+    """Text that the parser wouldn't change is returned without parsing it."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "plain text",
+            'say "hi" it\'s\tfine',
+            "non-breaking\xa0space and ünïcode",
+            "line\nbreak",
+        ],
+    )
+    def test_plain_text_is_not_parsed(self, text):
+        with patch("springfield.base.sanitization.JustHTML") as mock_justhtml:
+            assert sanitize_html(text, {"a"}, {}) == text
+            assert strip_all_tags(text) == text
+        mock_justhtml.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("a > b", "a &gt; b"),
+            ("a & b", "a &amp; b"),
+            ("a\r\nb", "a\nb"),
+            ("a\x00b", "ab"),
+            ("\ufeffbom", "bom"),
+        ],
+    )
+    def test_text_the_parser_changes_is_parsed(self, text, expected):
+        assert sanitize_html(text, {"a"}, {}) == expected
+        assert strip_all_tags(text) == expected
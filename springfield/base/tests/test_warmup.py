@@ -0,0 +1,91 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
+
+from django.test import override_settings
+
+from springfield.base import warmup
+from springfield.base.tests import TestCase
+
+patch_steps = patch.multiple(
+    warmup,
+    load_fluent_strings=DEFAULT,
+    load_download_urls=DEFAULT,
+    load_l10n_media_index=DEFAULT,
+    render_pages=DEFAULT,
+    store_qrcodes=DEFAULT,
+)
+
+
+class TestWarmUp(TestCase):
+    @override_settings(WARMUP_PATHS=["/", "/download/all/"], WARMUP_LOCALES=["en-US", "de"], WARMUP_QRCODES=True)
+    @patch_steps
+    def test_runs_every_step(self, load_fluent_strings, load_download_urls, load_l10n_media_index, render_pages, store_qrcodes):
+        application = Mock()
+        warmup.warm_up(application, host="example.com")
+        load_fluent_strings.assert_called_once_with()
+        load_download_urls.assert_called_once_with()
+        load_l10n_media_index.assert_called_once_with()
+        render_pages.assert_called_once_with(application, ["/", "/download/all/"], ["en-US", "de"], "example.com")
+        store_qrcodes.assert_called_once_with()
+
+    @override_settings(WARMUP_QRCODES=False)
+    @patch_steps
+    def test_qrcodes_disabled(self, load_fluent_strings, load_download_urls, load_l10n_media_index, render_pages, store_qrcodes):
+        warmup.warm_up(Mock(), paths=[], locales=[], host="example.com")
+        render_pages.assert_called_once()
+        store_qrcodes.assert_not_called()
+
+    @patch_steps
+    def test_failed_step_does_not_stop_the_others(self, load_fluent_strings, load_download_urls, load_l10n_media_index, render_pages, store_qrcodes):
+        load_fluent_strings.side_effect = OSError
+        with self.assertLogs("springfield.base.warmup", level="ERROR"):
+            warmup.warm_up(Mock(), paths=[], locales=[])
+        load_download_urls.assert_called_once_with()
+        render_pages.assert_called_once()
+
+    def test_load_download_urls(self):
+        with patch("springfield.firefox.firefox_details.firefox_desktop.get_download_index") as get_download_index:
+            warmup.load_download_urls()
+        get_download_index.assert_any_call("firefox_primary_builds", "release")
+
+    def test_render_pages_counts_errors(self):
+        environs = []
+
+        def application(environ, start_response):
+            environs.append(environ)
+            start_response("404 Not Found" if "missing" in environ["PATH_INFO"] else "302 Found", [])
+            return [b""]
+
+        with self.assertLogs("springfield.base.warmup", level="WARNING") as logs:
+            assert warmup.render_pages(application, ["/", "/missing/"], ["en-US", "de"], "example.com") == 2
+
+        assert [environ["PATH_INFO"] for environ in environs] == ["/en-US/", "/en-US/missing/", "/de/", "/de/missing/"]
+        # requested as the server would: over https, with the host
+        assert all(environ["wsgi.url_scheme"] == "https" and environ["HTTP_HOST"] == "example.com" for environ in environs)
+        assert len(logs.records) == 2
+
+    def test_request_path_closes_response(self):
+        response = MagicMock()
+        response.__iter__.return_value = iter([b"page"])
+
+        def application(environ, start_response):
+            start_response("200 OK", [])
+            return response
+
+        assert warmup.request_path(application, "/?x=1", "example.com") == 200
+        response.close.assert_called_once_with()
+
+    @patch("springfield.cms.qrcodes.store_qrcodes", return_value=3)
+    def test_store_qrcodes(self, store_qrcodes):
+        assert warmup.store_qrcodes() == 3
+
+    @override_settings(ALLOWED_HOSTS=[".allizom.org", "www.firefox.com"])
+    def test_default_host(self):
+        assert warmup.default_host() == "www.firefox.com"
+
+    @override_settings(ALLOWED_HOSTS=["*"])
+    def test_default_host_wildcard(self):
+        assert warmup.default_host() == "localhost"
@@ -0,0 +1,135 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Load the data that the first requests to a new web worker would otherwise load.
+
+When WARMUP_ENABLED is set, wsgi/app.py calls warm_up() with the Django WSGI
+application before it returns it, so the worker doesn't accept requests, and the
+readiness probe can't pass, until it's done. Pages are requested through that
+application, as the server would, with environs built by RequestFactory.
+
+Each step is logged with its timing. A step that fails is logged and skipped:
+it only means a slower first request, which is no reason to stop a worker.
+"""
+
+import logging
+from time import perf_counter
+
+from django.conf import settings
+from django.test import RequestFactory
+
+from sentry_sdk import new_scope
+
+log = logging.getLogger(__name__)
+
+
+def default_host():
+    """Return a host name that's allowed by ALLOWED_HOSTS."""
+    for host in settings.ALLOWED_HOSTS:
+        if host and not host.startswith((".", "*")):
+            return host
+
+    return "localhost"
+
+
+def load_fluent_strings():
+    """Load the default Fluent files for every production locale, as render() does."""
+    from lib.l10n_utils.fluent import fluent_l10n
+
+    for locale in settings.PROD_LANGUAGES:
+        fluent_l10n([locale, "en"], settings.FLUENT_DEFAULT_FILES)
+
+
+def load_download_urls():
+    """Build the download URL index of every Firefox channel."""
+    from springfield.firefox.firefox_details import firefox_desktop
+
+    for channel in firefox_desktop.version_map:
+        firefox_desktop.get_download_index("firefox_primary_builds", channel)
+
+
+def load_l10n_media_index():
+    from springfield.firefox.templatetags.misc import get_l10n_media_index
+
+    get_l10n_media_index()
+
+
+def request_path(application, path, host):
+    """Request ``path`` from the WSGI ``application`` and return the status code."""
+    environ = RequestFactory().get(path, secure=True, HTTP_HOST=host).environ
+    status = []
+
+    def start_response(response_status, headers, exc_info=None):
+        status.append(int(response_status.split(" ", 1)[0]))
+
+    response = application(environ, start_response)
+    try:
+        for _chunk in response:
+            pass
+    finally:
+        if hasattr(response, "close"):
+            response.close()
+
+    return status[0]
+
+
+def request_paths(application, paths, host):
+    """Request each path. Return the (path, status code) of each error response.
+
+    Redirects count as warm: they're what a locale without the page gets."""
+    errors = []
+    with new_scope() as scope:
+        # Failures are logged below. Don't also send them to Sentry from every
+        # worker that starts.
+        scope.add_event_processor(lambda event, hint: None)
+        for path in paths:
+            status_code = request_path(application, path, host)
+            if status_code >= 400:
+                errors.append((path, status_code))
+                log.warning("Warming up %s: HTTP %s", path, status_code)
+
+    return errors
+
+
+def render_pages(application, paths, locales, host):
+    """Request each path in each locale. Return the number of error responses."""
+    return len(request_paths(application, [f"/{locale}{path}" for locale in locales for path in paths], host))
+
+
+def store_qrcodes():
+    """Store the QR code of every live CMS page and snippet in this pod's
+    QRCODE_CACHE_PATH, as the generate_qrcodes command does."""
+    from springfield.cms.qrcodes import store_qrcodes
+
+    return store_qrcodes()
+
+
+def warm_up(application, paths=None, locales=None, host=None):
+    """Run every warm-up step for the WSGI ``application`` and return the total
+    number of seconds taken."""
+    paths = settings.WARMUP_PATHS if paths is None else paths
+    locales = settings.WARMUP_LOCALES if locales is None else locales
+    host = host or default_host()
+    steps = [
+        ("Fluent strings", load_fluent_strings),
+        ("download URLs", load_download_urls),
+        ("localized media index", load_l10n_media_index),
+        (f"{len(paths) * len(locales)} pages", lambda: render_pages(application, paths, locales, host)),
+    ]
+    if settings.WARMUP_QRCODES:
+        steps.append(("QR codes", store_qrcodes))
+
+    start = perf_counter()
+    for name, step in steps:
+        step_start = perf_counter()
+        try:
+            step()
+        except Exception:
+            log.exception("Warming up %s failed", name)
+        else:
+            log.info("Warmed up %s in %.2fs", name, perf_counter() - step_start)
+
+    total = perf_counter() - start
+    log.info("Worker warmed up in %.2fs", total)
+    return total
@@ -19,6 +19,17 @@ class CmsConfig(AppConfig):
         # Populate the User Routing signal registry with the v1 signals.
         self._register_routing_signals()
 
+        # Drop the in-memory page-tree and snippet caches whenever they change.
+        self._connect_page_cache_receivers()
+
+    @staticmethod
+    def _connect_page_cache_receivers():
+        """Connect the cache receivers to the models whose changes they follow."""
+        from springfield.cms import page_cache, snippet_cache
+
+        page_cache.connect_receivers()
+        snippet_cache.connect_receivers()
+
     @staticmethod
     def _register_routing_signals():
         """Populate the routing signal registry.
@@ -32,6 +32,7 @@ from lib.l10n_utils.fluent import ftl, ftl_lazy
 from springfield.base.i18n import normalize_language, split_path_and_normalize_language
 from springfield.cms.icon_utils import icon_css_name, icon_value_fn
 from springfield.cms.models.locale import SpringfieldLocale
+from springfield.cms.qrcodes import CMS_QRCODE_BOX_SIZE, CMS_QRCODE_ROUNDED_BOX_SIZE
 from springfield.cms.rich_text import RichTextBlock
 from springfield.cms.views import wagtail_serve_with_locale_fallback
 
@@ -877,6 +878,8 @@ def QRCodeModalButtonBlock(themes=BUTTON_THEMES, **kwargs):
         heading = blocks.CharBlock(label="Modal heading")
         content = blocks.CharBlock(label="Modal caption", required=False)
 
+        qrcode_rounded_fields = {"url": CMS_QRCODE_ROUNDED_BOX_SIZE}
+
         class Meta:
             template = "cms/blocks/qr-code-modal-button.html"
             label = "QR Code Modal Button"
@@ -1483,6 +1486,8 @@ class QRCodeBlock(blocks.StructBlock):
         "This image will be cropped to a square on mobile.",
     )
 
+    qrcode_fields = {"data": CMS_QRCODE_BOX_SIZE}
+
     class Meta:
         label = "QR Code"
         label_format = "QR Code - {data}"
@@ -3307,6 +3312,8 @@ def HomeKitBannerBlock(allow_uitour=False, *args, **kwargs):
             required=False,
         )
 
+        qrcode_fields = {"qr_code": CMS_QRCODE_BOX_SIZE}
+
         class Meta:
             template = "cms/blocks/sections/home-kit-banner.html"
             label = "Home Kit Banner"
@@ -3331,6 +3338,8 @@ class MobileStoreQRCodeBlock(blocks.StructBlock):
         help_text="Image shown on mobile instead of the QR code.",
     )
 
+    qrcode_fields = {"qr_code_data": CMS_QRCODE_BOX_SIZE}
+
     class Meta:
         template = "cms/blocks/sections/mobile-store-qr-code.html"
         label = "Mobile Store Button / QR Code"
@@ -0,0 +1,27 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from springfield.cms.qrcodes import store_qrcodes
+
+
+def count_stored_qrcodes():
+    return sum(1 for _path in Path(settings.QRCODE_CACHE_PATH).glob("*/*.*"))
+
+
+class Command(BaseCommand):
+    help = (
+        "Store the QR codes in the blocks and snippets of live CMS pages in QRCODE_CACHE_PATH "
+        "before a visitor needs them. Web pods do this in their warm-up when WARMUP_QRCODES is set."
+    )
+
+    def handle(self, *args, **options):
+        stored_before = count_stored_qrcodes()
+        found = store_qrcodes()
+        stored = count_stored_qrcodes()
+        self.stdout.write(f"Found {found} QR codes in live pages and snippets. {stored - stored_before} new, {stored} stored.")
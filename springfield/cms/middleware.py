@@ -2,16 +2,14 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import logging
-from collections import defaultdict
 from http import HTTPStatus
 
 from django.conf import settings
 from django.http import HttpResponsePermanentRedirect, HttpResponseRedirect
 from django.utils.translation.trans_real import parse_accept_lang_header
 
-from wagtail.models import Page, Site
-
 from springfield.base.i18n import normalize_language
+from springfield.cms.page_cache import find_live_pages
 from springfield.cms.views import _serve_fallback_page
 
 logger = logging.getLogger(__name__)
@@ -119,61 +117,29 @@ class CMSLocaleFallbackMiddleware:
             if append_slash_needed and _url_path:
                 _url_path += "/"
 
-            # Now try to get hold of all the pages that exist in the CMS for the extracted path
-            # that are also in a locale that is acceptable to the user or maybe the fallback locale.
-            #
-            # We build full Wagtail url_paths by looking up the site root page's
-            # translations for each candidate locale.  This avoids hard-coding
-            # the root slug.
-
-            site = Site.objects.filter(is_default_site=True).select_related("root_page").first()
-            if not site:
-                return response
-
-            root_page = site.root_page
-            # Fetch only (language_code, url_path) for candidate locale roots.
-            locale_root_paths = dict(
-                Page.objects.filter(
-                    translation_key=root_page.translation_key,
-                    locale__language_code__in=ranked_locales,
-                ).values_list("locale__language_code", "url_path")
-            )
-
-            possible_url_path_patterns = []
+            # Now look for live pages in the CMS at the extracted path, in a locale that
+            # is acceptable to the user or maybe the fallback locale. This is a lookup in
+            # an in-memory index of the default site's page tree (keyed on locale and path
+            # relative to that locale's root page), so a burst of 404s costs no queries.
             for locale_code in ranked_locales:
-                root_url_path = locale_root_paths.get(locale_code)
-                if root_url_path:
-                    possible_url_path_patterns.append(f"{root_url_path}{_url_path}")
-
-            cms_pages_with_viable_locales = Page.objects.live().select_related("locale").filter(url_path__in=possible_url_path_patterns)
-
-            if cms_pages_with_viable_locales:
-                # OK, we have some candidate pages with that desired path and at least one
-                # viable locale. Let's try to send the user to their most preferred one.
-
-                # Evaluate the queryset just once, then explore the results in memory
-                lookup = defaultdict(list)
-                for page in cms_pages_with_viable_locales:
-                    lookup[page.locale.language_code].append(page)
-
-                for locale_code in ranked_locales:
-                    if locale_code in lookup:
-                        page_list = lookup[locale_code]
-                        # There _should_ only be one matching for this locale, but let's not assume
-                        if len(page_list) > 1:
-                            logger.warning(f"CMS 404-fallback problem - multiple pages with same path found: {page_list}")
-                        page = page_list[0]  # page_list should be a list of 1 item
-                        target = page.url
-                        if query_string := request.META.get("QUERY_STRING"):
-                            target = f"{target}?{query_string}"
-                        # Pure trailing-slash canonicalisation within the same locale → 301.
-                        # Cross-locale fallbacks remain 302 (Accept-Language dependent).
-                        if append_slash_needed and locale_code == lang_prefix:
-                            return HttpResponsePermanentRedirect(target)
-                        return HttpResponseRedirect(target)
-
-                # Note: we can make this more efficient by leveraging the cached page tree
-                # (once the work to pre-cache the page tree lands)
+                page_list = find_live_pages(locale_code, _url_path)
+                if page_list:
+                    # There _should_ only be one matching for this locale, but let's not assume
+                    if len(page_list) > 1:
+                        logger.warning(f"CMS 404-fallback problem - multiple pages with same path found: {page_list}")
+                    page = page_list[0]  # page_list should be a list of 1 item
+                    target = page.url
+                    if not target or target == request.path:
+                        # The index is briefly stale (e.g. the page was just unpublished on
+                        # the CMS and the DB refresh hasn't reached us). Don't loop the user.
+                        break
+                    if query_string := request.META.get("QUERY_STRING"):
+                        target = f"{target}?{query_string}"
+                    # Pure trailing-slash canonicalisation within the same locale → 301.
+                    # Cross-locale fallbacks remain 302 (Accept-Language dependent).
+                    if append_slash_needed and locale_code == lang_prefix:
+                        return HttpResponsePermanentRedirect(target)
+                    return HttpResponseRedirect(target)
 
         return response
 
@@ -93,6 +93,7 @@ from springfield.cms.blocks import (
 from springfield.cms.fields import LocalizedClusterTaggableManager, StreamField
 from springfield.cms.middleware import mark_locale_fallback_exempt
 from springfield.cms.models.locale import SpringfieldLocale
+from springfield.cms.qrcodes import CMS_QRCODE_BOX_SIZE
 from springfield.cms.rich_text import RichTextBlock, RichTextField
 from springfield.firefox.referral import crypto
 from springfield.firefox.referral.models import FirefoxReferralData
@@ -343,6 +344,8 @@ class QRCodeFloatingSnippetMixin(AbstractSpringfieldCMSPage):
         help_text="Override the default open state of the Floating QR code snippet.",
     )
 
+    qrcode_fields = {"floating_qr_url": CMS_QRCODE_BOX_SIZE}
+
     floating_qr_panels = [
         FieldPanel("show_qr_code_snippet"),
         MultiFieldPanel(
@@ -38,6 +38,7 @@ from springfield.cms.blocks import (
 )
 from springfield.cms.fields import StreamField
 from springfield.cms.models.locale import SpringfieldLocale
+from springfield.cms.qrcodes import CMS_QRCODE_BOX_SIZE
 from springfield.cms.rich_text import RichTextField
 from springfield.cms.templatetags.cms_tags import remove_tags
 
@@ -182,6 +183,8 @@ class BannerSnippet(FluentPreviewableMixin, BaseDraftTranslatableSnippetMixin, m
         FieldPanel("qr_code"),
     ]
 
+    qrcode_fields = {"qr_code": CMS_QRCODE_BOX_SIZE}
+
     class Meta(BaseDraftTranslatableSnippetMixin.Meta):
         verbose_name = "Banner Snippet"
         verbose_name_plural = "Banner Snippets"
@@ -352,6 +355,8 @@ class QRCodeSnippet(FluentPreviewableMixin, BaseDraftTranslatableSnippetMixin, m
         SynchronizedField("qr_code"),
     ]
 
+    qrcode_fields = {"qr_code": CMS_QRCODE_BOX_SIZE}
+
     class Meta(BaseDraftTranslatableSnippetMixin.Meta):
         verbose_name = "QR Code Snippet"
         verbose_name_plural = "QR Code Snippets"
@@ -472,6 +477,8 @@ class QRCodeFloatingSnippet(FluentPreviewableMixin, BaseDraftTranslatableSnippet
 
     override_translatable_fields = [SynchronizedField("url"), SynchronizedField("image")]
 
+    qrcode_fields = {"url": CMS_QRCODE_BOX_SIZE}
+
     class Meta(BaseDraftTranslatableSnippetMixin.Meta):
         verbose_name = "QR Code Floating Snippet"
         verbose_name_plural = "QR Code Floating Snippets"
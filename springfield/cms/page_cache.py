@@ -0,0 +1,180 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Process-local caches of the CMS page tree.
+
+The 404 fallback logic in CMSLocaleFallbackMiddleware needs to know which live
+pages exist at a given path in which locales, and alias-locale routing needs to
+know which locales exist and whether their root pages are live. Asking the
+database for that on every request means vulnerability scanners and alias
+locales generate database load, so instead we build it in memory once and
+throw it away whenever the tree changes.
+
+The locales a page is translated into (its translation group) are cached per
+translation_key for the language picker.
+
+Entries are dropped by the signal receivers below, connected by connect_receivers(),
+when pages are saved, published, unpublished, moved or deleted, or when a Site or
+Locale changes.
+Web pods get their content from a periodically downloaded database rather
+than from publishing, so entries also expire after CMS_PAGE_CACHE_TIMEOUT.
+"""
+
+import logging
+from collections import defaultdict, namedtuple
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+
+from wagtail.models import Locale, Page, Site, get_page_models
+from wagtail.signals import page_published, page_unpublished, post_page_move
+
+logger = logging.getLogger(__name__)
+
+PAGE_TREE_INDEX_CACHE_KEY = "cms:page-tree-index"
+LOCALE_TOPOLOGY_CACHE_KEY = "cms:locale-topology"
+
+# language_codes: every Locale with a DB record.
+# root_pages: language_code -> LocaleRoot for each translation of the default site's
+# root page, or None if there is no default site.
+LocaleTopology = namedtuple("LocaleTopology", ["language_codes", "root_pages"])
+LocaleRoot = namedtuple("LocaleRoot", ["id", "url_path", "live"])
+
+TRANSLATION_GROUP_CACHE_KEY = "cms:translation-group:{}"
+TranslationGroupMember = namedtuple("TranslationGroupMember", ["id", "language_code", "live", "alias_of_id"])
+
+
+def build_page_tree_index():
+    """Return a dict of ``(language_code, sub_path)`` -> list of live pages for
+    the default site.
+
+    ``sub_path`` is the page's ``url_path`` relative to the root page translation
+    for its locale, e.g. ``"test-page/child-page/"``, or ``""`` for the locale
+    root itself. There should only be one page per key, but we don't assume it.
+    """
+    site = Site.objects.filter(is_default_site=True).select_related("root_page").first()
+    if not site:
+        return {}
+
+    locale_root_paths = dict(
+        Page.objects.filter(
+            translation_key=site.root_page.translation_key,
+        ).values_list("locale_id", "url_path")
+    )
+    if not locale_root_paths:
+        return {}
+
+    pages = (
+        Page.objects.live()
+        .filter(reduce(or_, (Q(url_path__startswith=root_url_path) for root_url_path in locale_root_paths.values())))
+        .select_related("locale")
+        .only("title", "url_path", "locale__language_code")
+        .order_by("path")
+    )
+
+    index = defaultdict(list)
+    for page in pages:
+        root_url_path = locale_root_paths.get(page.locale_id)
+        if root_url_path and page.url_path.startswith(root_url_path):
+            index[(page.locale.language_code, page.url_path[len(root_url_path) :])].append(page)
+
+    return dict(index)
+
+
+def get_page_tree_index():
+    """Return the cached page-tree index, building it if needed."""
+    index = cache.get(PAGE_TREE_INDEX_CACHE_KEY)
+    if index is None:
+        index = build_page_tree_index()
+        cache.set(PAGE_TREE_INDEX_CACHE_KEY, index, settings.CMS_PAGE_CACHE_TIMEOUT)
+
+    return index
+
+
+def find_live_pages(language_code, sub_path):
+    """Return the live pages at ``sub_path`` under the default site's root for
+    ``language_code``, without touching the database when the index is warm."""
+    return get_page_tree_index().get((language_code, sub_path), [])
+
+
+def build_locale_topology():
+    """Return the LocaleTopology of the default site."""
+    language_codes = frozenset(Locale.objects.values_list("language_code", flat=True))
+
+    site = Site.objects.filter(is_default_site=True).select_related("root_page").first()
+    if not site:
+        return LocaleTopology(language_codes, None)
+
+    root_pages = {
+        language_code: LocaleRoot(page_id, url_path, live)
+        for language_code, page_id, url_path, live in Page.objects.filter(
+            translation_key=site.root_page.translation_key,
+        ).values_list("locale__language_code", "id", "url_path", "live")
+    }
+    return LocaleTopology(language_codes, root_pages)
+
+
+def get_locale_topology():
+    """Return the cached LocaleTopology, building it if needed."""
+    topology = cache.get(LOCALE_TOPOLOGY_CACHE_KEY)
+    if topology is None:
+        topology = build_locale_topology()
+        cache.set(LOCALE_TOPOLOGY_CACHE_KEY, topology, settings.CMS_PAGE_CACHE_TIMEOUT)
+
+    return topology
+
+
+def get_translation_group(translation_key):
+    """Return a tuple of TranslationGroupMember, one for each page (including
+    drafts and aliases) that shares ``translation_key``, from a single query."""
+    cache_key = TRANSLATION_GROUP_CACHE_KEY.format(translation_key)
+    group = cache.get(cache_key)
+    if group is None:
+        group = tuple(
+            TranslationGroupMember(*values)
+            for values in Page.objects.filter(translation_key=translation_key).values_list("id", "locale__language_code", "live", "alias_of_id")
+        )
+        cache.set(cache_key, group, settings.CMS_PAGE_CACHE_TIMEOUT)
+
+    return group
+
+
+def clear_page_caches(translation_key=None):
+    keys = [PAGE_TREE_INDEX_CACHE_KEY, LOCALE_TOPOLOGY_CACHE_KEY]
+    if translation_key:
+        keys.append(TRANSLATION_GROUP_CACHE_KEY.format(translation_key))
+    cache.delete_many(keys)
+
+
+def _clear_page_caches_now_and_on_commit(translation_key=None):
+    # Clear straight away for this thread, and again once the change is visible
+    # to other connections, so a rebuild that raced the transaction isn't kept.
+    clear_page_caches(translation_key)
+    transaction.on_commit(lambda: clear_page_caches(translation_key))
+
+
+def clear_page_caches_on_page_change(sender, instance, **kwargs):
+    _clear_page_caches_now_and_on_commit(instance.translation_key)
+
+
+def clear_page_caches_on_site_change(sender, instance, **kwargs):
+    _clear_page_caches_now_and_on_commit()
+
+
+def connect_receivers():
+    """Connect the receivers that drop the caches when pages, sites or locales
+    change. Called by CmsConfig.ready(), once every page model is registered."""
+    for signal in (post_save, post_delete):
+        for model in get_page_models():
+            signal.connect(clear_page_caches_on_page_change, sender=model)
+        for model in (Site, Locale):
+            signal.connect(clear_page_caches_on_site_change, sender=model)
+
+    for signal in (page_published, page_unpublished, post_page_move):
+        signal.connect(clear_page_caches_on_page_change)
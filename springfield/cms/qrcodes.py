@@ -0,0 +1,76 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Find the QR codes shown by live CMS pages and snippets, so that they can be
+stored in QRCODE_CACHE_PATH before a visitor asks for one.
+
+Blocks and models list the fields whose values their templates pass to qrcode()
+and qrcode_rounded() in ``qrcode_fields`` and ``qrcode_rounded_fields``, each a
+dict of field name to box size. The same data at another box size is another QR
+code, so the attributes and the templates both use the box sizes below, which
+are Jinja globals.
+"""
+
+from wagtail import blocks
+from wagtail.fields import StreamField
+from wagtail.models import DraftStateMixin, Page
+from wagtail.snippets.models import get_snippet_models
+
+from springfield.base.templatetags.qrcode import qrcode, qrcode_rounded
+
+CMS_QRCODE_BOX_SIZE = 12
+CMS_QRCODE_ROUNDED_BOX_SIZE = 20
+
+
+def _field_qrcodes(obj, get_value):
+    for render, fields in ((qrcode, "qrcode_fields"), (qrcode_rounded, "qrcode_rounded_fields")):
+        for name, box_size in getattr(obj, fields, {}).items():
+            if data := get_value(name):
+                yield render, data, box_size
+
+
+def iter_block_qrcodes(block, value):
+    """Yield a (function, data, box_size) for each QR code in ``value`` and its children."""
+    if value is None:
+        return
+
+    if isinstance(block, blocks.StreamBlock):
+        for child in value:
+            yield from iter_block_qrcodes(child.block, child.value)
+    elif isinstance(block, blocks.ListBlock):
+        for item in value:
+            yield from iter_block_qrcodes(block.child_block, item)
+    elif isinstance(block, blocks.StructBlock):
+        yield from _field_qrcodes(block, value.get)
+        for name, child_block in block.child_blocks.items():
+            yield from iter_block_qrcodes(child_block, value.get(name))
+
+
+def iter_instance_qrcodes(instance):
+    """Yield a (function, data, box_size) for each QR code in a page or snippet."""
+    yield from _field_qrcodes(instance, lambda name: getattr(instance, name))
+    for field in instance._meta.get_fields():
+        if isinstance(field, StreamField):
+            yield from iter_block_qrcodes(field.stream_block, getattr(instance, field.name))
+
+
+def iter_qrcodes():
+    """Yield a (function, data, box_size) for each QR code in every live page and snippet."""
+    for page in Page.objects.live().specific().iterator():
+        yield from iter_instance_qrcodes(page)
+
+    for model in get_snippet_models():
+        snippets = model.objects.filter(live=True) if issubclass(model, DraftStateMixin) else model.objects.all()
+        for snippet in snippets.iterator():
+            yield from iter_instance_qrcodes(snippet)
+
+
+def store_qrcodes():
+    """Render each QR code of the live pages and snippets that isn't stored yet.
+    Return the number of distinct QR codes."""
+    qrcodes = set(iter_qrcodes())
+    for render, data, box_size in qrcodes:
+        render(data, box_size)
+
+    return len(qrcodes)
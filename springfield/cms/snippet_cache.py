@@ -0,0 +1,88 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Process-local cache of the snippets shown around every CMS page.
+
+The template globals in springfield.cms.templatetags.cms_tags look up the default
+navigation, the pre-footer CTAs and the QR code snippets for the page's locale on
+every render, but those only change when an editor publishes or unpublishes one.
+So the result of each lookup (including "there isn't one") is cached per snippet
+and language code.
+
+Every entry's key includes a generation, and the signal receivers below, connected
+by connect_receivers(), start a new generation whenever one of these snippets or a
+Locale changes, which drops them all at once. As in page_cache, entries also expire
+after CMS_PAGE_CACHE_TIMEOUT because web pods get new content without any signals.
+"""
+
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from wagtail.models import Locale
+from wagtail.signals import published, unpublished
+
+SNIPPET_CACHE_GENERATION_KEY = "cms:snippet-generation"
+SNIPPET_CACHE_KEY = "cms:snippet:{}:{}:{}"
+
+
+def _generation():
+    generation = cache.get(SNIPPET_CACHE_GENERATION_KEY)
+    if generation is None:
+        generation = uuid4().hex
+        # add() so that concurrent requests agree on one generation
+        if not cache.add(SNIPPET_CACHE_GENERATION_KEY, generation, None):
+            generation = cache.get(SNIPPET_CACHE_GENERATION_KEY, generation)
+
+    return generation
+
+
+def get_cached_snippet(name, language_code, load):
+    """Return the result of ``load()``, cached as the ``name`` snippet for
+    ``language_code``. A result of None is cached too."""
+    key = SNIPPET_CACHE_KEY.format(_generation(), name, language_code)
+    cached = cache.get(key)
+    if cached is None:
+        # wrapped in a tuple so that a missing snippet is a cache hit
+        cached = (load(),)
+        cache.set(key, cached, settings.CMS_PAGE_CACHE_TIMEOUT)
+
+    return cached[0]
+
+
+def clear_snippet_caches():
+    cache.delete(SNIPPET_CACHE_GENERATION_KEY)
+
+
+def _clear_snippet_caches_now_and_on_commit():
+    # Clear straight away for this thread, and again once the change is visible
+    # to other connections, so a lookup that raced the transaction isn't kept.
+    clear_snippet_caches()
+    transaction.on_commit(clear_snippet_caches)
+
+
+def clear_snippet_caches_on_change(sender, instance, **kwargs):
+    _clear_snippet_caches_now_and_on_commit()
+
+
+def connect_receivers():
+    """Connect the receivers that start a new generation when a cached snippet
+    or a Locale changes. Called by CmsConfig.ready()."""
+    from springfield.cms.models.snippets import (  # circular import
+        NavigationSnippet,
+        PreFooterCTAFormSnippet,
+        PreFooterCTASnippet,
+        QRCodeFloatingSnippet,
+        QRCodeSnippet,
+    )
+
+    for model in (NavigationSnippet, PreFooterCTAFormSnippet, PreFooterCTASnippet, QRCodeFloatingSnippet, QRCodeSnippet):
+        for signal in (post_save, post_delete, published, unpublished):
+            signal.connect(clear_snippet_caches_on_change, sender=model)
+
+    for signal in (post_save, post_delete):
+        signal.connect(clear_snippet_caches_on_change, sender=Locale)
@@ -8,6 +8,7 @@ from types import SimpleNamespace
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 from django.conf import settings
+from django.utils import translation
 from django.utils.safestring import mark_safe
 
 import markdown
@@ -18,6 +19,7 @@ from wagtail.rich_text import RichText
 from wagtail.templatetags.wagtailcore_tags import richtext as wagtail_richtext
 
 from springfield.cms.models.pages import BASE_UTM_PARAMETERS
+from springfield.cms.snippet_cache import get_cached_snippet
 from springfield.firefox.templatetags.misc import fxa_button
 
 
@@ -289,7 +291,7 @@ def get_pre_footer_cta_snippet(context):
         locale = context["self"].locale
 
     if locale:
-        return PreFooterCTASnippet.objects.filter(locale=locale).live().first()
+        return get_cached_snippet("pre-footer-cta", locale.language_code, lambda: PreFooterCTASnippet.objects.filter(locale=locale).live().first())
 
     return None
 
@@ -325,7 +327,11 @@ def get_pre_footer_cta_form_snippet(context):
         locale = context["self"].locale
 
     if locale:
-        return PreFooterCTAFormSnippet.objects.filter(locale=locale).live().first()
+        return get_cached_snippet(
+            "pre-footer-cta-form",
+            locale.language_code,
+            lambda: PreFooterCTAFormSnippet.objects.filter(locale=locale).live().first(),
+        )
 
     return None
 
@@ -353,7 +359,7 @@ def get_qr_code_snippet(context):
         locale = context["self"].locale
 
     if locale:
-        return QRCodeSnippet.objects.filter(locale=locale).live().first()
+        return get_cached_snippet("qr-code", locale.language_code, lambda: QRCodeSnippet.objects.filter(locale=locale).live().first())
 
     return None
 
@@ -363,7 +369,8 @@ def get_default_navigation():
     """Return the site default navigation snippet for the active locale, or None."""
     from springfield.cms.models.snippets import NavigationSnippet  # circular import
 
-    return NavigationSnippet.get_default()
+    # get_default() looks up the active locale, so cache it by the active language.
+    return get_cached_snippet("navigation", translation.get_language(), NavigationSnippet.get_default)
 
 
 @pass_context
@@ -392,7 +399,8 @@ def get_floating_qr_code_snippet(context):
         locale = context["self"].locale
 
     if locale:
-        snippet = QRCodeFloatingSnippet.get_live(locale)
+        # Only the snippet is cached: the rendered context depends on the page and request.
+        snippet = get_cached_snippet("qr-code-floating", locale.language_code, lambda: QRCodeFloatingSnippet.get_live(locale))
         if snippet:
             return snippet.build_context(page=page, request=context.get("request"))
 
@@ -9,14 +9,16 @@ from unittest.mock import call, patch
 
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
 from django.core.management import call_command
-from django.test import TestCase, TransactionTestCase
+from django.test import TestCase, TransactionTestCase, override_settings
 
 import everett
 import pytest
 from wagtail.models import Page
 from wagtail_localize.models import StringTranslation, Translation, TranslationSource
 
+from springfield.base.templatetags.qrcode import qrcode, qrcode_rounded
 from springfield.cms import icon_utils
 from springfield.cms.fixtures.registry import PAGE_FIXTURES
 from springfield.cms.management.commands.create_pretranslated_phrases import PHRASES
@@ -718,3 +720,26 @@ def test_load_page_fixtures_loads_registry_pages():
     for fixture in PAGE_FIXTURES:
         fixture()
     assert Page.objects.count() == page_count
+
+
+class TestGenerateQRCodesCommand(TestCase):
+    def setUp(self):
+        caches["qrcode"].clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_stores_each_qrcode_once(self):
+        found = [(qrcode, "https://www.firefox.com/", 12), (qrcode, "https://www.firefox.com/", 12), (qrcode_rounded, "https://www.firefox.com/", 20)]
+        out = StringIO()
+        with (
+            override_settings(QRCODE_CACHE_PATH=self.tmp.name),
+            patch("springfield.cms.qrcodes.iter_qrcodes", return_value=found),
+        ):
+            call_command("generate_qrcodes", stdout=out)
+            caches["qrcode"].clear()
+            call_command("generate_qrcodes", stdout=out)
+
+        assert out.getvalue().splitlines() == [
+            "Found 2 QR codes in live pages and snippets. 2 new, 2 stored.",
+            "Found 2 QR codes in live pages and snippets. 0 new, 2 stored.",
+        ]
@@ -632,3 +632,48 @@ def test_CMSLocaleFallbackMiddleware_respects_the_locale_fallback_exemption(rf):
 
     assert response.status_code == 404
     assert "Location" not in response
+
+
+# ---------------------------------------------------------------------------
+# In-memory page-tree index
+# ---------------------------------------------------------------------------
+
+
+def test_CMSLocaleFallbackMiddleware_uses_no_queries_once_the_index_is_warm(
+    rf,
+    tiny_localized_site,
+    django_assert_num_queries,
+):
+    middleware = CMSLocaleFallbackMiddleware(get_response=get_404_response)
+    # warm up the index (and Wagtail's site root paths, used by page.url)
+    middleware(rf.get("/de/test-page/child-page/", HTTP_ACCEPT_LANGUAGE="fr"))
+
+    with django_assert_num_queries(0):
+        response = middleware(rf.get("/de/test-page/child-page/", HTTP_ACCEPT_LANGUAGE="fr"))
+        assert response.status_code == 302
+        assert response.headers["Location"] == "/fr/test-page/child-page/"
+
+        # the sort of thing vulnerability scanners ask for
+        for path in ["/en-US/.env", "/de/wp-admin/setup-config.php", "/cgi-bin/luci/"]:
+            assert middleware(rf.get(path)).status_code == 404
+
+
+def test_CMSLocaleFallbackMiddleware_index_is_refreshed_on_publish(
+    rf,
+    tiny_localized_site,
+):
+    middleware = CMSLocaleFallbackMiddleware(get_response=get_404_response)
+    request = rf.get("/de/test-page/new-page/", HTTP_ACCEPT_LANGUAGE="fr")
+    assert middleware(request).status_code == 404
+
+    parent = Page.objects.get(locale__language_code="fr", slug="test-page")
+    new_page = SimpleRichTextPageFactory(slug="new-page", parent=parent, live=False)
+    new_page.save_revision().publish()
+
+    response = middleware(request)
+    assert response.status_code == 302
+    assert response.headers["Location"] == "/fr/test-page/new-page/"
+
+    new_page.refresh_from_db()
+    new_page.unpublish()
+    assert middleware(request).status_code == 404
@@ -0,0 +1,28 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+
+import pytest
+from wagtail.models import Locale, Page
+
+from springfield.cms.tests.factories import SimpleRichTextPageFactory
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_page_caches_cleared_only_by_pages_sites_and_locales():
+    root = Page.get_first_root_node()
+    with patch("springfield.cms.page_cache._clear_page_caches_now_and_on_commit") as clear_mock:
+        get_user_model().objects.create_user(username="editor")
+        clear_mock.assert_not_called()
+
+        page = SimpleRichTextPageFactory(parent=root, slug="cached-page")
+        clear_mock.assert_any_call(page.translation_key)
+
+        clear_mock.reset_mock()
+        Locale.get_default().save()
+        clear_mock.assert_called_once_with()
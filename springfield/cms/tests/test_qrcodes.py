@@ -0,0 +1,69 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import re
+from pathlib import Path
+
+import pytest
+from wagtail import blocks
+
+from springfield.base.templatetags.qrcode import qrcode, qrcode_rounded
+from springfield.cms.blocks import QRCodeBlock, QRCodeModalButtonBlock
+from springfield.cms.fixtures.freeformpage import get_mobile_store_qr_code, get_mobile_store_qr_code_test_page
+from springfield.cms.fixtures.snippet_fixtures import get_floating_qr_code_snippet, get_qr_code_snippet
+from springfield.cms.models import QRCodeFloatingSnippet
+from springfield.cms.qrcodes import CMS_QRCODE_BOX_SIZE, CMS_QRCODE_ROUNDED_BOX_SIZE, iter_block_qrcodes, iter_qrcodes
+
+
+def test_iter_block_qrcodes_finds_nested_blocks():
+    block = blocks.StreamBlock(
+        [
+            ("section", blocks.StructBlock([("codes", blocks.ListBlock(QRCodeBlock()))])),
+            ("button", QRCodeModalButtonBlock()),
+        ]
+    )
+    value = block.to_python(
+        [
+            {"type": "section", "value": {"codes": [{"data": "https://www.firefox.com/one/"}, {"data": "https://www.firefox.com/two/"}]}},
+            {"type": "button", "value": {"url": "https://www.firefox.com/three/", "heading": "Scan"}},
+        ]
+    )
+
+    assert list(iter_block_qrcodes(block, value)) == [
+        (qrcode, "https://www.firefox.com/one/", CMS_QRCODE_BOX_SIZE),
+        (qrcode, "https://www.firefox.com/two/", CMS_QRCODE_BOX_SIZE),
+        (qrcode_rounded, "https://www.firefox.com/three/", CMS_QRCODE_ROUNDED_BOX_SIZE),
+    ]
+
+
+def test_iter_block_qrcodes_skips_empty_data():
+    block = blocks.ListBlock(QRCodeBlock())
+    assert list(iter_block_qrcodes(block, block.to_python([{"data": ""}]))) == []
+
+
+@pytest.mark.django_db
+def test_iter_qrcodes_live_pages_and_snippets(index_page, placeholder_images):
+    get_mobile_store_qr_code_test_page()
+    get_qr_code_snippet()
+    get_floating_qr_code_snippet()
+    QRCodeFloatingSnippet.objects.update(live=False, url="https://www.firefox.com/draft/")
+
+    qrcodes = set(iter_qrcodes())
+
+    assert (qrcode, get_mobile_store_qr_code()["value"]["qr_code_data"], CMS_QRCODE_BOX_SIZE) in qrcodes
+    assert (qrcode, "https://www.firefox.com/browsers/mobile/", CMS_QRCODE_BOX_SIZE) in qrcodes
+    assert not any(data == "https://www.firefox.com/draft/" for _render, data, _box_size in qrcodes)
+
+
+def test_cms_templates_use_the_pregenerated_box_sizes():
+    """QR codes are only pre-generated at the CMS box sizes, so the templates
+    mustn't pass another size for anything that is stored."""
+    calls = re.compile(r"\b(qrcode(?:_rounded)?)\(([^)]*)\)")
+    sizes = {"qrcode": "CMS_QRCODE_BOX_SIZE", "qrcode_rounded": "CMS_QRCODE_ROUNDED_BOX_SIZE"}
+    templates = Path(__file__).parents[1] / "templates"
+    for template in templates.rglob("*.html"):
+        for name, args in calls.findall(template.read_text()):
+            args = [arg.strip() for arg in args.split(",")]
+            if "persist=False" not in args:
+                assert args[1:] == [sizes[name]], f"{template}: {name}({', '.join(args)})"
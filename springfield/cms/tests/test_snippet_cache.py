@@ -0,0 +1,119 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import types
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import translation
+
+import pytest
+from wagtail.models import Locale
+
+from springfield.cms.fixtures.snippet_fixtures import get_floating_qr_code_snippet, get_qr_code_snippet
+from springfield.cms.models.snippets import QRCodeSnippet
+from springfield.cms.snippet_cache import clear_snippet_caches, get_cached_snippet
+from springfield.cms.templatetags import cms_tags
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def en_us_context(minimal_site):
+    return {"page": types.SimpleNamespace(locale=Locale.objects.get(language_code="en-US"))}
+
+
+def test_get_cached_snippet_loads_once_per_language():
+    calls = []
+
+    def load():
+        calls.append(1)
+        return "snippet"
+
+    assert get_cached_snippet("test", "en-US", load) == "snippet"
+    assert get_cached_snippet("test", "en-US", load) == "snippet"
+    assert len(calls) == 1
+
+    get_cached_snippet("test", "de", load)
+    assert len(calls) == 2
+
+    clear_snippet_caches()
+    get_cached_snippet("test", "en-US", load)
+    assert len(calls) == 3
+
+
+def test_get_cached_snippet_caches_none():
+    calls = []
+
+    def load():
+        calls.append(1)
+
+    assert get_cached_snippet("test", "en-US", load) is None
+    assert get_cached_snippet("test", "en-US", load) is None
+    assert len(calls) == 1
+
+
+def test_qr_code_snippet_lookup_is_cached(en_us_context, django_assert_num_queries):
+    snippet = get_qr_code_snippet()
+    assert cms_tags.get_qr_code_snippet(en_us_context) == snippet
+
+    with django_assert_num_queries(0):
+        assert cms_tags.get_qr_code_snippet(en_us_context) == snippet
+
+
+def test_qr_code_snippet_cache_cleared_on_unpublish_and_publish(en_us_context):
+    snippet = get_qr_code_snippet()
+    assert cms_tags.get_qr_code_snippet(en_us_context) == snippet
+
+    snippet.unpublish()
+    assert cms_tags.get_qr_code_snippet(en_us_context) is None
+
+    snippet.save_revision().publish()
+    assert cms_tags.get_qr_code_snippet(en_us_context) == snippet
+
+
+def test_qr_code_snippet_cache_cleared_on_delete(en_us_context):
+    get_qr_code_snippet()
+    assert cms_tags.get_qr_code_snippet(en_us_context) is not None
+
+    QRCodeSnippet.objects.all().delete()
+    assert cms_tags.get_qr_code_snippet(en_us_context) is None
+
+
+def test_snippet_cache_not_cleared_by_other_models(en_us_context):
+    snippet = get_qr_code_snippet()
+    with patch("springfield.cms.snippet_cache._clear_snippet_caches_now_and_on_commit") as clear_mock:
+        get_user_model().objects.create_user(username="editor")
+        clear_mock.assert_not_called()
+
+        snippet.save()
+        clear_mock.assert_called_once_with()
+
+
+def test_floating_qr_code_context_is_built_per_request(en_us_context, django_assert_num_queries):
+    get_floating_qr_code_snippet()
+    assert cms_tags.get_floating_qr_code_snippet(en_us_context)["qr"] is not None
+
+    page = types.SimpleNamespace(
+        locale=en_us_context["page"].locale,
+        floating_qr_url="https://override.example.com",
+        floating_qr_image=None,
+        floating_qr_default_open=None,
+    )
+    with django_assert_num_queries(0):
+        result = cms_tags.get_floating_qr_code_snippet({"page": page})
+    assert result["qr"]["value"] == "https://override.example.com"
+
+
+def test_default_navigation_cached_per_active_language(minimal_site, django_assert_num_queries):
+    with translation.override("en-US"):
+        assert cms_tags.get_default_navigation() is None
+        with django_assert_num_queries(0):
+            assert cms_tags.get_default_navigation() is None
+
+    with translation.override("de"), CaptureQueriesContext(connection) as queries:
+        cms_tags.get_default_navigation()
+    assert len(queries), "Another language should not use the en-US entry"
@@ -16,6 +16,7 @@ from springfield.cms.utils import (
     get_locales_for_cms_page,
     get_page_for_request,
 )
+from springfield.cms.views import _alias_needs_prewagtail_intercept
 
 pytestmark = [pytest.mark.django_db]
 
@@ -67,6 +68,27 @@ def test_get_locales_for_cms_page__ensure_draft_pages_are_excluded(tiny_localize
     assert sorted(get_locales_for_cms_page(en_us_test_page)) == ["en-US", "pt-BR"]
 
 
+@override_settings(FALLBACK_LOCALES={})
+def test_get_locales_for_cms_page__query_bounded_and_refreshed_on_publish(tiny_localized_site, django_assert_num_queries):
+    en_us_homepage = Page.objects.get(locale__language_code="en-US", slug="home")
+    en_us_test_page = en_us_homepage.get_children()[0]
+    fr_test_page = Page.objects.get(locale__language_code="fr", slug="test-page")
+
+    # one query for the whole translation group, whatever its size...
+    with django_assert_num_queries(1):
+        assert sorted(get_locales_for_cms_page(en_us_test_page)) == ["en-US", "fr", "pt-BR"]
+
+    # ...which is shared by the other pages in it
+    with django_assert_num_queries(0):
+        assert sorted(get_locales_for_cms_page(fr_test_page)) == ["en-US", "fr", "pt-BR"]
+
+    fr_test_page.unpublish()
+    assert sorted(get_locales_for_cms_page(en_us_test_page)) == ["en-US", "pt-BR"]
+
+    fr_test_page.specific.save_revision().publish()
+    assert sorted(get_locales_for_cms_page(en_us_test_page)) == ["en-US", "fr", "pt-BR"]
+
+
 @override_settings(FALLBACK_LOCALES={"es-AR": "es-MX"})
 def test_get_locales_for_cms_page__no_alias_added_when_no_target_matches(tiny_localized_site):
     """Test when no FALLBACK_LOCALES entries match a locale in the page's translation set."""
@@ -389,6 +411,52 @@ def test_find_fallback_page_for_locale__returns_none_when_fallback_locales_absen
     assert find_fallback_page_for_locale("pt-PT", "test-page/") is None
 
 
+@override_settings(FALLBACK_LOCALES={"pt-PT": "pt-BR"})
+def test_find_fallback_page_for_locale__only_queries_for_the_page_once_warm(tiny_localized_site, django_assert_num_queries):
+    """The locale and root page lookups are cached; only the page itself is fetched."""
+    expected_result = Page.objects.get(locale__language_code="pt-BR", slug="test-page")
+    find_fallback_page_for_locale("pt-PT", "test-page/")
+
+    with django_assert_num_queries(1):
+        assert find_fallback_page_for_locale("pt-PT", "test-page/") == expected_result
+
+
+@override_settings(FALLBACK_LOCALES={"es-AR": "es-MX"})
+def test_find_fallback_page_for_locale__sees_new_locale_and_root_page(tiny_localized_site):
+    """Creating the fallback locale and its root page invalidates the cached topology."""
+    assert find_fallback_page_for_locale("es-AR", "") is None
+
+    es_mx_locale = LocaleFactory(language_code="es-MX")
+    site = Site.objects.get(is_default_site=True)
+    es_mx_root = site.root_page.copy_for_translation(es_mx_locale)
+    es_mx_root.live = True
+    es_mx_root.save()
+
+    assert find_fallback_page_for_locale("es-AR", "") == es_mx_root
+
+
+@override_settings(FALLBACK_LOCALES={"pt-PT": "pt-BR"})
+def test_alias_needs_prewagtail_intercept(tiny_localized_site, django_assert_num_queries):
+    # no pt-PT Locale record
+    assert _alias_needs_prewagtail_intercept("pt-PT") is True
+    # not an alias locale
+    assert _alias_needs_prewagtail_intercept("fr") is False
+
+    pt_pt_locale = LocaleFactory(language_code="pt-PT")
+    site = Site.objects.get(is_default_site=True)
+    pt_pt_root = site.root_page.copy_for_translation(pt_pt_locale)
+    # pt-PT root page is not live
+    assert _alias_needs_prewagtail_intercept("pt-PT") is True
+
+    pt_pt_root.live = True
+    pt_pt_root.save()
+    assert _alias_needs_prewagtail_intercept("pt-PT") is False
+
+    # answered from memory once warm
+    with django_assert_num_queries(0):
+        assert _alias_needs_prewagtail_intercept("pt-PT") is False
+
+
 @pytest.mark.parametrize(
     "path, expected_page_url",
     [
@@ -5,12 +5,12 @@ import logging
 
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Subquery
 from django.http import Http404
 
-from wagtail.models import Locale, Page, Site
+from wagtail.models import Locale, Page
 
 from springfield.base.i18n import split_path_and_normalize_language
+from springfield.cms.page_cache import get_locale_topology, get_translation_group
 
 logger = logging.getLogger(__name__)
 
@@ -47,26 +47,25 @@ def find_fallback_page_for_locale(locale_code, url_path):
     if not fallback_locale_code:
         return None
 
-    try:
-        fallback_locale = Locale.objects.get(language_code=fallback_locale_code)
-    except Locale.DoesNotExist:
+    # Which locales exist and where their root pages are only changes on publish,
+    # so that comes from memory rather than three queries per request.
+    topology = get_locale_topology()
+    if fallback_locale_code not in topology.language_codes:
         return None
 
     # Resolve the locale root page via the default site — avoids hard-coding slug conventions.
-    site = Site.objects.filter(is_default_site=True).select_related("root_page").first()
-    if not site:
+    if topology.root_pages is None:
         return None
-    try:
-        locale_root = site.root_page.get_translation(fallback_locale)
-    except Page.DoesNotExist:
-        logger.exception("No root page translation found for fallback locale %r", fallback_locale_code)
+    locale_root = topology.root_pages.get(fallback_locale_code)
+    if not locale_root:
+        logger.error("No root page translation found for fallback locale %r", fallback_locale_code)
         return None
 
     # Normalize here; caller passes raw sub_path to avoid double normalization.
     _url_path = url_path.strip("/")
     if not _url_path:
         # Homepage request: return the locale root page itself (if live).
-        return locale_root if locale_root.live else None
+        return Page.objects.live().filter(id=locale_root.id).first() if locale_root.live else None
     full_url_path = f"{locale_root.url_path}{_url_path}/"
 
     return Page.objects.live().filter(url_path=full_url_path).first()
@@ -79,21 +78,16 @@ def compute_cms_page_locales(page):
     all_locales: content_locales + alias locales from FALLBACK_LOCALES.
     content_locales: locales with real translated content (no alias expansion).
     """
-    content_locales = [page.locale.language_code]
-    try:
-        _actual_translations = (
-            page.get_translations()
-            .live()
-            .exclude(
-                id__in=Subquery(
-                    page.aliases.all().values_list("id", flat=True),
-                )
-            )
-        )
-        content_locales += [x.locale.language_code for x in _actual_translations]
-    except ValueError:
-        # when there's no draft and no potential for aliases, etc, the above lookup will fail
-        pass
+    if page.pk is None:
+        # e.g. previewing a page that hasn't been saved yet: no translations or aliases
+        content_locales = [page.locale.language_code]
+    else:
+        # One query per translation group, shared by every page in it and cached
+        # until one of them is saved or published.
+        group = get_translation_group(page.translation_key)
+        own_language_code = next((member.language_code for member in group if member.id == page.pk), None)
+        content_locales = [own_language_code or page.locale.language_code]
+        content_locales += [member.language_code for member in group if member.id != page.pk and member.live and member.alias_of_id != page.pk]
 
     # Expand with alias locales from FALLBACK_LOCALES reverse map.
     # e.g. if es-MX is in the list, also add es-AR and es-CL.
@@ -5,9 +5,9 @@
 from django.conf import settings
 from django.http import Http404, HttpResponseRedirect
 
-from wagtail.models import Locale as WagtailLocale, Site
 from wagtail.views import serve as wagtail_serve
 
+from springfield.cms.page_cache import get_locale_topology
 from springfield.cms.utils import find_fallback_page_for_locale
 
 
@@ -31,17 +31,18 @@ def _alias_needs_prewagtail_intercept(lang_prefix):
 
     # 2a. We know that the lang_prefix is an alias locale; if the locale deosn't
     # exist, then we intercept the request.
-    alias_locale = WagtailLocale.objects.filter(language_code=lang_prefix).first()
-    if not alias_locale:
+    # (This runs before Wagtail on every alias-locale request, so the answers
+    # come from the in-memory locale topology rather than the database.)
+    topology = get_locale_topology()
+    if lang_prefix not in topology.language_codes:
         return True
 
-    site = Site.objects.filter(is_default_site=True).select_related("root_page").first()
-    if not site:
+    if topology.root_pages is None:
         return False
 
     # 2b. If site.root_page has no live translation in this locale, then we
     # intercept the request.
-    alias_root = site.root_page.get_translation_or_none(alias_locale)
+    alias_root = topology.root_pages.get(lang_prefix)
     return not alias_root or not alias_root.live
 
 
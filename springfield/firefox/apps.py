@@ -0,0 +1,18 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class FirefoxConfig(AppConfig):
+    name = "springfield.firefox"
+
+    def ready(self):
+        # Build the localized media index up front so l10n_img() never has to
+        # search the static files during a request. DEBUG looks on disk instead.
+        if not settings.DEBUG:
+            from springfield.firefox.templatetags.misc import get_l10n_media_index
+
+            get_l10n_media_index()
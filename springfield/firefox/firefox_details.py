@@ -3,14 +3,19 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import re
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 from operator import itemgetter
+from types import MappingProxyType
 from urllib.parse import quote, urlencode
 
 from django.conf import settings
 
 from product_details import ProductDetails
 
+# builds: every build_info mapping for one (builds, channel, version), sorted by English name.
+# by_locale: locale -> the same build_info mapping.
+DownloadIndex = namedtuple("DownloadIndex", ["builds", "by_locale"])
+
 
 # TODO: port this to django-mozilla-product-details
 class _ProductDetails(ProductDetails):
@@ -70,6 +75,8 @@ class FirefoxDesktop(_ProductDetails):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # (builds name, channel, version) -> (builds, languages, DownloadIndex)
+        self._download_indexes = {}
 
     def platforms(self, channel="release", classified=False):
         """
@@ -155,42 +162,83 @@ class FirefoxDesktop(_ProductDetails):
                     _builds["Linux 64-bit"] = _builds["Linux"]
                 return version, _builds
 
-    def _get_filtered_builds(self, builds, channel, version=None, query=None):
+    def _build_download_index(self, builds, channel, version):
         """
-        Get a list of builds, sorted by english locale name, for a specific
-        Firefox version.
-        :param builds: a build dict from the JSON
-        :param channel: one of self.version_map.keys().
-        :param version: a firefox version. one of self.latest_versions.
-        :param query: a string to match against native or english locale name
-        :return: list
+        Return a DownloadIndex of the download URL for every platform of every
+        locale in ``builds`` that has ``version``. The mappings are read-only
+        because they are shared by every request until the data changes.
         """
-        version = version or self.latest_version(channel)
-
-        f_builds = []
+        languages = self.languages
+        build_infos = []
         for locale, build in builds.items():
-            if locale not in self.languages or not build.get(version):
+            if locale not in languages or not build.get(version):
                 continue
 
-            build_info = {
-                "locale": locale,
-                "name_en": self.languages[locale]["English"],
-                "name_native": self.languages[locale]["native"],
-                "platforms": {},
+            platforms = {
+                platform: MappingProxyType({"download_url": self.get_download_url(channel, version, platform, locale, True, True)})
+                for platform in self.platform_labels
             }
+            build_infos.append(
+                MappingProxyType(
+                    {
+                        "locale": locale,
+                        "name_en": languages[locale]["English"],
+                        "name_native": languages[locale]["native"],
+                        "platforms": MappingProxyType(platforms),
+                    }
+                )
+            )
 
-            # only include builds that match a search query
-            if query is not None and not self._matches_query(build_info, query):
-                continue
+        build_infos.sort(key=itemgetter("name_en"))
+        return DownloadIndex(tuple(build_infos), MappingProxyType({info["locale"]: info for info in build_infos}))
 
-            for platform, label in self.platform_labels.items():
-                build_info["platforms"][platform] = {
-                    "download_url": self.get_download_url(channel, version, platform, locale, True, True),
-                }
+    def get_download_index(self, builds_name, channel, version=None):
+        """
+        Return the DownloadIndex for the ``builds_name`` product-details file
+        (e.g. "firefox_primary_builds"), channel and version.
 
-            f_builds.append(build_info)
+        Building it means generating a URL for every locale and platform, so it is
+        kept until the product-details data it came from is replaced. The storage
+        cache returns the same objects until then, so their identity tells us
+        whether the index is still current.
+        """
+        version = version or self.latest_version(channel)
+        builds = getattr(self, builds_name)
+        languages = self.languages
+        key = (builds_name, channel, version)
+
+        cached = self._download_indexes.get(key)
+        if cached and cached[0] is builds and cached[1] is languages:
+            return cached[2]
+
+        index = self._build_download_index(builds, channel, version)
+        # drop the indexes of data that has been replaced, so they can't pile up
+        self._download_indexes = {
+            cached_key: entry
+            for cached_key, entry in self._download_indexes.items()
+            if entry[0] is getattr(self, cached_key[0]) and entry[1] is languages
+        }
+        self._download_indexes[key] = (builds, languages, index)
+        return index
+
+    def _get_filtered_builds(self, builds_name, channel, version=None, query=None):
+        """
+        Get a list of builds, sorted by english locale name, for a specific
+        Firefox version.
+        :param builds_name: name of a build dict from the JSON
+        :param channel: one of self.version_map.keys().
+        :param version: a firefox version. one of self.latest_versions.
+        :param query: a string to match against native or english locale name
+        :return: list of read-only build info mappings (MappingProxyType, as
+            are their "platforms"). They are shared by every request, so copy
+            them, "platforms" included, before changing them or serializing
+            them to JSON.
+        """
+        builds = self.get_download_index(builds_name, channel, version).builds
+        if query is not None:
+            return [build_info for build_info in builds if self._matches_query(build_info, query)]
 
-        return sorted(f_builds, key=itemgetter("name_en"))
+        return list(builds)
 
     def get_filtered_full_builds(self, channel, version=None, query=None):
         """
@@ -198,9 +246,10 @@ class FirefoxDesktop(_ProductDetails):
         :param channel: one of self.version_map.keys().
         :param version: a firefox version. one of self.latest_version.
         :param query: a string to match against native or english locale name
-        :return: list
+        :return: list of read-only build info mappings, as for
+            _get_filtered_builds()
         """
-        return self._get_filtered_builds(self.firefox_primary_builds, channel, version, query)
+        return self._get_filtered_builds("firefox_primary_builds", channel, version, query)
 
     def get_filtered_test_builds(self, channel, version=None, query=None):
         """
@@ -208,9 +257,21 @@ class FirefoxDesktop(_ProductDetails):
         :param channel: one of self.version_map.keys().
         :param version: a firefox version. one of self.latest_version.
         :param query: a string to match against native or english locale name
-        :return: list
+        :return: list of read-only build info mappings, as for
+            _get_filtered_builds()
+        """
+        return self._get_filtered_builds("firefox_beta_builds", channel, version, query)
+
+    def get_full_build(self, channel, locale, version=None):
+        """
+        Return the build info for one locale of the fully translated releases,
+        without scanning every locale.
+        :param channel: one of self.version_map.keys().
+        :param locale: locale string of the build
+        :param version: a firefox version. one of self.latest_version.
+        :return: read-only mapping, or None if there is no build for the locale
         """
-        return self._get_filtered_builds(self.firefox_beta_builds, channel, version, query)
+        return self.get_download_index("firefox_primary_builds", channel, version).by_locale.get(locale)
 
     def get_download_url(
         self,
@@ -0,0 +1,41 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+import json
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from springfield.firefox.templatetags.misc import build_l10n_media_index
+
+
+class Command(BaseCommand):
+    help = "Print the localized media index used by l10n_img() and l10n_css(), for debugging."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--locale", action="append", dest="locales", help="Only show files for this locale. Can be repeated.")
+        parser.add_argument("--json", action="store_true", help="Print a JSON object of type -> locale -> files instead of one path per line.")
+
+    def handle(self, *args, **options):
+        index = build_l10n_media_index()
+        locales = options["locales"]
+
+        by_locale = defaultdict(lambda: defaultdict(list))
+        for file_path in sorted(index):
+            type, _l10n, locale, url = file_path.split("/", 3)
+            if locales and locale not in locales:
+                continue
+            by_locale[type][locale].append(url)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(by_locale, indent=2, sort_keys=True))
+            return
+
+        for type, locale_files in sorted(by_locale.items()):
+            for locale, urls in sorted(locale_files.items()):
+                for url in urls:
+                    self.stdout.write(f"{type}/l10n/{locale}/{url}")
+
+        total = sum(len(urls) for locale_files in by_locale.values() for urls in locale_files.values())
+        self.stdout.write(f"{total} files in {sum(len(locale_files) for locale_files in by_locale.values())} locale directories")
@@ -5,11 +5,13 @@
 # coding: utf-8
 
 import re
+from functools import lru_cache
 from os import path
 from os.path import splitext
 
 from django.conf import settings
-from django.contrib.staticfiles.finders import find as find_static
+from django.contrib.staticfiles.finders import find as find_static, get_finders
+from django.contrib.staticfiles.storage import staticfiles_storage
 from django.template.defaultfilters import slugify as django_slugify
 from django.template.defaulttags import CsrfTokenNode
 from django.utils.encoding import smart_str
@@ -55,9 +57,37 @@ def _strip_img_prefix(url):
     return re.sub(r"^/?img/", "", url)
 
 
+L10N_MEDIA_TYPES = ("img", "css")
+
+
+def build_l10n_media_index():
+    """Return a frozenset of the static paths of every localized media file,
+    e.g. "img/l10n/fr/firefox/screenshot.png".
+
+    The paths come from the staticfiles manifest when there is one, and from
+    the static files finders otherwise.
+    """
+    prefixes = tuple(f"{type}/l10n/" for type in L10N_MEDIA_TYPES)
+    paths = getattr(staticfiles_storage, "hashed_files", None)
+    if not paths:
+        paths = (file_path for finder in get_finders() for file_path, _storage in finder.list([]))
+
+    return frozenset(file_path for file_path in paths if file_path.startswith(prefixes))
+
+
+@lru_cache(maxsize=1)
+def get_l10n_media_index():
+    """Return the localized media index, built the first time it's needed."""
+    return build_l10n_media_index()
+
+
 def _l10n_media_exists(type, locale, url):
     """checks if a localized media file exists for the locale"""
-    return find_static(path.join(type, "l10n", locale, url)) is not None
+    if settings.DEBUG:
+        # look on disk so that new files show up without a restart
+        return find_static(path.join(type, "l10n", locale, url)) is not None
+
+    return path.join(type, "l10n", locale, url) in get_l10n_media_index()
 
 
 def add_string_to_image_url(url, addition):
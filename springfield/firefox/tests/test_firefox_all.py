@@ -277,7 +277,7 @@ def test_firefox_esr_next(client, os, lang):
     # Note: Only testing a few os/lang pairs to avoid mocking too much. We're mostly checking that all button and link types show up.
     # Set an esr_next version.
     orig_latest_version = firefox_desktop.latest_version
-    orig_get_filtered_full_builds = firefox_desktop.get_filtered_full_builds
+    orig_get_full_build = firefox_desktop.get_full_build
 
     def mock_latest_version(channel="release"):
         if channel == "esr_next":
@@ -285,9 +285,9 @@ def test_firefox_esr_next(client, os, lang):
         else:
             return orig_latest_version(channel)
 
-    def mock_get_filtered_full_builds(channel, query=None):
+    def mock_get_full_build(channel, locale, version=None):
         if channel == "esr_next":
-            return [
+            builds = [
                 {
                     "locale": "en-US",
                     "platforms": {
@@ -311,11 +311,12 @@ def test_firefox_esr_next(client, os, lang):
                     },
                 },
             ]
+            return next((build for build in builds if build["locale"] == locale), None)
         else:
-            return orig_get_filtered_full_builds(channel, query)
+            return orig_get_full_build(channel, locale, version)
 
     with patch("springfield.firefox.views.firefox_desktop.latest_version", side_effect=mock_latest_version):
-        with patch("springfield.firefox.views.firefox_desktop.get_filtered_full_builds", side_effect=mock_get_filtered_full_builds):
+        with patch("springfield.firefox.views.firefox_desktop.get_full_build", side_effect=mock_get_full_build):
             resp = client.get(reverse("firefox.all.download", kwargs={"product_slug": "desktop-esr", "platform": os, "locale": lang}))
             doc = pq(resp.content)
 
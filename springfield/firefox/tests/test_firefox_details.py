@@ -728,6 +728,25 @@ class TestFirefoxDesktopBase(TestCase):
         url = builds[0]["platforms"]["linux64"]["download_url"]
         assert parse_qsl(urlparse(url).query)[1] == ("os", "linux64")
 
+    def test_get_full_build(self):
+        build = self.firefox_desktop.get_full_build("release", "de")
+        assert build["name_en"] == "German"
+        assert build == next(b for b in self.firefox_desktop.get_filtered_full_builds("release") if b["locale"] == "de")
+        assert parse_qsl(urlparse(build["platforms"]["win64"]["download_url"]).query)[2] == ("lang", "de")
+        assert self.firefox_desktop.get_full_build("release", "xx") is None
+
+    def test_download_index_reused_until_data_changes(self):
+        index = self.firefox_desktop.get_download_index("firefox_primary_builds", "release")
+        assert self.firefox_desktop.get_download_index("firefox_primary_builds", "release") is index
+        with self.assertRaises(TypeError):
+            index.by_locale["de"]["locale"] = "fr"
+
+        # new product-details data, e.g. after update_product_details_files
+        self.pd_cache.clear()
+        new_index = self.firefox_desktop.get_download_index("firefox_primary_builds", "release")
+        assert new_index is not index
+        assert new_index == index
+
     def test_esr_versions(self):
         """ESR versions should be dynamic based on data."""
         with patch.object(
@@ -6,7 +6,7 @@
 
 import os.path
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from django.conf import settings
 from django.test.client import RequestFactory
@@ -142,6 +142,53 @@ class TestL10nCSS(TestCase):
         assert self._render("fr") == ""
 
 
+class TestL10nMediaIndex(TestCase):
+    hashed_files = {
+        "img/l10n/fr/dino/head.png": "img/l10n/fr/dino/head.abc123.png",
+        "css/l10n/de/intl.css": "css/l10n/de/intl.def456.css",
+        "img/dino/head.png": "img/dino/head.789abc.png",
+    }
+
+    def setUp(self):
+        misc.get_l10n_media_index.cache_clear()
+
+    def tearDown(self):
+        misc.get_l10n_media_index.cache_clear()
+
+    def test_build_from_manifest(self):
+        with patch.object(misc, "staticfiles_storage", Mock(hashed_files=self.hashed_files)):
+            assert misc.build_l10n_media_index() == {"img/l10n/fr/dino/head.png", "css/l10n/de/intl.css"}
+
+    @override_settings(
+        STATICFILES_DIRS=[os.path.join(TEST_FILES_ROOT, "media")],
+        STATICFILES_FINDERS=["django.contrib.staticfiles.finders.FileSystemFinder"],
+    )
+    def test_build_from_finders(self):
+        with patch.object(misc, "staticfiles_storage", Mock(hashed_files={})):
+            assert misc.build_l10n_media_index() == {
+                "img/l10n/en-US/dino/head.png",
+                "img/l10n/es-ES/dino/head.png",
+                "img/l10n/de/dino/head.png",
+                "css/l10n/es-ES/intl.css",
+                "css/l10n/de/intl.css",
+            }
+
+    @override_settings(DEBUG=False)
+    @patch.object(misc, "find_static")
+    def test_media_exists_uses_index(self, find_static_mock):
+        with patch.object(misc, "staticfiles_storage", Mock(hashed_files=self.hashed_files)):
+            assert misc._l10n_media_exists("img", "fr", "dino/head.png")
+            assert not misc._l10n_media_exists("img", "de", "dino/head.png")
+            assert misc._l10n_media_exists("css", "de", "intl.css")
+        find_static_mock.assert_not_called()
+
+    @override_settings(DEBUG=True)
+    @patch.object(misc, "find_static", return_value=None)
+    def test_media_exists_looks_on_disk_in_debug(self, find_static_mock):
+        assert not misc._l10n_media_exists("img", "fr", "dino/head.png")
+        find_static_mock.assert_called_once_with("img/l10n/fr/dino/head.png")
+
+
 class TestDonateUrl(TestCase):
     rf = RequestFactory()
 
@@ -19,7 +19,7 @@ from wagtail.models import Locale as WagtailLocale
 
 from lib import l10n_utils, querystringsafe_base64
 from lib.l10n_utils import L10nTemplateView
-from lib.l10n_utils.fluent import ftl, ftl_file_is_active
+from lib.l10n_utils.fluent import ftl_file_is_active, translate, view_l10n
 from springfield.base import waffle
 from springfield.base.urlresolvers import reverse
 from springfield.cms.models.pages import WhatsNewPage2026
@@ -189,6 +189,8 @@ def sign_attribution_codes(codes):
 @require_safe
 def firefox_all(request, product_slug=None, platform=None, locale=None):
     ftl_files = "firefox/all"
+    # one set of bundles for every string in this view
+    l10n = view_l10n(ftl_files)
 
     # A product object for android OR ios.
     class MobileRelease:
@@ -201,68 +203,68 @@ def firefox_all(request, product_slug=None, platform=None, locale=None):
             "slug": "desktop-release",
             "product": firefox_desktop,
             "channel": "release",
-            "name": ftl("firefox-all-product-firefox", ftl_files=ftl_files),
+            "name": translate(l10n, "firefox-all-product-firefox"),
         },
         "desktop-beta": {
             "slug": "desktop-beta",
             "product": firefox_desktop,
             "channel": "beta",
-            "name": ftl("firefox-all-product-firefox-beta", ftl_files=ftl_files),
+            "name": translate(l10n, "firefox-all-product-firefox-beta"),
         },
         "desktop-developer": {
             "slug": "desktop-developer",
             "product": firefox_desktop,
             "channel": "devedition",
-            "name": ftl("firefox-all-product-firefox-developer", ftl_files=ftl_files),
+            "name": translate(l10n, "firefox-all-product-firefox-developer"),
         },
         "desktop-nightly": {
             "slug": "desktop-nightly",
             "product": firefox_desktop,
             "channel": "nightly",
-            "name": ftl("firefox-all-product-firefox-nightly", ftl_files=ftl_files),
+            "name": translate(l10n, "firefox-all-product-firefox-nightly"),
         },
         "desktop-esr": {
             "slug": "desktop-esr",
             "product": firefox_desktop,
             "channel": "esr",
-            "name": ftl("firefox-all-product-firefox-esr", ftl_files=ftl_files),
+            "name": translate(l10n, "firefox-all-product-firefox-esr"),
         },
         "android-release": {
             "slug": "android-release",
             "product": firefox_android,
             "channel": "release",
-            "name": ftl("firefox-all-product-firefox-android", ftl_files=ftl_files),
+            "name": translate(l10n, "firefox-all-product-firefox-android"),
         },
         "android-beta": {
             "slug": "android-beta",
             "product": firefox_android,
             "channel": "beta",
-            "name": ftl("firefox-all-product-firefox-android-beta", ftl_files=ftl_files),
+            "name": translate(l10n, "firefox-all-product-firefox-android-beta"),
         },
         "android-nightly": {
             "slug": "android-nightly",
             "product": firefox_android,
             "channel": "nightly",
-            "name": ftl("firefox-all-product-firefox-android-nightly", ftl_files=ftl_files),
+            "name": translate(l10n, "firefox-all-product-firefox-android-nightly"),
         },
         "ios-release": {
             "slug": "ios-release",
             "product": firefox_ios,
             "channel": "release",
-            "name": ftl("firefox-all-product-firefox-ios", ftl_files=ftl_files),
+            "name": translate(l10n, "firefox-all-product-firefox-ios"),
         },
         "ios-beta": {
             "slug": "ios-beta",
             "product": firefox_ios,
             "channel": "beta",
-            "name": ftl("firefox-all-product-firefox-ios", ftl_files=ftl_files),
+            "name": translate(l10n, "firefox-all-product-firefox-ios"),
         },
         # mobile-release is a special case for both android and ios.
         "mobile-release": {
             "slug": "mobile-release",
             "product": mobile_release,
             "channel": "release",
-            "name": ftl("firefox-all-product-firefox", ftl_files=ftl_files),
+            "name": translate(l10n, "firefox-all-product-firefox"),
         },
     }
 
@@ -300,7 +302,7 @@ def firefox_all(request, product_slug=None, platform=None, locale=None):
     else:
         template_name = "firefox/all/base-flare.html"
 
-    lang_multi = ftl("firefox-all-lang-multi", ftl_files=ftl_files)
+    lang_multi = translate(l10n, "firefox-all-lang-multi")
 
     if product:
         if product_slug.startswith(("mobile", "android", "ios")):
@@ -309,7 +311,7 @@ def firefox_all(request, product_slug=None, platform=None, locale=None):
             download_url = True  # Set to True to avoid trying to generate this later below.
         if product_slug.startswith("mobile"):
             platform = "mobile"
-            platform_name = ftl("firefox-all-plat-mobile", ftl_files=ftl_files)
+            platform_name = translate(l10n, "firefox-all-plat-mobile")
         elif product_slug.startswith("android"):
             platform = "android"
             platform_name = "Android"
@@ -328,9 +330,8 @@ def firefox_all(request, product_slug=None, platform=None, locale=None):
             platform_name = platform and platform_map[platform]
             locale_name = None
             if locale:
-                try:
-                    build = list(filter(lambda b: b["locale"] == locale, product["product"].get_filtered_full_builds(product["channel"])))[0]
-                except IndexError:
+                build = product["product"].get_full_build(product["channel"], locale)
+                if build is None:
                     raise Http404()
                 locale_name = f"{build['name_en']} - {build['name_native']}"
 
@@ -353,37 +354,29 @@ def firefox_all(request, product_slug=None, platform=None, locale=None):
     # Show download link
     if locale:
         if not download_url:
-            download_url = list(filter(lambda b: b["locale"] == locale, product["product"].get_filtered_full_builds(product["channel"])))[0][
-                "platforms"
-            ][platform]["download_url"]
+            download_url = product["product"].get_full_build(product["channel"], locale)["platforms"][platform]["download_url"]
         context.update(
             download_url=download_url,
         )
-        try:
-            if product_slug == "desktop-esr":
-                download_esr_115_url = list(filter(lambda b: b["locale"] == locale, firefox_desktop.get_filtered_full_builds("esr115")))[0][
-                    "platforms"
-                ][platform]["download_url"]
-                # ESR115 builds do not exist for "sat" and "skr" languages (issue: mozilla/bedrock#15437)
-                if locale in ["sat", "skr"]:
-                    download_esr_115_url = None
-                # ESR115 builds do not exist for "linux64-aarch64" (springfield#467); "linux" (i686) and "win64-aarch64" no longer ship (bug 2040496)
-                if platform in ["linux64-aarch64", "linux", "win64-aarch64"]:
-                    download_esr_115_url = None
-                context.update(
-                    download_esr_115_url=download_esr_115_url,
-                )
-        except IndexError:
-            pass
+        esr_115_build = firefox_desktop.get_full_build("esr115", locale) if product_slug == "desktop-esr" else None
+        if esr_115_build:
+            download_esr_115_url = esr_115_build["platforms"][platform]["download_url"]
+            # ESR115 builds do not exist for "sat" and "skr" languages (issue: mozilla/bedrock#15437)
+            if locale in ["sat", "skr"]:
+                download_esr_115_url = None
+            # ESR115 builds do not exist for "linux64-aarch64" (springfield#467); "linux" (i686) and "win64-aarch64" no longer ship (bug 2040496)
+            if platform in ["linux64-aarch64", "linux", "win64-aarch64"]:
+                download_esr_115_url = None
+            context.update(
+                download_esr_115_url=download_esr_115_url,
+            )
         if product_slug == "desktop-esr" and esr_next_version:
-            try:
-                download_esr_next_url = list(filter(lambda b: b["locale"] == locale, firefox_desktop.get_filtered_full_builds("esr_next")))[0][
-                    "platforms"
-                ][platform]["download_url"]
+            esr_next_build = firefox_desktop.get_full_build("esr_next", locale)
+            if esr_next_build:
                 context.update(
-                    download_esr_next_url=download_esr_next_url,
+                    download_esr_next_url=esr_next_build["platforms"][platform]["download_url"],
                 )
-            except IndexError:
+            else:
                 # If the ESR next version is not available for the locale, remove the context variables.
                 context.pop("desktop_esr_latest_version", None)
                 context.pop("desktop_esr_next_version", None)
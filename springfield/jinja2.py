@@ -2,17 +2,41 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import logging
+import os
+
+from django.conf import settings
+
 from includecontents.jinja2 import IncludeContentsExtension
-from jinja2 import Environment
+from jinja2 import Environment, FileSystemBytecodeCache
 from wagtail.admin.jinja2tags import WagtailUserbarExtension
 
+from springfield.cms.qrcodes import CMS_QRCODE_BOX_SIZE, CMS_QRCODE_ROUNDED_BOX_SIZE
 from springfield.cms.templatetags.cms_tags import richtext
 
+log = logging.getLogger(__name__)
+
+
+def get_bytecode_cache(directory):
+    """Return a cache of compiled templates in ``directory``, shared by every worker
+    that uses it, or None if the directory can't be created."""
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        log.warning("Could not create the Jinja bytecode cache in %s", directory, exc_info=True)
+        return None
+
+    return FileSystemBytecodeCache(directory)
+
 
 def custom_environment(**options):
     options["extensions"] = options.get("extensions", []) + [IncludeContentsExtension, WagtailUserbarExtension]
+    if settings.JINJA_BYTECODE_CACHE_PATH:
+        options["bytecode_cache"] = get_bytecode_cache(settings.JINJA_BYTECODE_CACHE_PATH)
     env = Environment(**options)
     env.filters["richtext"] = richtext
+    env.globals["CMS_QRCODE_BOX_SIZE"] = CMS_QRCODE_BOX_SIZE
+    env.globals["CMS_QRCODE_ROUNDED_BOX_SIZE"] = CMS_QRCODE_ROUNDED_BOX_SIZE
 
     from django.apps import apps
 
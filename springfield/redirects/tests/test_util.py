@@ -14,6 +14,7 @@ from springfield.redirects.util import (
     get_resolver,
     header_redirector,
     is_firefox_redirector,
+    literal_prefix,
     no_redirect,
     platform_redirector,
     redirect,
@@ -398,3 +399,62 @@ class TestRedirectUrlPattern(TestCase):
         resp = middleware.process_request(self.rf.get("/editor/midasdemo/securityprefs.html%3C/span%3E%3C/a%3E%C2%A0"))
         assert resp.status_code == 301
         assert resp["Location"] == "http://www-archive.mozilla.org/editor/midasdemo/securityprefs.html%C2%A0"
+
+
+class TestLiteralPrefix(TestCase):
+    def test_literal_prefix(self):
+        assert literal_prefix(r"^iam/the/walrus/$") == "iam/the/walrus/"
+        assert literal_prefix(r"^firefox/125.0/releasenotes/?$") == "firefox/125"
+        assert literal_prefix(r"^firefox/125\.0/releasenotes/?$") == "firefox/125.0/releasenotes"
+        assert literal_prefix(r"^mobile/(?P<v>\d+)/$") == "mobile/"
+        assert literal_prefix(r"^en-US/famil(y|ies)/?$") == "en-US/famil"
+        assert literal_prefix(r"^iam/the\d/$") == "iam/the"
+        assert literal_prefix(r"^dudes?/$") == "dude"
+
+    def test_no_literal_prefix(self):
+        assert literal_prefix(r"iam/the/walrus/$") == ""
+        assert literal_prefix(r"^(10|independent)/?$") == ""
+        assert literal_prefix(r"^iam/the/walrus/$|^coo/coo/$") == ""
+        assert literal_prefix(r"^[a-z]+/$") == ""
+
+
+class TestRedirectResolver(TestCase):
+    def setUp(self):
+        self.rf = RequestFactory()
+
+    def test_candidates(self):
+        resolver = get_resolver(
+            [
+                redirect(r"^iam/the/walrus/$", "/coo/coo/cachoo/"),
+                redirect(r"^dude/abides/$", "/the/dude/", locale_prefix=False),
+                redirect(r"^(?P<path>.*)/bowling/$", "/{path}/"),
+                redirect(r"^iam/the/eggman/$", "/goo/goo/", re_flags="i"),
+            ]
+        )
+        assert resolver.candidates("iam/the/walrus/") == [0, 2, 3]
+        assert resolver.candidates("de/iam/the/walrus/") == [0, 2, 3]
+        assert resolver.candidates("dude/abides/") == [1, 2, 3]
+        # locale prefix not allowed for the second pattern
+        assert resolver.candidates("de/dude/abides/") == [2, 3]
+        assert resolver.candidates("firefox/new/") == [2, 3]
+
+    def test_registration_order_wins(self):
+        resolver = get_resolver(
+            [
+                redirect(r"^(?P<name>.+)/walrus/$", "/coo/coo/{name}/", locale_prefix=False),
+                redirect(r"^iam/the/walrus/$", "/goo/goo/"),
+            ]
+        )
+        middleware = RedirectsMiddleware(get_response=HttpResponse, resolver=resolver)
+        resp = middleware.process_request(self.rf.get("/iam/the/walrus/"))
+        assert resp["Location"] == "/coo/coo/iam/the/"
+
+    def test_results_are_cached(self):
+        resolver = get_resolver([redirect(r"^iam/the/walrus/$", "/coo/coo/cachoo/")])
+        middleware = RedirectsMiddleware(get_response=HttpResponse, resolver=resolver)
+        with patch.object(resolver, "candidates", wraps=resolver.candidates) as candidates_mock:
+            for _ in range(3):
+                assert middleware.process_request(self.rf.get("/iam/the/marmot/")) is None
+                assert middleware.process_request(self.rf.get("/iam/the/walrus/")).status_code == 301
+
+        assert candidates_mock.call_count == 2
@@ -5,6 +5,7 @@
 import re
 from collections import defaultdict
 from copy import deepcopy
+from functools import lru_cache
 from urllib.parse import parse_qs, urlencode
 
 from django.conf import settings
@@ -13,7 +14,7 @@ from django.http import (
     HttpResponsePermanentRedirect,
     HttpResponseRedirect,
 )
-from django.urls import NoReverseMatch, URLResolver, re_path, reverse
+from django.urls import NoReverseMatch, Resolver404, URLPattern, re_path, reverse
 from django.urls.resolvers import RegexPattern
 from django.utils.html import strip_tags
 from django.views.decorators.vary import vary_on_headers
@@ -24,6 +25,12 @@ from springfield.base.decorators import cache_control_expires
 
 log = commonware.log.getLogger("redirects.util")
 LOCALE_RE = r"^(?P<locale>\w{2,3}(?:-\w{2})?/)?"
+# the part of a path that `LOCALE_RE` can consume
+LOCALE_PREFIX_RE = re.compile(LOCALE_RE[1:-1])
+# a global inline flags group, as added by the `re_flags` argument
+INLINE_FLAGS_RE = re.compile(r"^\(\?[aiLmsux]+\)")
+# number of distinct paths whose match result is remembered by the resolver
+RESOLVER_CACHE_SIZE = 1000
 HTTP_RE = re.compile(r"^https?://", re.IGNORECASE)
 PROTOCOL_RELATIVE_RE = re.compile(r"^//+")
 
@@ -37,7 +44,147 @@ def register(patterns):
 
 def get_resolver(patterns=None):
     patterns = patterns or redirectpatterns
-    return URLResolver(RegexPattern(r"^/"), patterns)
+    return RedirectResolver(patterns)
+
+
+def literal_prefix(regex):
+    """Return the literal text that any match of `regex` must start with.
+
+    Returns an empty string when the regex could start with anything, e.g. it is
+    not anchored, has a top-level alternation or starts with a group.
+    """
+    # a top-level alternation means there is more than one possible prefix
+    depth = 0
+    in_class = False
+    escaped = False
+    for char in regex:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return ""
+
+    if not regex.startswith("^"):
+        return ""
+
+    prefix = []
+    i = 1
+    while i < len(regex):
+        char = regex[i]
+        if char == "\\":
+            nxt = regex[i + 1 : i + 2]
+            # `\d`, `\w`, `\b` etc. are classes or assertions, not literals
+            if not nxt or nxt.isalnum():
+                break
+            literal = nxt
+            i += 2
+        elif char in ".^$*+?{}[]()|":
+            break
+        else:
+            literal = char
+            i += 1
+
+        # a quantified character is optional or repeated so can't be part of the prefix
+        if regex[i : i + 1] in ("?", "*", "+", "{"):
+            break
+
+        prefix.append(literal)
+
+    return "".join(prefix)
+
+
+class RedirectResolver:
+    """Resolve a path against the redirect patterns without trying every regex.
+
+    Patterns are indexed in a character trie by the literal text they must
+    start with (after the optional locale prefix), so only the patterns that
+    could possibly match a path have their regex tried, in registration order.
+    Patterns that can't be indexed (unanchored, case-insensitive, etc.) are
+    always tried. The result for each path is kept in an LRU cache, so the
+    common case of a path that matches no redirect is a single dict lookup.
+    """
+
+    def __init__(self, patterns, cache_size=RESOLVER_CACHE_SIZE):
+        self.patterns = list(patterns)
+        self.locale_trie = {}
+        self.plain_trie = {}
+        self.always = []
+        for index, pattern in enumerate(self.patterns):
+            self._index_pattern(index, pattern)
+
+        self._match_index = lru_cache(maxsize=cache_size)(self._find_match_index)
+
+    def _index_pattern(self, index, pattern):
+        if not isinstance(pattern, URLPattern) or not isinstance(pattern.pattern, RegexPattern):
+            self.always.append(index)
+            return
+
+        regex = pattern.pattern._regex
+        if INLINE_FLAGS_RE.match(regex) or pattern.pattern.regex.flags & (re.IGNORECASE | re.VERBOSE):
+            self.always.append(index)
+            return
+
+        trie = self.plain_trie
+        if regex.startswith(LOCALE_RE):
+            trie = self.locale_trie
+            regex = "^" + regex[len(LOCALE_RE) :]
+
+        prefix = literal_prefix(regex)
+        if not prefix:
+            self.always.append(index)
+            return
+
+        node = trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(index)
+
+    @staticmethod
+    def _walk(trie, path, found):
+        node = trie
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                return
+            found.extend(node.get(None, ()))
+
+    def candidates(self, path):
+        """Return the indexes of the patterns that may match `path`, in order"""
+        found = list(self.always)
+        self._walk(self.plain_trie, path, found)
+        self._walk(self.locale_trie, path, found)
+        locale_match = LOCALE_PREFIX_RE.match(path)
+        if locale_match:
+            self._walk(self.locale_trie, path[locale_match.end() :], found)
+
+        return sorted(set(found))
+
+    def _find_match_index(self, path):
+        for index in self.candidates(path):
+            if self.patterns[index].resolve(path):
+                return index
+
+        return None
+
+    def resolve(self, path):
+        if not path.startswith("/"):
+            raise Resolver404({"path": path})
+
+        path = path[1:]
+        index = self._match_index(path)
+        if index is None:
+            raise Resolver404({"path": path})
+
+        return self.patterns[index].resolve(path)
 
 
 def header_redirector(header_name, regex, match_dest, nomatch_dest, case_sensitive=False):
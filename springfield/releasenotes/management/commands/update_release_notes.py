@@ -2,6 +2,8 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+from subprocess import CalledProcessError
+
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
@@ -14,25 +16,55 @@ from springfield.utils.management.decorators import alert_sentry_on_exception
 class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument("-q", "--quiet", action="store_true", dest="quiet", default=False, help="If no error occurs, swallow all output.")
-        parser.add_argument("-f", "--force", action="store_true", dest="force", default=False, help="Load the data even if nothing new from git.")
+        parser.add_argument(
+            "-f", "--force", action="store_true", dest="force", default=False, help="Reload all releases, even with nothing new in git."
+        )
+
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of processes used to render the Markdown when reloading all releases. Keep it within the container's CPU limit. Default: 1",
+        )
 
     def output(self, msg):
         if not self.quiet:
             print(msg)
 
+    def get_changed_files(self, repo):
+        """Return the (modified, removed) files since the releases were last loaded,
+        or None if every release needs loading."""
+        db_latest = repo.get_db_latest()
+        if db_latest is None or ProductRelease.objects.needs_full_refresh():
+            return None
+
+        try:
+            return repo.diff(db_latest, repo.current_hash)
+        except (OSError, CalledProcessError):
+            # e.g. the last loaded commit isn't in this clone's history
+            return None
+
     def handle(self, *args, **options):
         self.quiet = options["quiet"]
         repo = GitRepo(settings.RELEASE_NOTES_PATH, settings.RELEASE_NOTES_REPO, branch_name=settings.RELEASE_NOTES_BRANCH, name="Release Notes")
         self.output("Updating git repo")
         self.output(repo.update())
         if not (options["force"] or repo.has_changes()):
-            self.output("No release note updates")
-            return
+            if not ProductRelease.objects.has_stale_html():
+                self.output("No release note updates")
+                return
 
-        self.output("Loading releases into database")
-        count = ProductRelease.objects.refresh()
+            self.output("Release notes HTML was rendered by an older version of the code")
 
-        self.output(f"{count} release notes successfully loaded")
+        changes = None if options["force"] else self.get_changed_files(repo)
+        if changes is None:
+            self.output("Loading releases into database")
+            count = ProductRelease.objects.refresh(workers=options["workers"])
+            self.output(f"{count} release notes successfully loaded")
+        else:
+            self.output("Loading changed releases into database")
+            saved, deleted = ProductRelease.objects.refresh_files(*changes)
+            self.output(f"{saved} release notes successfully loaded and {deleted} removed")
 
         repo.set_db_latest()
 
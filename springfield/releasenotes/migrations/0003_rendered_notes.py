@@ -0,0 +1,28 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+# Generated by Django 5.2.16 on 2026-10-18 05:19
+
+from django.db import migrations
+
+import springfield.releasenotes.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("releasenotes", "0002_auto_20200122_0957"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productrelease",
+            name="render_version",
+            field=springfield.releasenotes.models.RenderVersionField(default=0),
+        ),
+        migrations.AddField(
+            model_name="productrelease",
+            name="rendered_notes",
+            field=springfield.releasenotes.models.RenderedNotesField(blank=True, default=list),
+        ),
+    ]
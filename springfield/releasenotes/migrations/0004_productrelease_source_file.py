@@ -0,0 +1,21 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+# Generated by Django 5.2.16 on 2026-10-18 05:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("releasenotes", "0003_rendered_notes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productrelease",
+            name="source_file",
+            field=models.CharField(blank=True, db_index=True, max_length=255),
+        ),
+    ]
@@ -4,9 +4,11 @@
 
 import codecs
 import json
+import multiprocessing
 import os
 import re
 import xml.etree.ElementTree as etree
+from concurrent.futures import ProcessPoolExecutor
 from glob import glob
 from operator import attrgetter
 
@@ -25,7 +27,7 @@ from markdown.inlinepatterns import InlineProcessor
 from product_details import product_details
 from product_details.version_compare import Version
 
-from springfield.base.sanitization import sanitize_html
+from springfield.base.sanitization import register_policy, sanitize
 from springfield.base.urlresolvers import reverse
 from springfield.releasenotes import version_re
 from springfield.releasenotes.utils import memoize
@@ -45,17 +47,30 @@ class StrikethroughExtension(Extension):
 
 
 LONG_RN_CACHE_TIMEOUT = 7200  # 2 hours
+# Release HTML is rendered once, when it's saved. Bump this when a change to
+# process_markdown() or anything it uses (the Markdown extensions, ALLOWED_TAGS,
+# ALLOWED_ATTRS, HTML_PATCHING, URL_REWRITES) should change the HTML already in the
+# database: update_release_notes reloads releases saved with an older version.
+RENDER_VERSION = 1
 cache = caches["release-notes"]
-markdowner = markdown.Markdown(
-    extensions=[
-        "markdown.extensions.tables",
-        "markdown.extensions.codehilite",
-        "markdown.extensions.fenced_code",
-        "markdown.extensions.toc",
-        "markdown.extensions.nl2br",
-        StrikethroughExtension(),
-    ]
-)
+# the number of releases inserted per query by a full refresh
+BULK_CREATE_BATCH_SIZE = 100
+
+
+def make_markdowner():
+    return markdown.Markdown(
+        extensions=[
+            "markdown.extensions.tables",
+            "markdown.extensions.codehilite",
+            "markdown.extensions.fenced_code",
+            "markdown.extensions.toc",
+            "markdown.extensions.nl2br",
+            StrikethroughExtension(),
+        ]
+    )
+
+
+markdowner = make_markdowner()
 # based on bleach.sanitizer.ALLOWED_TAGS
 ALLOWED_TAGS = {
     "a",
@@ -121,6 +136,8 @@ ALLOWED_ATTRS = {
         "type",
     ],
 }
+SANITIZATION_POLICY = "release-notes"
+register_policy(SANITIZATION_POLICY, ALLOWED_TAGS, ALLOWED_ATTRS)
 
 
 HTML_PATCHING = {
@@ -185,14 +202,74 @@ def _patch_html(html: str) -> str:
 def process_markdown(value):
     rendered_html = markdowner.reset().convert(value)
     patched_html = _patch_html(rendered_html)
-    return sanitize_html(patched_html, ALLOWED_TAGS, ALLOWED_ATTRS)
+    return sanitize(patched_html, SANITIZATION_POLICY)
+
+
+def read_release_file(release_file):
+    """Return the ProductRelease field values from the JSON file, or None if it shouldn't be loaded."""
+    with codecs.open(release_file, "r", encoding="utf-8") as rel_fh:
+        data = json.load(rel_fh)
+
+    # Make sure the version is valid and publicly accessible.
+    if not re.match(version_re, data["version"]):
+        return None
+    # doing this to simplify queries for Firefox since it is always
+    # looked up with product=Firefox and relies on the version number
+    # and channel to determine ESR.
+    if data["product"] == "Firefox Extended Support Release":
+        data["product"] = "Firefox"
+        data["channel"] = "ESR"
+    # make all releases public on non-production environments
+    if settings.DEV:
+        data["is_public"] = True
+    data["source_file"] = os.path.basename(release_file)
+    return data
+
+
+def render_release_file(release_file):
+    """Return read_release_file() with the Markdown fields already rendered to HTML."""
+    data = read_release_file(release_file)
+    if data is None:
+        return None
+
+    for field_name in ("text", "system_requirements"):
+        data[field_name] = process_markdown(data.get(field_name, ""))
+    data["rendered_notes"] = render_notes(data.get("notes"))
+    return data
 
 
-def process_notes(notes):
-    notes = [Note(d) for d in notes]
+def _init_render_worker():
+    # markdowner is reset() for every conversion, so each worker gets its own
+    global markdowner
+    markdowner = make_markdowner()
+
+
+def render_release_files(release_files, workers=1):
+    """Return render_release_file() for each of ``release_files``, shared between
+    ``workers`` forked processes (None or 1, which doesn't fork).
+
+    There's no os.cpu_count() default: in a container that's the node's CPUs, not
+    the container's limit."""
+    workers = workers or 1
+    if workers == 1 or len(release_files) < 2:
+        return [render_release_file(release_file) for release_file in release_files]
+
+    # The workers only read files, so they can be forked from a process with
+    # database connections open.
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"), initializer=_init_render_worker) as executor:
+        return list(executor.map(render_release_file, release_files, chunksize=max(1, len(release_files) // (workers * 4))))
+
+
+def process_notes(notes, rendered=False):
+    notes = [Note(d, rendered) for d in notes]
     return [n for n in notes if n.is_public]
 
 
+def render_notes(notes):
+    """Return the notes data with the Markdown of each note rendered to HTML."""
+    return [note | {"note": process_markdown(note["note"])} if "note" in note else note for note in notes or []]
+
+
 def process_is_public(is_public):
     if settings.DEV:
         return True
@@ -214,11 +291,12 @@ FIELD_PROCESSORS = {
 
 
 class RNModel:
-    def __init__(self, data):
+    def __init__(self, data, rendered=False):
+        # rendered: the Markdown in data has already been through render_notes()
         for key, value in data.items():
             if not hasattr(self, key):
                 continue
-            if key in FIELD_PROCESSORS:
+            if key in FIELD_PROCESSORS and not (rendered and key == "note"):
                 value = FIELD_PROCESSORS[key](value)
             setattr(self, key, value)
 
@@ -242,11 +320,32 @@ class MarkdownField(models.TextField):
 
     def pre_save(self, model_instance, add):
         value = super().pre_save(model_instance, add)
-        value = process_markdown(value)
+        if not getattr(model_instance, "html_rendered", False):
+            value = process_markdown(value)
+            setattr(model_instance, self.attname, value)
+        return value
+
+
+class RenderedNotesField(JSONField):
+    """Field that saves the model instance's notes with their Markdown rendered to HTML"""
+
+    def pre_save(self, model_instance, add):
+        if getattr(model_instance, "html_rendered", False):
+            return super().pre_save(model_instance, add)
+
+        value = render_notes(model_instance.notes)
         setattr(model_instance, self.attname, value)
         return value
 
 
+class RenderVersionField(models.PositiveSmallIntegerField):
+    """Field that saves the RENDER_VERSION of the HTML saved with the model instance"""
+
+    def pre_save(self, model_instance, add):
+        setattr(model_instance, self.attname, RENDER_VERSION)
+        return RENDER_VERSION
+
+
 class ProductReleaseQuerySet(models.QuerySet):
     def product(self, product_name, channel_name=None, version=None):
         if product_name.lower() == "firefox extended support release":
@@ -268,6 +367,11 @@ class ProductReleaseQuerySet(models.QuerySet):
         return q
 
 
+def _release_file_names(paths):
+    """Return the names of the release JSON files among the repo-relative ``paths``."""
+    return {os.path.basename(path) for path in paths if os.path.dirname(path) == "releases" and path.endswith(".json")}
+
+
 class ProductReleaseManager(models.Manager):
     def get_queryset(self, include_drafts=False):
         qs = ProductReleaseQuerySet(self.model, using=self._db)
@@ -279,34 +383,64 @@ class ProductReleaseManager(models.Manager):
     def product(self, product_name, channel_name=None, version=None, include_drafts=False):
         return self.get_queryset(include_drafts).product(product_name, channel_name, version)
 
-    def refresh(self):
-        version_regex = re.compile(version_re)
-        release_objs = []
+    def refresh(self, workers=1):
+        """Replace every release with those in the release notes repo.
+
+        The Markdown is rendered by ``workers`` processes (None or 1 renders it in
+        this process) before the transaction starts.
+        """
         rn_path = os.path.join(settings.RELEASE_NOTES_PATH, "releases")
+        release_objs = []
+        for data in render_release_files(glob(os.path.join(rn_path, "*.json")), workers):
+            if data is not None:
+                release = ProductRelease(**data)
+                release.html_rendered = True
+                release_objs.append(release)
+
         with transaction.atomic(using=self.db):
             self.get_queryset(include_drafts=True).delete()
-            releases = glob(os.path.join(rn_path, "*.json"))
-            for release_file in releases:
-                with codecs.open(release_file, "r", encoding="utf-8") as rel_fh:
-                    data = json.load(rel_fh)
-                    # Make sure the version is valid and publicly accessible.
-                    if not version_regex.match(data["version"]):
-                        continue
-                    # doing this to simplify queries for Firefox since it is always
-                    # looked up with product=Firefox and relies on the version number
-                    # and channel to determine ESR.
-                    if data["product"] == "Firefox Extended Support Release":
-                        data["product"] = "Firefox"
-                        data["channel"] = "ESR"
-                    # make all releases public on non-production environments
-                    if settings.DEV:
-                        data["is_public"] = True
-                    release_objs.append(ProductRelease(**data))
-
-            self.bulk_create(release_objs)
+            self.bulk_create(release_objs, batch_size=BULK_CREATE_BATCH_SIZE)
 
         return len(release_objs)
 
+    def refresh_files(self, modified_files, removed_files):
+        """Load only the releases whose files changed, given paths relative to the
+        release notes repo as returned by GitRepo.diff().
+
+        Changed releases are updated in place and keep their primary keys.
+        Return a 2 tuple: (number of releases saved, number of releases deleted)
+        """
+        rn_path = os.path.join(settings.RELEASE_NOTES_PATH, "releases")
+        modified_names = _release_file_names(modified_files)
+        removed_names = _release_file_names(removed_files) - modified_names
+
+        release_objs = []
+        for name in sorted(modified_names):
+            data = read_release_file(os.path.join(rn_path, name))
+            if data is not None:
+                release_objs.append(ProductRelease(**data))
+
+        releases = self.get_queryset(include_drafts=True)
+        with transaction.atomic(using=self.db):
+            # a modified file may now have an invalid version
+            removed_names |= modified_names - {release.source_file for release in release_objs}
+            deleted, _ = releases.filter(source_file__in=removed_names).delete()
+
+            existing_pks = dict(releases.filter(source_file__in=modified_names).values_list("source_file", "pk"))
+            for release in release_objs:
+                release.pk = existing_pks.get(release.source_file)
+                release.save(using=self.db)
+
+        return len(release_objs), deleted
+
+    def needs_full_refresh(self):
+        """Return True if refresh_files() can't be relied on to bring the releases up to date."""
+        return self.has_stale_html() or self.get_queryset(include_drafts=True).filter(source_file="").exists()
+
+    def has_stale_html(self):
+        """Return True if any release was saved with HTML from an older RENDER_VERSION."""
+        return self.get_queryset(include_drafts=True).exclude(render_version=RENDER_VERSION).exists()
+
 
 class ProductRelease(models.Model):
     CHANNELS = ("Nightly", "Aurora", "Beta", "Release", "ESR")
@@ -326,9 +460,16 @@ class ProductRelease(models.Model):
     created = models.DateTimeField()
     modified = models.DateTimeField()
     notes = JSONField(blank=True)
+    # the name of the file in the release notes repo this release was loaded from
+    source_file = models.CharField(max_length=255, blank=True, db_index=True)
+    rendered_notes = RenderedNotesField(blank=True, default=list)
+    render_version = RenderVersionField(default=0)
 
     objects = ProductReleaseManager()
 
+    # set when the Markdown fields already hold their HTML, see render_release_file()
+    html_rendered = False
+
     class Meta:
         ordering = ["-release_date"]
 
@@ -407,7 +548,10 @@ class ProductRelease(models.Model):
     def get_notes(self):
         if not self.notes:
             return self.notes
-        return process_notes(self.notes)
+        if self.render_version != RENDER_VERSION:
+            # saved before a change to the render pipeline, and not reloaded yet
+            return process_notes(self.notes)
+        return process_notes(self.rendered_notes, rendered=True)
 
 
 @memoize(LONG_RN_CACHE_TIMEOUT)
@@ -2,8 +2,11 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import json
 from itertools import chain
 from pathlib import Path
+from shutil import copytree
+from tempfile import TemporaryDirectory
 from unittest.mock import call, patch
 
 from django.core.cache import caches
@@ -125,6 +128,85 @@ class TestReleaseModel(TestCase):
         assert note.note.startswith("<p>Firefox Nightly")
         assert note.id == 787203
 
+    def test_notes_rendered_on_save(self):
+        """Notes are rendered when releases are loaded, so reading them doesn't render Markdown."""
+        assert not models.ProductRelease.objects.has_stale_html()
+        rel = models.get_release("firefox", "57.0a1")
+        assert rel.render_version == models.RENDER_VERSION
+        with patch.object(models, "process_markdown") as process_markdown_mock:
+            notes = rel.get_notes()
+
+        process_markdown_mock.assert_not_called()
+        assert notes[0].note.startswith("<p>Firefox Nightly")
+        assert notes[0].created.year == 2017
+
+    def test_notes_from_older_render_version(self):
+        """Releases saved by an older render pipeline are rendered on the fly until they're reloaded."""
+        models.ProductRelease.objects.filter(version="57.0a1").update(render_version=models.RENDER_VERSION - 1, rendered_notes=[])
+        assert models.ProductRelease.objects.has_stale_html()
+        rel = models.get_release("firefox", "57.0a1")
+        assert rel.get_notes()[0].note.startswith("<p>Firefox Nightly")
+
+        models.ProductRelease.objects.refresh()
+        assert not models.ProductRelease.objects.has_stale_html()
+
+    def test_refresh_files(self):
+        """Only the releases for changed files are loaded, and updated in place."""
+        with TemporaryDirectory() as rn_path, override_settings(RELEASE_NOTES_PATH=rn_path):
+            releases_path = Path(rn_path, "releases")
+            copytree(Path(RELEASES_PATH, "releases"), releases_path)
+            count = models.ProductRelease.objects.refresh()
+            assert not models.ProductRelease.objects.needs_full_refresh()
+            pk = models.ProductRelease.objects.get(version="57.0a1").pk
+
+            changed_file = releases_path.joinpath("firefox-57.0a1-nightly.json")
+            data = json.loads(changed_file.read_text())
+            data["title"] = "The Dude's Nightly"
+            changed_file.write_text(json.dumps(data))
+            releases_path.joinpath("firefox-56.0-release.json").unlink()
+
+            with patch.object(models, "process_markdown", wraps=models.process_markdown) as process_markdown_mock:
+                assert models.ProductRelease.objects.refresh_files(
+                    {"releases/firefox-57.0a1-nightly.json", "README.md"},
+                    {"releases/firefox-56.0-release.json"},
+                ) == (1, 1)
+
+            # text, system_requirements and each of the 6 notes of just the one release
+            assert process_markdown_mock.call_count == 8
+            release = models.ProductRelease.objects.get(version="57.0a1")
+            assert release.pk == pk
+            assert release.title == "The Dude's Nightly"
+            assert not models.ProductRelease.objects.filter(source_file="firefox-56.0-release.json").exists()
+            assert models.ProductRelease.objects.get_queryset(include_drafts=True).count() == count - 1
+
+    def test_render_release_files_in_parallel(self):
+        """Rendering in a process pool gives the same result as rendering serially."""
+        release_files = sorted(str(path) for path in Path(RELEASES_PATH, "releases").glob("*.json"))
+        serial = models.render_release_files(release_files, workers=1)
+        assert models.render_release_files(release_files, workers=2) == serial
+        assert serial[release_files.index(str(Path(RELEASES_PATH, "releases", "firefox-copy-56.0-release.json")))] is None
+
+    @patch.object(models, "ProcessPoolExecutor")
+    def test_render_release_files_default_does_not_fork(self, executor_mock):
+        """Neither the default nor workers=None starts a process pool."""
+        release_files = sorted(str(path) for path in Path(RELEASES_PATH, "releases").glob("*.json"))
+        serial = models.render_release_files(release_files)
+        assert models.render_release_files(release_files, workers=None) == serial
+        models.ProductRelease.objects.refresh(workers=None)
+        executor_mock.assert_not_called()
+
+    def test_refresh_does_not_render_twice(self):
+        with patch.object(models, "process_markdown", wraps=models.process_markdown) as process_markdown_mock:
+            count = models.ProductRelease.objects.refresh()
+
+        notes_count = sum(len(release.notes) for release in models.ProductRelease.objects.get_queryset(include_drafts=True))
+        assert process_markdown_mock.call_count == count * 2 + notes_count
+
+    def test_needs_full_refresh_without_source_file(self):
+        """Releases loaded before their source file was recorded can't be updated from a diff."""
+        models.ProductRelease.objects.filter(version="57.0a1").update(source_file="")
+        assert models.ProductRelease.objects.needs_full_refresh()
+
     def test_product_method_gets_specifically_latest_esr_based_on_product_details(self):
         _patched_dict = product_details.firefox_versions
         _patched_dict.update({"FIREFOX_ESR": "999.76"})
@@ -297,7 +297,7 @@ CACHES["qrcode"] = {  # noqa: F405
     "LOCATION": "qrcode",
     "TIMEOUT": None,
     "OPTIONS": {
-        "MAX_ENTRIES": 20,
+        "MAX_ENTRIES": 200,  # misses are read from QRCODE_CACHE_PATH rather than rendered
         "CULL_FREQUENCY": 4,  # 1/4 entries deleted if max reached
     },
 }
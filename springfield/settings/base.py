@@ -117,6 +117,29 @@ CACHES = {
     },
 }
 
+# Rendered QR codes are stored here, named for a hash of their data and style, so that
+# every worker can use them. This is on each pod's own disk. The ones in live CMS pages
+# and snippets can be rendered ahead of time with `./manage.py generate_qrcodes`, or by
+# each web pod's warm-up when WARMUP_QRCODES is set.
+QRCODE_CACHE_PATH = config("QRCODE_CACHE_PATH", default=data_path("qrcodes"))
+
+# Compiled Jinja templates are stored here so that new workers load them instead of
+# compiling every template again. `./manage.py compile_templates` fills it when the
+# image is built.
+JINJA_BYTECODE_CACHE_PATH = config("JINJA_BYTECODE_CACHE_PATH", default=data_path("jinja-bytecode"))
+
+# With WARMUP_ENABLED, before a web worker (wsgi/app.py) accepts requests, it loads
+# Fluent strings for PROD_LANGUAGES and the download URLs, and renders WARMUP_PATHS in
+# each of WARMUP_LOCALES, so the readiness probe only passes once those are warm. It's
+# off unless the deployment sets it, because anything importing wsgi.app (such as
+# profiling/load_test.py) would warm up too. WARMUP_QRCODES also stores the QR codes of
+# live CMS pages and snippets in this pod's QRCODE_CACHE_PATH. That reads every live
+# page, so it's off unless the deployment sets it. See springfield.base.warmup.
+WARMUP_ENABLED = config("WARMUP_ENABLED", default="false", parser=bool)
+WARMUP_PATHS = config("WARMUP_PATHS", default="/,/download/all/,/features/", parser=ListOf(str))
+WARMUP_LOCALES = config("WARMUP_LOCALES", default="en-US,de,fr,es-ES", parser=ListOf(str))
+WARMUP_QRCODES = config("WARMUP_QRCODES", default="false", parser=bool)
+
 # Logging
 LOG_LEVEL = config(
     "LOG_LEVEL",
@@ -1416,6 +1439,11 @@ def lazy_wagtail_langs():
 WAGTAIL_I18N_ENABLED = True
 WAGTAIL_CONTENT_LANGUAGES = lazy(lazy_wagtail_langs, list)()
 
+# How long the in-memory indexes of the page tree in springfield.cms.page_cache may be reused.
+# They're dropped as soon as pages are published in this process, but web pods pick up content
+# by downloading a fresh database every DB_UPDATE_MINUTES, which sends no signals.
+CMS_PAGE_CACHE_TIMEOUT = config("CMS_PAGE_CACHE_TIMEOUT", default="300", parser=int)
+
 
 # The handful of 'core' languages that most pages will be translated into.
 def lazy_wagtail_core_langs():
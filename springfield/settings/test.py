@@ -3,6 +3,8 @@
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
 import logging
+import os
+import tempfile
 
 from springfield.firefox.referral.utils import validate_invite_code_keyring
 from springfield.settings import *  # noqa
@@ -12,6 +14,12 @@ PASSWORD_HASHERS = ("django.contrib.auth.hashers.MD5PasswordHasher",)
 
 logging.root.setLevel(logging.WARNING)
 
+# keep QR codes and templates compiled by tests out of the data directory. These are
+# fixed paths, so that test runs and xdist workers share them instead of each leaving
+# a directory behind. Tests that check what's stored use their own directories.
+QRCODE_CACHE_PATH = os.path.join(tempfile.gettempdir(), "springfield-test-qrcodes")
+JINJA_BYTECODE_CACHE_PATH = os.path.join(tempfile.gettempdir(), "springfield-test-jinja-bytecode")
+
 # Fixed two-version referral invite-code keyring so the crypto tests are
 # deterministic and can exercise rotation and per-version regression fixtures.
 # Pinned here rather than sourced from the environment, because
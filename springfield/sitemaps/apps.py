@@ -0,0 +1,16 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+from django.apps import AppConfig
+
+
+class SitemapsConfig(AppConfig):
+    name = "springfield.sitemaps"
+    label = "sitemaps"
+
+    def ready(self):
+        # Update the sitemap URLs of pages as editors publish them.
+        from springfield.sitemaps import receivers
+
+        receivers.connect_receivers()
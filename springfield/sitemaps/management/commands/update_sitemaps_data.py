@@ -15,10 +15,16 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument("-q", "--quiet", action="store_true", dest="quiet", default=False, help="If no error occurs, swallow all output.")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Number of processes used to discover the translations of static pages. Keep it within the container's CPU limit. Default: 1",
+        )
 
     def handle(self, *args, **options):
         if options["quiet"]:
             self.stdout._out = StringIO()
 
-        SitemapURL.objects.refresh()
+        SitemapURL.objects.refresh(workers=options["workers"])
         self.stdout.write("Updated sitemaps data")
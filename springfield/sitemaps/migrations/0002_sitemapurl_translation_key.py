@@ -0,0 +1,21 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+# Generated by Django 5.2.16 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sitemaps", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sitemapurl",
+            name="translation_key",
+            field=models.UUIDField(blank=True, db_index=True, null=True),
+        ),
+    ]
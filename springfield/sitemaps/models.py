@@ -5,15 +5,32 @@
 from django.conf import settings
 from django.db import models, transaction
 
-from springfield.sitemaps.utils import get_all_urls
+from springfield.sitemaps.utils import get_release_notes_urls, get_static_urls, iter_wagtail_sitemap_entries
 
 NO_LOCALE = "__"  # special value for no locale
 
 
-def get_sitemap_objs():
-    objs = []
-    sitemap = get_all_urls()
+def get_wagtail_sitemap_objs(entries):
+    """Return a SitemapURL for each path and locale in ``entries``
+    (WagtailSitemapEntry), from the first page that lists it."""
+    objs = {}
+    for entry in entries:
+        for path in entry.paths:
+            objs.setdefault((path, entry.lang_code), SitemapURL(path=path, locale=entry.lang_code, translation_key=entry.translation_key))
+
+    return list(objs.values())
+
+
+def get_sitemap_objs(workers=None):
+    objs = get_wagtail_sitemap_objs(iter_wagtail_sitemap_entries())
+    # as in get_all_urls(), a Wagtail page replaces a view at the same path
+    wagtail_paths = {obj.path for obj in objs}
+    sitemap = get_static_urls(workers)
+    sitemap.update(get_release_notes_urls())
     for url, locales in sitemap.items():
+        if url in wagtail_paths:
+            continue
+
         if not locales:
             locales = [NO_LOCALE]
 
@@ -24,10 +41,26 @@ def get_sitemap_objs():
 
 
 class SitemapURLManager(models.Manager):
-    def refresh(self):
+    def refresh(self, workers=None):
+        # collect the URLs before opening the transaction: it takes a while
+        objs = get_sitemap_objs(workers)
         with transaction.atomic(using=self.db):
             self.all().delete()
-            self.bulk_create(get_sitemap_objs())
+            self.bulk_create(objs)
+
+    def update_pages(self, translation_keys):
+        """Replace the URLs of the Wagtail pages in the ``translation_keys`` groups,
+        so that a publish doesn't have to wait for the next refresh().
+
+        A path and locale that another page or a view already has is left to it.
+        Other leftovers, such as a view's locales for a path that a page has just
+        taken, are put right by the next refresh()."""
+        translation_keys = set(translation_keys)
+        objs = get_wagtail_sitemap_objs(iter_wagtail_sitemap_entries(translation_keys=translation_keys))
+        with transaction.atomic(using=self.db):
+            self.filter(translation_key__in=translation_keys).delete()
+            taken = set(self.filter(path__in={obj.path for obj in objs}).values_list("path", "locale"))
+            self.bulk_create([obj for obj in objs if (obj.path, obj.locale) not in taken])
 
     def all_for_locale(self, locale):
         return self.filter(locale=locale).order_by("path")
@@ -39,6 +72,8 @@ class SitemapURLManager(models.Manager):
 class SitemapURL(models.Model):
     path = models.CharField(max_length=200)
     locale = models.CharField(max_length=5)
+    # The translation_key of the Wagtail page that lists the URL, if it is one
+    translation_key = models.UUIDField(null=True, blank=True, db_index=True)
 
     objects = SitemapURLManager()
 
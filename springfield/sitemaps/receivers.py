@@ -0,0 +1,61 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+"""Keep the SitemapURL rows of Wagtail pages up to date between the full
+refreshes of `./manage.py update_sitemaps_data`.
+
+When a page is published, unpublished or deleted, the rows of its translation
+group are rebuilt from the pages that are live once the change is committed.
+When its URL changes, because it was moved or its slug changed, so are the rows
+of the groups of the pages below it, whose URLs include it.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete
+
+from wagtail.models import Page, get_page_models
+from wagtail.signals import page_published, page_slug_changed, page_unpublished, post_page_move
+
+from springfield.sitemaps.models import SitemapURL
+
+
+def affected_translation_keys(page):
+    """Return the translation_key of ``page`` and of every page below it."""
+    translation_keys = set(Page.objects.descendant_of(page).values_list("translation_key", flat=True))
+    translation_keys.add(page.translation_key)
+    return translation_keys
+
+
+def _update_pages_on_commit(translation_keys):
+    # robust, because a failure here only means waiting for the next full refresh
+    transaction.on_commit(lambda: SitemapURL.objects.update_pages(translation_keys), robust=True)
+
+
+def update_sitemap_urls_on_page_change(sender, instance, **kwargs):
+    _update_pages_on_commit({instance.translation_key})
+
+
+def update_sitemap_urls_on_url_change(sender, instance, **kwargs):
+    _update_pages_on_commit(affected_translation_keys(instance))
+
+
+def update_sitemap_urls_on_page_move(sender, instance, url_path_before, url_path_after, **kwargs):
+    if url_path_before == url_path_after:
+        # only reordered among its siblings
+        update_sitemap_urls_on_page_change(sender, instance)
+    else:
+        update_sitemap_urls_on_url_change(sender, instance)
+
+
+def connect_receivers():
+    """Connect the receivers that update the sitemap when pages change.
+    Called by SitemapsConfig.ready()."""
+    for model in get_page_models():
+        # each page deleted along with a parent sends its own post_delete
+        post_delete.connect(update_sitemap_urls_on_page_change, sender=model)
+
+    for signal in (page_published, page_unpublished):
+        signal.connect(update_sitemap_urls_on_page_change)
+    page_slug_changed.connect(update_sitemap_urls_on_url_change)
+    post_page_move.connect(update_sitemap_urls_on_page_move)
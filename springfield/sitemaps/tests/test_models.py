@@ -2,7 +2,14 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from wagtail.models import Site
+
 from springfield.base.tests import TestCase
+from springfield.cms.tests.factories import SimpleRichTextPageFactory
 from springfield.sitemaps.models import NO_LOCALE, SitemapURL
 
 
@@ -30,3 +37,108 @@ class TestSitemapsModel(TestCase):
         SitemapURL.objects.create(path="/firefox/", locale="en-US")
         SitemapURL.objects.create(path="/locales/", locale=NO_LOCALE)
         assert list(SitemapURL.objects.all_locales()) == [NO_LOCALE, "de", "en-US", "fr"]
+
+
+@pytest.fixture
+def sitemap_page():
+    root_page = Site.objects.get(is_default_site=True).root_page
+    return SimpleRichTextPageFactory(slug="test-page", parent=root_page)
+
+
+def _rows():
+    return set(SitemapURL.objects.values_list("path", "locale", "translation_key"))
+
+
+@pytest.mark.django_db
+@patch("springfield.sitemaps.models.get_release_notes_urls", return_value={"/notes/": ["en-US"]})
+@patch("springfield.sitemaps.models.get_static_urls", return_value={"/firefox/": ["de"], "/test-page/": ["de"], "/locales/": []})
+def test_refresh(get_static_urls, get_release_notes_urls, sitemap_page):
+    SitemapURL.objects.refresh()
+
+    # a page replaces a view at the same path
+    assert _rows() == {
+        ("/firefox/", "de", None),
+        ("/locales/", NO_LOCALE, None),
+        ("/notes/", "en-US", None),
+        ("/test-page/", "en-US", sitemap_page.translation_key),
+    }
+
+
+@pytest.mark.django_db
+def test_update_pages(sitemap_page):
+    other_key = uuid4()
+    SitemapURL.objects.create(path="/old-slug/", locale="en-US", translation_key=sitemap_page.translation_key)
+    SitemapURL.objects.create(path="/other/", locale="en-US", translation_key=other_key)
+    SitemapURL.objects.create(path="/firefox/", locale="en-US")
+
+    SitemapURL.objects.update_pages([sitemap_page.translation_key])
+
+    assert _rows() == {
+        ("/test-page/", "en-US", sitemap_page.translation_key),
+        ("/other/", "en-US", other_key),
+        ("/firefox/", "en-US", None),
+    }
+
+
+@pytest.mark.django_db
+def test_update_pages_leaves_taken_paths(sitemap_page):
+    SitemapURL.objects.create(path="/test-page/", locale="en-US")
+
+    SitemapURL.objects.update_pages([sitemap_page.translation_key])
+
+    assert _rows() == {("/test-page/", "en-US", None)}
+
+
+@pytest.mark.django_db
+def test_publishing_updates_the_page(sitemap_page, django_capture_on_commit_callbacks):
+    SitemapURL.objects.update_pages([sitemap_page.translation_key])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        sitemap_page.unpublish()
+    assert _rows() == set()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        sitemap_page.save_revision().publish()
+    assert _rows() == {("/test-page/", "en-US", sitemap_page.translation_key)}
+
+
+@pytest.mark.django_db
+def test_publishing_updates_the_pages_below(sitemap_page, django_capture_on_commit_callbacks):
+    child = SimpleRichTextPageFactory(slug="child", parent=sitemap_page)
+    SitemapURL.objects.update_pages([sitemap_page.translation_key, child.translation_key])
+
+    sitemap_page.slug = "new-slug"
+    with django_capture_on_commit_callbacks(execute=True):
+        sitemap_page.save_revision().publish()
+
+    assert _rows() == {
+        ("/new-slug/", "en-US", sitemap_page.translation_key),
+        ("/new-slug/child/", "en-US", child.translation_key),
+    }
+
+
+@pytest.mark.django_db
+def test_publishing_without_a_url_change_updates_only_the_page(sitemap_page, django_capture_on_commit_callbacks):
+    SimpleRichTextPageFactory(slug="child", parent=sitemap_page)
+
+    with patch.object(SitemapURL.objects, "update_pages") as update_pages_mock:
+        with django_capture_on_commit_callbacks(execute=True):
+            sitemap_page.save_revision().publish()
+
+    update_pages_mock.assert_called_once_with({sitemap_page.translation_key})
+
+
+@pytest.mark.django_db
+def test_moving_updates_the_pages_below(sitemap_page, django_capture_on_commit_callbacks):
+    child = SimpleRichTextPageFactory(slug="child", parent=sitemap_page)
+    new_parent = SimpleRichTextPageFactory(slug="new-parent", parent=sitemap_page.get_parent())
+    SitemapURL.objects.update_pages([sitemap_page.translation_key, child.translation_key, new_parent.translation_key])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        sitemap_page.move(new_parent, pos="last-child")
+
+    assert _rows() == {
+        ("/new-parent/", "en-US", new_parent.translation_key),
+        ("/new-parent/test-page/", "en-US", sitemap_page.translation_key),
+        ("/new-parent/test-page/child/", "en-US", child.translation_key),
+    }
@@ -2,20 +2,32 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 
+import json
+import os
 from unittest.mock import patch
 
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
 from django.test import override_settings
 
 import pytest
 from wagtail.models import Locale, Page, PageViewRestriction, Site
 
+from lib import l10n_utils
 from springfield.cms.models import BlogArticlePage, BlogIndexPage, BlogTopic, BlogTopicPage
 from springfield.cms.models.pages import HeroStyle
 from springfield.cms.tests.factories import LocaleFactory, SimpleRichTextPageFactory, StructuralPageFactory
 from springfield.sitemaps.utils import (
+    WagtailSitemapEntry,
     _path_for_cms_url,
+    discover_all_translations,
+    discover_translations,
+    get_static_urls,
     get_wagtail_urls,
+    iter_wagtail_sitemap_entries,
     update_sitemaps,
+    wagtail_urls_from_entries,
 )
 
 pytestmark = pytest.mark.django_db
@@ -313,25 +325,101 @@ def test_get_wagtail_urls__alias_locale_pages_excluded(dummy_wagtail_pages):
 
 @patch("springfield.sitemaps.utils.get_static_urls")
 @patch("springfield.sitemaps.utils.get_release_notes_urls")
-@patch("springfield.sitemaps.utils.get_wagtail_urls")
-@patch("springfield.sitemaps.utils.output_json")
+@patch("springfield.sitemaps.utils.iter_wagtail_sitemap_entries")
 def test_update_sitemaps(
-    mock_output_json,
-    mock_get_wagtail_urls,
+    mock_iter_wagtail_sitemap_entries,
     mock_get_release_notes_urls,
     mock_get_static_urls,
+    tmp_path,
 ):
     "Light check to ensure we've not added _new_ things we haven't added tests for"
 
-    mock_get_wagtail_urls.return_value = {"wagtail": "dummy1"}
-    mock_get_release_notes_urls.return_value = {"release_notes": "dummy2"}
-    mock_get_static_urls.return_value = {"static_urls": "dummy3"}
+    mock_iter_wagtail_sitemap_entries.return_value = [WagtailSitemapEntry("fr", ["/wagtail/"])]
+    mock_get_release_notes_urls.return_value = {"/release_notes/": ["en-US"]}
+    mock_get_static_urls.return_value = {"/static_urls/": ["de", "en-US"]}
+
+    tmp_path.joinpath("root_files").mkdir()
+    with override_settings(ROOT_PATH=tmp_path):
+        update_sitemaps()
 
-    update_sitemaps()
     expected = {
-        "wagtail": "dummy1",
-        "release_notes": "dummy2",
-        "static_urls": "dummy3",
+        "/wagtail/": ["fr"],
+        "/release_notes/": ["en-US"],
+        "/static_urls/": ["de", "en-US"],
     }
+    assert json.loads(tmp_path.joinpath("root_files", "sitemap.json").read_text()) == expected
+
+
+def test_get_wagtail_urls__batched(dummy_wagtail_pages, django_assert_max_num_queries):
+    """Pages are read in batches with only the sitemap's fields, so the number of queries
+    depends on the batch size rather than the number of pages."""
+    expected = get_wagtail_urls()
+
+    # one query for the view restrictions, then 10 pages in batches of 3 is 4 batches
+    # and an empty one to finish
+    with django_assert_max_num_queries(6):
+        entries = list(iter_wagtail_sitemap_entries(batch_size=3))
+
+    assert wagtail_urls_from_entries(entries) == expected
+
+
+@patch.object(l10n_utils, "fluent_l10n")
+@patch.object(l10n_utils, "django_render")
+def test_discover_translations(django_render_mock, fluent_l10n_mock):
+    fluent_l10n_mock.return_value.active_locales = ["de", "en-US", "fr"]
+
+    assert sorted(discover_translations("/channel/desktop/")) == ["de", "en-US", "fr"]
+
+    # a view that doesn't render anything isn't offered in any locale
+    assert discover_translations("/download/") is None
+    # nor is a URL that doesn't exist
+    assert discover_translations("/no/such/page/") is None
+    # and the templates were never rendered
+    django_render_mock.assert_not_called()
+
+
+@patch("springfield.sitemaps.utils.discover_translations")
+def test_discover_all_translations_serial(discover_mock):
+    discover_mock.side_effect = lambda path: [path]
+    assert discover_all_translations(["/a/", "/b/"], workers=1) == [["/a/"], ["/b/"]]
 
-    mock_output_json.assert_called_once_with(expected)
+
+def _discover_in_process(path):
+    # module level, so that the pool can pickle it
+    return [path, os.getpid()]
+
+
+@patch("springfield.sitemaps.utils.discover_translations", _discover_in_process)
+@patch.object(connections, "close_all")
+def test_discover_all_translations_pool(close_all_mock):
+    results = discover_all_translations(["/a/", "/b/", "/c/", "/d/"], workers=2)
+
+    assert [path for path, _pid in results] == ["/a/", "/b/", "/c/", "/d/"]
+    assert os.getpid() not in {pid for _path, pid in results}
+    # forked workers mustn't share the parent's database connections
+    close_all_mock.assert_called_once_with()
+
+
+def test_get_static_urls_matches_client_crawl(client):
+    """get_static_urls() lists what the old crawl did, which requested each page
+    with the test client and read the translations passed to django_render, except
+    for the pages that respond with a 404."""
+    statuses = {}
+
+    def crawl(paths, workers):
+        results = []
+        for path in paths:
+            with patch("lib.l10n_utils.django_render", return_value=HttpResponse()) as render:
+                statuses[path] = client.get(f"/{settings.LANGUAGE_CODE}{path}").status_code
+            results.append(list(render.call_args[0][2]["translations"]) if render.called else None)
+        return results
+
+    with patch("springfield.sitemaps.utils.discover_all_translations", crawl):
+        crawled = get_static_urls()
+    discovered = get_static_urls(workers=1)
+
+    assert not discovered.keys() - crawled.keys()
+    assert all(statuses[path] == 404 for path in crawled.keys() - discovered.keys())
+    assert {path: sorted(locales) for path, locales in discovered.items()} == {
+        path: sorted(locales) for path, locales in crawled.items() if path in discovered
+    }
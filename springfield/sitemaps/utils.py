@@ -2,20 +2,30 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at https://mozilla.org/MPL/2.0/.
 import json
+import multiprocessing
 import re
-from collections import defaultdict
-from unittest.mock import patch
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 from urllib.parse import urlparse
 
 from django.conf import settings
-from django.http import HttpResponse
-from django.test.client import Client
-from django.urls import resolvers
+from django.core.exceptions import BadRequest, PermissionDenied, SuspiciousOperation
+from django.db import connections
+from django.http import Http404
+from django.test.client import RequestFactory
+from django.urls import resolve, resolvers
+from django.utils import translation
 
 from wagtail.models import Page
 
+from lib import l10n_utils
 from springfield.releasenotes.models import ProductRelease
 
+WAGTAIL_SITEMAP_BATCH_SIZE = 500
+
+# What one Wagtail page contributes to the sitemap
+WagtailSitemapEntry = namedtuple("WagtailSitemapEntry", ["lang_code", "paths", "translation_key"], defaults=[None])
+
 
 def get_release_notes_urls():
     urls = {}
@@ -43,9 +53,50 @@ def get_release_notes_urls():
     return urls
 
 
-def get_static_urls():
+def discover_translations(path):
+    """Return the translations that l10n_utils.render() offers for the view at
+    ``path`` (a path without a locale prefix), or None if that view doesn't
+    render a template with it.
+
+    This calls the view directly, without a full request cycle. render() only
+    records the translations on the request and does not render anything, so
+    this costs a small fraction of fetching the page.
+    """
+    full_path = f"/{settings.LANGUAGE_CODE}{path}"
+    request = RequestFactory().get(full_path)
+    # what SpringfieldLocaleMiddleware would have done for us
+    request.locale = settings.LANGUAGE_CODE
+    setattr(request, l10n_utils.DISCOVER_TRANSLATIONS_ATTR, True)
+
+    with translation.override(settings.LANGUAGE_CODE):
+        try:
+            request.resolver_match = match = resolve(full_path)
+            match.func(request, *match.args, **match.kwargs)
+        except (Http404, resolvers.Resolver404, PermissionDenied, SuspiciousOperation, BadRequest):
+            # the request handler would have turned these into error responses
+            return None
+
+    return getattr(request, "discovered_translations", None)
+
+
+def discover_all_translations(paths, workers=None):
+    """Return discover_translations() for each of ``paths``, shared between
+    ``workers`` forked processes (default: 1, which doesn't fork).
+
+    The default isn't os.cpu_count(): in a container that's the node's CPUs, not
+    the container's limit."""
+    workers = workers or 1
+    if workers == 1 or len(paths) < 2:
+        return [discover_translations(path) for path in paths]
+
+    # Forked workers must open their own database connections.
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+        return list(executor.map(discover_translations, paths, chunksize=max(1, len(paths) // (workers * 4))))
+
+
+def get_static_urls(workers=None):
     urls = {}
-    client = Client()
     excludes = [
         re.compile(r)
         for r in settings.NOINDEX_URLS
@@ -65,6 +116,7 @@ def get_static_urls():
     # NOTE: have to use `lists()` here since the standard
     # `items()` only returns the first item in the list for the
     # view since `reverse_dict` is a `MultiValueDict`.
+    locale_paths = []
     for key, values in resolvers.get_resolver(None).reverse_dict.lists():
         for value in values:
             path = value[0][0][0]
@@ -85,24 +137,21 @@ def get_static_urls():
             path_prefix = path.split("/", 2)[0]
             nonlocale = path_prefix in settings.SUPPORTED_NONLOCALES
             path = f"/{path}"
+            if path in urls or path in locale_paths:
+                continue
+
             if nonlocale:
-                locales = []
+                urls[path] = []
             else:
-                with patch("lib.l10n_utils.django_render") as render:
-                    render.return_value = HttpResponse()
-                    client.get("/" + settings.LANGUAGE_CODE + path)
+                locale_paths.append(path)
 
-                # Exclude urls that did not call render
-                if not render.called:
-                    continue
-
-                locales = set(render.call_args[0][2]["translations"].keys())
-
-                # just remove any locales not in our prod list
-                locales = list(locales.intersection(settings.PROD_LANGUAGES))
+    for path, translations in zip(locale_paths, discover_all_translations(locale_paths, workers)):
+        # Exclude urls that did not call render
+        if translations is None:
+            continue
 
-            if path not in urls:
-                urls[path] = locales
+        # just remove any locales not in our prod list
+        urls[path] = list(set(translations).intersection(settings.PROD_LANGUAGES))
 
     return urls
 
@@ -118,52 +167,112 @@ def _path_for_cms_url(page_url, lang_code):
     return _path
 
 
-def get_wagtail_urls():
-    urls = defaultdict(list)
+def _sitemap_needs_specific(page_class):
+    # Only page types that change what Page reports for the sitemap need loading as
+    # their specific class, which is a query per content type.
+    return page_class.get_sitemap_urls is not Page.get_sitemap_urls or page_class.get_url_parts is not Page.get_url_parts
+
+
+def iter_wagtail_sitemap_entries(batch_size=WAGTAIL_SITEMAP_BATCH_SIZE, translation_keys=None):
+    """Yield a WagtailSitemapEntry for each live, public page that belongs in the
+    sitemap, in tree order. Only pages in the ``translation_keys`` groups, if given.
+
+    Pages are read ``batch_size`` at a time with only the fields the sitemap needs.
+    """
+    pages = Page.objects.all() if translation_keys is None else Page.objects.filter(translation_key__in=translation_keys)
+    pages = (
+        pages.live()
+        .public()
+        .annotate_site_root_state()
+        .select_related("locale")
+        .only(
+            "path",
+            "depth",
+            "url_path",
+            "content_type",
+            "translation_key",
+            "last_published_at",
+            "latest_revision_created_at",
+            "locale__language_code",
+        )
+        .order_by("path")
+    )
+
+    last_path = ""
+    while True:
+        batch = list(pages.filter(path__gt=last_path)[:batch_size])
+        if not batch:
+            return
+        last_path = batch[-1].path
+
+        sitemap_pages = []
+        specific_ids = []
+        for cms_page in batch:
+            page_class = cms_page.specific_class or Page
+            # We don't want the Wagtail core Root page, nor the site root page,
+            # because that isn't surfaced from the CMS (yet) and we don't want our
+            # StructuralPage type either, which has a handy annotation to identify it.
+            if (
+                cms_page.is_root()
+                or cms_page.is_site_root()
+                # not all pages have the is_structural_page attribute, so default those to False
+                or getattr(page_class, "is_structural_page", False) is True
+            ):
+                # Don't include these pages in the sitemap
+                continue
 
-    # Get all live, non-private Wagtail pages
-    for cms_page in Page.objects.live().public().specific().order_by("path"):
-        # We don't want the Wagtail core Root page, nor the site root page,
-        # because that isn't surfaced from the CMS (yet) and we don't want our
-        # StructuralPage type either, which has a handy annotation to identify
-        # it (If you don't know what 'specific' refers to, see
-        # https://docs.wagtail.org/en/v6.2.1/reference/pages/model_reference.html#wagtail.models.Page.specific)
-        if (
-            cms_page.is_root()
-            or cms_page.is_site_root()
-            # not all pages have the is_structural_page attribute, so default those to False
-            or getattr(cms_page, "is_structural_page", False) is True
-        ):
-            # Don't include these pages in the sitemap
-            continue
+            sitemap_pages.append(cms_page)
+            if _sitemap_needs_specific(page_class):
+                specific_ids.append(cms_page.id)
+
+        specific_pages = {}
+        if specific_ids:
+            specific_pages = {cms_page.id: cms_page for cms_page in Page.objects.filter(id__in=specific_ids).select_related("locale").specific()}
+
+        for cms_page in sitemap_pages:
+            cms_page = specific_pages.get(cms_page.id, cms_page)
+            lang_code = cms_page.locale.language_code
+            paths = []
+            # get_sitemap_urls() is Wagtail's hook for what a page contributes to a sitemap, so
+            # a routable page can add the URLs it serves that have no Page of their own. Its
+            # locations are absolute URLs, hence the urlparse() to get back to a path.
+            for sitemap_url in cms_page.get_sitemap_urls():
+                if not sitemap_url["location"]:
+                    continue
 
-        lang_code = cms_page.locale.language_code
+                _path = _path_for_cms_url(page_url=urlparse(sitemap_url["location"]).path, lang_code=lang_code)
+                # A route can lead to a page that reports that same route as its own URL, so one
+                # path can be offered twice for a locale.
+                if _path not in paths:
+                    paths.append(_path)
 
-        # get_sitemap_urls() is Wagtail's hook for what a page contributes to a sitemap, so
-        # a routable page can add the URLs it serves that have no Page of their own. Its
-        # locations are absolute URLs, hence the urlparse() to get back to a path.
-        for sitemap_url in cms_page.get_sitemap_urls():
-            if not sitemap_url["location"]:
-                continue
+            yield WagtailSitemapEntry(lang_code, paths, cms_page.translation_key)
 
-            _path = _path_for_cms_url(page_url=urlparse(sitemap_url["location"]).path, lang_code=lang_code)
-            # A route can lead to a page that reports that same route as its own URL, so one
-            # path can be offered twice for a locale.
-            if lang_code not in urls[_path]:
-                urls[_path].append(lang_code)
+
+def wagtail_urls_from_entries(entries):
+    """Return the path -> locales dict for ``entries`` (WagtailSitemapEntry)."""
+    urls = defaultdict(list)
+    for entry in entries:
+        for _path in entry.paths:
+            if entry.lang_code not in urls[_path]:
+                urls[_path].append(entry.lang_code)
 
     return urls
 
 
-def get_all_urls():
-    urls = get_static_urls()
+def get_wagtail_urls():
+    return wagtail_urls_from_entries(iter_wagtail_sitemap_entries())
+
+
+def get_all_urls(workers=None):
+    urls = get_static_urls(workers)
     urls.update(get_release_notes_urls())
     urls.update(get_wagtail_urls())
     return urls
 
 
-def update_sitemaps():
-    urls = get_all_urls()
+def update_sitemaps(workers=None):
+    urls = get_all_urls(workers)
     # Output static files
     output_json(urls)
 
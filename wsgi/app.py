@@ -8,6 +8,13 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "springfield.settings")
 django_application = get_wsgi_application()
 
+from django.conf import settings  # noqa: E402
+
+if settings.WARMUP_ENABLED:
+    from springfield.base.warmup import warm_up
+
+    warm_up(django_application)
+
 
 # Always generate https URLs.
 def https_application(environ, start_response):